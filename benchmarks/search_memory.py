@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare memory and CPU cost of search results as jira Resources versus IssueRecords.
+
+Both paths start from the same synthetic search response, so only the object
+mapping is measured. Peak memory is traced with tracemalloc.
+
+Usage: python benchmarks/search_memory.py [--rows N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from jira import JIRA
+from jira.resources import Issue
+from common.records import IssueRecord
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+
+def make_user(i):
+    return {
+        'self': f'https://jira.example.com/rest/api/2/user?accountId={i}',
+        'accountId': f'5b10ac8d82e05b22cc7d{i:04d}',
+        'displayName': f'User {i}',
+        'emailAddress': f'user{i}@example.com',
+        'active': True,
+        'timeZone': 'Europe/London',
+        'avatarUrls': {size: f'https://avatar.example.com/{i}/{size}' for size in ('16x16', '24x24', '32x32', '48x48')}
+    }
+
+def make_raw_issue(i):
+    status = STATUSES[i % len(STATUSES)]
+    return {
+        'id': str(10000 + i),
+        'key': f'PROJ-{i}',
+        'self': f'https://jira.example.com/rest/api/2/issue/{10000 + i}',
+        'fields': {
+            'summary': f'Synthetic issue number {i} used for the search memory benchmark',
+            'status': {
+                'name': status,
+                'id': str(STATUSES.index(status) + 1),
+                'description': '',
+                'statusCategory': {'id': 2, 'key': 'new', 'name': 'To Do', 'colorName': 'blue-gray'}
+            },
+            'assignee': make_user(i % 25),
+            'priority': {'name': 'Medium', 'id': '3', 'iconUrl': 'https://jira.example.com/images/medium.svg'},
+            'issuetype': {'name': 'Task', 'id': '10001', 'subtask': False, 'iconUrl': 'https://jira.example.com/task.svg'},
+            'created': '2024-01-01T10:00:00.000+0000',
+            'updated': '2024-01-02T10:00:00.000+0000'
+        }
+    }
+
+def to_resources(raw_issues):
+    return [Issue(JIRA.DEFAULT_OPTIONS, None, raw=raw) for raw in raw_issues]
+
+def to_records(raw_issues):
+    return [IssueRecord.from_raw(raw) for raw in raw_issues]
+
+def measure(mapper, raw_issues):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = mapper(raw_issues)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return elapsed * 1000, peak / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search result memory use")
+    parser.add_argument('--rows', type=int, default=5000, help="Number of synthetic issues")
+    args = parser.parse_args()
+
+    raw_issues = [make_raw_issue(i) for i in range(args.rows)]
+    print(f"Mapping {args.rows} search results\n")
+
+    results = {}
+    for label, mapper in (("jira.resources.Issue", to_resources), ("IssueRecord", to_records)):
+        elapsed, peak = measure(mapper, raw_issues)
+        results[label] = (elapsed, peak)
+        print(f"{label:22} {elapsed:9.1f} ms   peak {peak:8.2f} MiB")
+
+    resource_time, resource_peak = results["jira.resources.Issue"]
+    record_time, record_peak = results["IssueRecord"]
+    print(f"\nCPU: {resource_time / record_time:.1f}x faster, "
+          f"peak memory: {resource_peak / record_peak:.1f}x smaller")
+
+if __name__ == "__main__":
+    main()
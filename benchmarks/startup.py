@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Measure time-to-first-prompt for the interactive shell.
+
+Each run starts a fresh interpreter, builds the InteractiveShell and exits,
+so import costs are paid every time just like a real launch.
+
+Usage: python benchmarks/startup.py [--runs N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SCENARIOS = [
+    ("before (import every module)", "import main; main.InteractiveShell(eager=True)"),
+    ("after (lazy command registry)", "import main; main.InteractiveShell()"),
+]
+
+def time_scenario(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=REPO_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "benchmark run failed")
+        timings.append(elapsed * 1000)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark jira-cli shell startup")
+    parser.add_argument('--runs', type=int, default=5, help="Number of launches per scenario")
+    args = parser.parse_args()
+
+    results = []
+    for label, code in SCENARIOS:
+        timings = time_scenario(code, args.runs)
+        results.append((label, statistics.median(timings), min(timings)))
+        print(f"{label:35} median {results[-1][1]:8.1f} ms   min {results[-1][2]:8.1f} ms")
+
+    before, after = results[0][1], results[-1][1]
+    if after:
+        print(f"{'speedup':35} {before / after:8.2f}x")
+
+if __name__ == "__main__":
+    main()
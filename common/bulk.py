@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from rich.progress import Progress, BarColumn, MofNCompleteColumn, TextColumn, TimeElapsedColumn
+from rich.table import Table
+from jira.exceptions import JIRAError
+from common.jira_client import get_jira_client
+from common.search import search_all, search_page
+
+# Rate limiting (429/503 with Retry-After) and dropped connections are retried by the client's
+# ResilientSession (JIRA_MAX_RETRIES); bulk operations add no retry loop of their own
+BULK_WORKERS = int(os.getenv('BULK_WORKERS', '8'))
+
+# Keys per "key in (...)" search when resolving explicit keys
+KEY_BATCH_SIZE = 100
+
+def split_jql_arg(args):
+    """Split a trailing '--jql <query>' off the arguments; returns (other_args, jql_query or None)."""
+    if '--jql' not in args:
+        return list(args), None
+    index = args.index('--jql')
+    return list(args[:index]), ' '.join(args[index + 1:]) or None
+
+def split_target_args(args):
+    """Split '--jql <query>' (the rest of the line) and '--last' off; returns (other_args, jql_query, use_last)."""
+    args, jql_query = split_jql_arg(args)
+    use_last = '--last' in args
+    return [arg for arg in args if arg != '--last'], jql_query, use_last
+
+def fetch_targets(issue_keys=None, jql_query=None, fields='summary', jira=None):
+    """Resolve explicit keys or a JQL query to IssueRecords in as few searches as possible."""
+    jira = jira or get_jira_client()
+    if jql_query:
+        return search_all(jql_query, fields=fields, jira=jira, records=True)
+    records = []
+    issue_keys = list(dict.fromkeys(issue_keys or []))
+    for i in range(0, len(issue_keys), KEY_BATCH_SIZE):
+        chunk = issue_keys[i:i + KEY_BATCH_SIZE]
+        # Unvalidated, so unknown keys are simply missing from the result instead of failing the search
+        records.extend(search_page(jira, f'key in ({", ".join(chunk)})', 0, len(chunk), fields,
+                                   records=True, validate=False))
+    return records
+
+def run_bulk(items, operation, description, console=None, workers=None):
+    """Apply operation(item) to every item on a bounded pool with a live progress bar.
+
+    Returns [(item, result, error)] in the order the items were given.
+    """
+    outcomes = {}
+    columns = [TextColumn("{task.description}"), BarColumn(), MofNCompleteColumn(), TimeElapsedColumn()]
+    with Progress(*columns, console=console) as progress:
+        task = progress.add_task(description, total=len(items))
+        with ThreadPoolExecutor(max_workers=workers or BULK_WORKERS) as executor:
+            futures = {executor.submit(operation, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    outcomes[item] = (future.result(), None)
+                except Exception as e:
+                    outcomes[item] = (None, e)
+                progress.advance(task)
+    return [(item, *outcomes[item]) for item in items]
+
+def error_message(error):
+    if isinstance(error, JIRAError):
+        return f"{error.status_code}: {error.text}" if error.text else str(error.status_code)
+    return str(error)
+
+def print_bulk_summary(console, title, outcomes, success_text="OK"):
+    """Print one row per item with its result, then the totals."""
+    table = Table(title=title)
+    table.add_column("Key", style="cyan")
+    table.add_column("Result")
+    for item, result, error in outcomes:
+        if error is None:
+            # An operation may describe its own outcome, e.g. an item that needed no change
+            text = result if isinstance(result, str) else success_text
+            table.add_row(str(item), f"[green]{text}[/green]")
+        else:
+            table.add_row(str(item), f"[red]{error_message(error)}[/red]")
+    console.print(table)
+
+    failed = sum(1 for _, _, error in outcomes if error is not None)
+    succeeded = len(outcomes) - failed
+    if failed:
+        console.print(f"[bold yellow]{succeeded} succeeded, {failed} failed.[/bold yellow]")
+    else:
+        console.print(f"[bold green]All {succeeded} succeeded.[/bold green]")
+
+__all__ = ['split_jql_arg', 'split_target_args', 'fetch_targets', 'run_bulk', 'print_bulk_summary', 'error_message', 'BULK_WORKERS']
@@ -1,50 +1,93 @@
 import os
-import json
 from datetime import datetime, timedelta
+from rapidfuzz import process, fuzz
+from jira.exceptions import JIRAError
 from common.jira_client import get_jira_client
+from common.storage import open_backend
+from common.metadata_cache import MetadataCache
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
 CACHE_FILE = os.path.join(CACHE_DIR, 'user_cache.json')
 
+USER_CACHE_TTL = 7 * 24 * 3600
+# Minimum rapidfuzz score for a name to count as the user that was meant
+USER_MATCH_CUTOFF = 80
+USER_SEARCH_LIMIT = 20
+
+def _user_index(user_dict):
+    # Users have no project; index them by when they were cached
+    return None, user_dict.get('cached_time')
+
 class UserCache:
     def __init__(self):
-        self.cache = self._load_cache()
-        self.jira = get_jira_client()
-
-    def _load_cache(self):
-        if not os.path.exists(CACHE_DIR):
-            os.makedirs(CACHE_DIR)
-        if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r') as f:
-                return json.load(f)
-        return {}
+        self.store = open_backend('users', CACHE_FILE, _user_index)
+        self.me = MetadataCache('myself', lambda: self.to_user_dict(self.jira.myself()), USER_CACHE_TTL)
 
-    def _save_cache(self):
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(self.cache, f)
+    @property
+    def jira(self):
+        return get_jira_client()
 
     def get_user(self, account_id):
-        if account_id in self.cache:
-            cached_user = self.cache[account_id]
+        cached_user = self.store.get(account_id)
+        if cached_user:
             cached_time = datetime.fromisoformat(cached_user['cached_time'])
-            if datetime.now() - cached_time < timedelta(days=7):  # Cache for 7 days
+            if datetime.now() - cached_time < timedelta(seconds=USER_CACHE_TTL):
                 return cached_user
         
         return self._update_cache(account_id)
 
     def _update_cache(self, account_id):
-        user = self.jira.user(account_id)
-        user_dict = {
-            'account_id': user.accountId,
-            'display_name': user.displayName,
-            'email_address': user.emailAddress,
-            'active': user.active,
+        user_dict = self.to_user_dict(self.jira.user(account_id))
+        self.store.put(account_id, user_dict)
+        return user_dict
+
+    def to_user_dict(self, user):
+        # Accepts a jira User resource or the plain dict returned by jira.myself()
+        get = user.get if isinstance(user, dict) else lambda name: getattr(user, name, None)
+        return {
+            'account_id': get('accountId'),
+            'name': get('name'),
+            'display_name': get('displayName'),
+            'email_address': get('emailAddress'),
+            'active': get('active') is not False,
             'cached_time': datetime.now().isoformat()
         }
-        
-        self.cache[account_id] = user_dict
-        self._save_cache()
-        return user_dict
+
+    def myself(self):
+        return self.me.get()
+
+    def find_user(self, query):
+        """Resolve a name or email to a user, trying the local directory before one Jira user search."""
+        return self.match_user(query)[0]
+
+    def match_user(self, query):
+        """Return (user or None, exact) where exact is False for a fuzzy display-name match."""
+        user, exact = self._best_match(query, self.store.values())
+        if user and exact:
+            return user, exact
+        users = [self.to_user_dict(u) for u in self._search_remote(query)]
+        self.store.put_many((u['account_id'] or u['name'], u) for u in users if u['account_id'] or u['name'])
+        remote_user, remote_exact = self._best_match(query, users)
+        if remote_user:
+            return remote_user, remote_exact
+        return user, exact
+
+    def _search_remote(self, query):
+        try:
+            return self.jira.search_users(query=query, maxResults=USER_SEARCH_LIMIT)
+        except JIRAError:
+            # Jira Server searches by the 'username' parameter instead of 'query'
+            return self.jira.search_users(user=query, maxResults=USER_SEARCH_LIMIT)
+
+    def _best_match(self, query, users):
+        candidates = [u for u in users if u.get('active', True) and u.get('display_name')]
+        lowered = query.lower()
+        for u in candidates:
+            if lowered in ((u.get('email_address') or '').lower(), u['display_name'].lower(), (u.get('name') or '').lower()):
+                return u, True
+        match = process.extractOne(query, [u['display_name'] for u in candidates],
+                                   scorer=fuzz.WRatio, score_cutoff=USER_MATCH_CUTOFF)
+        return (candidates[match[2]], False) if match else (None, False)
 
     def resolve_user_mentions(self, text, color_func):
         def replace_mention(match):
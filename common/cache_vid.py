@@ -1,32 +1,60 @@
 import os
-import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from common.jira_client import get_jira_client
+from common.storage import open_backend
+from common.field_cache import field_cache
 from jira.exceptions import JIRAError
+from requests.exceptions import ConnectionError, Timeout
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
 CACHE_FILE = os.path.join(CACHE_DIR, 'vid_cache.json')
+SYNC_STATE_FILE = os.path.join(CACHE_DIR, 'sync_state.json')
+SUMMARY_CACHE_FILE = os.path.join(CACHE_DIR, 'summary_cache.json')
+
+# Failures that leave us serving the cached copy: Jira errors, no network, or no usable client
+FETCH_ERRORS = (JIRAError, ConnectionError, Timeout, ValueError)
+
+# Keys per "key in (...)" search when resolving summaries in bulk
+SUMMARY_BATCH_SIZE = 100
+
+# Cached issues are served without a round-trip for this long after they were fetched or synced
+CACHE_MAX_STALENESS = int(os.getenv('CACHE_MAX_STALENESS', '900'))
+
+def _issue_index(issue_dict):
+    # Columns the storage backend indexes: project and last-updated time
+    return issue_dict['key'].split('-')[0], issue_dict['fields'].get('updated')
 
 class VidCache:
     def __init__(self):
-        self.cache = self._load_cache()
-        self.jira = get_jira_client()
+        self.store = open_backend('issues', CACHE_FILE, _issue_index)
+        # Per-project high-water marks written by common.sync
+        self.sync_state = open_backend('sync_state', SYNC_STATE_FILE)
+        # Summary-only entries for issues we reference but never open (e.g. epics)
+        self.summaries = open_backend('issue_summaries', SUMMARY_CACHE_FILE, _issue_index)
+        # Callbacks told which issue keys were written, e.g. the shell's completion index
+        self.listeners = []
+
+    @property
+    def jira(self):
+        return get_jira_client()
 
-    def _load_cache(self):
-        if not os.path.exists(CACHE_DIR):
-            os.makedirs(CACHE_DIR)
-        if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r') as f:
-                return json.load(f)
-        return {}
+    def add_listener(self, callback):
+        self.listeners.append(callback)
 
-    def _save_cache(self):
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(self.cache, f)
+    def _notify(self, issue_keys):
+        for callback in self.listeners:
+            try:
+                callback(issue_keys)
+            except Exception:
+                pass
+
+    def known_keys(self):
+        return self.store.keys() + self.summaries.keys()
 
     def get_issue(self, issue_key):
-        if issue_key in self.cache:
-            return self.cache[issue_key]
+        issue = self.store.get(issue_key)
+        if issue and self.is_fresh(issue):
+            return issue
         else:
             try:
                 return self._update_cache(issue_key)
@@ -36,45 +64,116 @@ class VidCache:
                 else:
                     raise
 
+    def is_fresh(self, issue_dict):
+        # An issue is as fresh as its own fetch or the last delta sync of its project
+        times = [issue_dict.get('cached_time')]
+        state = self.sync_state.get(issue_dict['key'].split('-')[0])
+        if state:
+            times.append(state.get('last_sync'))
+        times = [datetime.fromisoformat(t) for t in times if t]
+        if not times:
+            return False
+        return datetime.now() - max(times) < timedelta(seconds=CACHE_MAX_STALENESS)
+
+    def get_summaries(self, issue_keys):
+        """Return {key: summary}, reading the store first and fetching the rest in one search."""
+        summaries = {}
+        missing = []
+        for issue_key in dict.fromkeys(issue_keys):
+            issue = self.store.get(issue_key)
+            if issue and self.is_fresh(issue):
+                summaries[issue_key] = issue['fields']['summary']
+                continue
+            entry = self.summaries.get(issue_key)
+            if entry and self.is_fresh(entry):
+                summaries[issue_key] = entry['fields']['summary']
+                continue
+            missing.append(issue_key)
+
+        for i in range(0, len(missing), SUMMARY_BATCH_SIZE):
+            chunk = missing[i:i + SUMMARY_BATCH_SIZE]
+            jql_query = f'key in ({", ".join(chunk)})'
+            results = self.jira.search_issues(jql_query, fields='summary', maxResults=len(chunk), validate_query=False)
+            cached_time = datetime.now().isoformat()
+            entries = [
+                {'key': issue.key, 'cached_time': cached_time, 'fields': {'summary': issue.fields.summary}}
+                for issue in results
+            ]
+            self.summaries.put_many((entry['key'], entry) for entry in entries)
+            for entry in entries:
+                summaries[entry['key']] = entry['fields']['summary']
+
+        return summaries
+
     def _update_cache(self, issue_key, jira_issue=None):
         try:
             if not jira_issue:
                 jira_issue = self.jira.issue(issue_key)
-            
-            # Get the description (standard or custom)
-            description = self.get_description(jira_issue)
-            
-            issue_dict = {
-                'key': jira_issue.key,
-                'fields': {
-                    'summary': jira_issue.fields.summary,
-                    'issuetype': jira_issue.fields.issuetype.name,
-                    'status': jira_issue.fields.status.name,
-                    'assignee': jira_issue.fields.assignee.displayName if jira_issue.fields.assignee else 'Unassigned',
-                    'reporter': jira_issue.fields.reporter.displayName,
-                    'created': jira_issue.fields.created,
-                    'updated': jira_issue.fields.updated,
-                    'description': description
-                }
-            }
-            
-            self.cache[issue_key] = issue_dict
-            self._save_cache()
+
+            issue_dict = self.to_issue_dict(jira_issue)
+            self.store.put(issue_key, issue_dict)
+            self._notify([issue_key])
             return issue_dict
-        except JIRAError as e:
-            if issue_key in self.cache:
-                return self.cache[issue_key]
+        except FETCH_ERRORS:
+            cached_issue = self.store.get(issue_key)
+            if cached_issue:
+                # Callers can tell the user this copy could not be refreshed
+                return dict(cached_issue, stale=True)
             raise
 
-    def get_description(self, jira_issue):
+    def update_many(self, jira_issues, description_field_ids=None):
+        # Bulk upsert used by sync; one write for the whole page
+        issue_dicts = [self.to_issue_dict(jira_issue, description_field_ids) for jira_issue in jira_issues]
+        self.store.put_many((issue_dict['key'], issue_dict) for issue_dict in issue_dicts)
+        self._notify([issue_dict['key'] for issue_dict in issue_dicts])
+        return issue_dicts
+
+    def patch_many(self, changes):
+        """Apply {key: {field: value}} to cached issues after a change we made ourselves, without refetching."""
+        patched = []
+        for issue_key, fields in changes.items():
+            issue_dict = self.store.get(issue_key)
+            if issue_dict:
+                issue_dict['fields'].update(fields)
+                patched.append((issue_key, issue_dict))
+        self.store.put_many(patched)
+        self._notify([issue_key for issue_key, _ in patched])
+
+    def remove(self, issue_keys):
+        # Forget issues that were deleted in Jira
+        for issue_key in issue_keys:
+            self.store.delete(issue_key)
+            self.summaries.delete(issue_key)
+
+    def to_issue_dict(self, jira_issue, description_field_ids=None):
+        # Get the description (standard or custom)
+        description = self.get_description(jira_issue, description_field_ids)
+
+        return {
+            'key': jira_issue.key,
+            'cached_time': datetime.now().isoformat(),
+            'fields': {
+                'summary': jira_issue.fields.summary,
+                'issuetype': jira_issue.fields.issuetype.name,
+                'status': jira_issue.fields.status.name,
+                'assignee': jira_issue.fields.assignee.displayName if jira_issue.fields.assignee else 'Unassigned',
+                'reporter': jira_issue.fields.reporter.displayName if jira_issue.fields.reporter else 'Unknown',
+                'created': jira_issue.fields.created,
+                'updated': jira_issue.fields.updated,
+                'description': description
+            }
+        }
+
+    def get_description(self, jira_issue, description_field_ids=None):
         # Try to get the standard description first
         if hasattr(jira_issue.fields, 'description') and jira_issue.fields.description is not None:
             return jira_issue.fields.description
 
         # If standard description is not available, look for a custom field
-        custom_fields = [field for field in self.jira.fields() if 'description' in field['name'].lower()]
-        for field in custom_fields:
-            value = getattr(jira_issue.fields, field['id'], None)
+        if description_field_ids is None:
+            description_field_ids = field_cache.description_field_ids()
+        for field_id in description_field_ids:
+            value = getattr(jira_issue.fields, field_id, None)
             if value:
                 return value
 
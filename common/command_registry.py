@@ -0,0 +1,134 @@
+import os
+import ast
+import json
+import importlib
+
+MODULES_DIR = os.path.join(os.path.dirname(__file__), '..', 'modules')
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+MANIFEST_FILE = os.path.join(CACHE_DIR, 'command_manifest.json')
+MANIFEST_VERSION = 1
+
+def _module_files():
+    files = {}
+    for filename in os.listdir(MODULES_DIR):
+        if filename.endswith('.py') and not filename.startswith('__'):
+            files[filename[:-3]] = os.path.join(MODULES_DIR, filename)
+    return files
+
+def _read_manifest_entry(path):
+    """Extract HELP_TEXT, ALIASES and the run() arity without importing the module."""
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    entry = {
+        'mtime': os.path.getmtime(path),
+        'help_text': None,
+        'aliases': [],
+        'arity': None
+    }
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if not isinstance(target, ast.Name) or target.id not in ('HELP_TEXT', 'ALIASES'):
+                    continue
+                try:
+                    value = ast.literal_eval(node.value)
+                except ValueError:
+                    continue
+                if target.id == 'HELP_TEXT':
+                    entry['help_text'] = value
+                else:
+                    entry['aliases'] = list(value)
+        elif isinstance(node, ast.FunctionDef) and node.name == 'run':
+            entry['arity'] = len(node.args.args)
+
+    return entry
+
+def load_manifest():
+    manifest = {}
+    if os.path.exists(MANIFEST_FILE):
+        try:
+            with open(MANIFEST_FILE, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                manifest = data.get('commands', {})
+        except (ValueError, OSError):
+            manifest = {}
+
+    files = _module_files()
+    changed = set(manifest) != set(files)
+    commands = {}
+    for name, path in files.items():
+        entry = manifest.get(name)
+        if not entry or entry.get('mtime') != os.path.getmtime(path):
+            try:
+                entry = _read_manifest_entry(path)
+            except SyntaxError as e:
+                print(f"Error reading module {name}: {e}")
+                continue
+            changed = True
+        commands[name] = entry
+
+    if changed:
+        save_manifest(commands)
+    return commands
+
+def save_manifest(commands):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(MANIFEST_FILE, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'commands': commands}, f, indent=2)
+    except OSError:
+        pass  # A read-only checkout still works, it just rebuilds the manifest each launch
+
+class CommandRegistry:
+    def __init__(self):
+        self.manifest = load_manifest()
+        self.aliases = {}
+        for name, entry in self.manifest.items():
+            for alias in entry['aliases']:
+                self.aliases[alias] = name
+        self._modules = {}
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def commands(self):
+        return list(self.manifest.keys())
+
+    def resolve(self, command):
+        if command in self.aliases:
+            return self.aliases[command]
+        if command in self.manifest:
+            return command
+        return None
+
+    def arity(self, name):
+        return self.manifest[name]['arity'] or 0
+
+    def help_entries(self):
+        return sorted(
+            (name, entry['help_text'] or "No help text available")
+            for name, entry in self.manifest.items()
+        )
+
+    def get_module(self, name):
+        """Import a command module the first time it is needed."""
+        if name not in self._modules:
+            try:
+                self._modules[name] = importlib.import_module(f'modules.{name}')
+            except ImportError as e:
+                print(f"Error loading module {name}: {e}")
+                return None
+        return self._modules[name]
+
+    def load_all(self):
+        for name in self.manifest:
+            self.get_module(name)
+
+# Create a single instance of CommandRegistry to be used across the application
+command_registry = CommandRegistry()
+
+# Export the command_registry instance
+__all__ = ['command_registry', 'CommandRegistry']
@@ -0,0 +1,55 @@
+import threading
+
+_END = '\0'
+
+class PrefixTrie:
+    """Case-insensitive prefix index; lookups cost O(len(prefix)) plus the matches returned."""
+
+    def __init__(self, words=()):
+        self.root = {}
+        self.size = 0
+        self._lock = threading.Lock()
+        self.update(words)
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, word):
+        with self._lock:
+            self._insert(word)
+
+    def update(self, words):
+        with self._lock:
+            for word in words:
+                self._insert(word)
+
+    def _insert(self, word):
+        node = self.root
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        if _END not in node:
+            self.size += 1
+        node[_END] = word
+
+    def complete(self, prefix, limit=None):
+        with self._lock:
+            node = self.root
+            for char in prefix.lower():
+                node = node.get(char)
+                if node is None:
+                    return []
+
+            # Depth-first in sorted order so results come out alphabetically
+            matches = []
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                if _END in node:
+                    matches.append(node[_END])
+                    if limit and len(matches) >= limit:
+                        break
+                for char in sorted((c for c in node if c != _END), reverse=True):
+                    stack.append(node[char])
+            return matches
+
+__all__ = ['PrefixTrie']
@@ -0,0 +1,56 @@
+import os
+from common.jira_client import get_jira_client
+from common.metadata_cache import MetadataCache
+
+FIELD_CACHE_TTL = int(os.getenv('FIELD_CACHE_TTL', str(24 * 3600)))
+
+def _load_fields():
+    return [
+        {'id': field['id'], 'name': field['name'], 'custom': field.get('custom', False)}
+        for field in get_jira_client().fields()
+    ]
+
+class FieldCache:
+    def __init__(self):
+        self.cache = MetadataCache('fields', _load_fields, FIELD_CACHE_TTL)
+        self._indexed = None
+        self.by_id = {}
+        self.by_name = {}
+        self.description_ids = []
+
+    def _index(self):
+        fields = self.cache.get()
+        # Rebuild the lookups only when the cached schema object changes
+        if fields is not self._indexed:
+            self.by_id = {field['id']: field['name'] for field in fields}
+            self.by_name = {field['name'].lower(): field['id'] for field in fields}
+            self.description_ids = [field['id'] for field in fields if 'description' in field['name'].lower()]
+            self._indexed = fields
+
+    def get_fields(self):
+        self._index()
+        return self._indexed
+
+    def name_for(self, field_id):
+        self._index()
+        return self.by_id.get(field_id, field_id)
+
+    def id_for(self, name):
+        self._index()
+        if name in self.by_id:
+            return name
+        return self.by_name.get(name.lower())
+
+    def description_field_ids(self):
+        self._index()
+        return self.description_ids
+
+    def refresh(self):
+        self.cache.refresh()
+        self._index()
+
+# Create a single instance of FieldCache to be used across the application
+field_cache = FieldCache()
+
+# Export the field_cache instance
+__all__ = ['field_cache']
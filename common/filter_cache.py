@@ -0,0 +1,80 @@
+import os
+import re
+from collections import namedtuple
+from rapidfuzz import process, fuzz
+from common.jira_client import get_jira_client
+from common.metadata_cache import MetadataCache
+
+FILTER_CACHE_TTL = int(os.getenv('FILTER_CACHE_TTL', '3600'))
+# Above this many filters, fuzzy scores are computed in one batched cdist call
+FUZZY_BATCH_THRESHOLD = 200
+FUZZY_CUTOFF = 80
+
+SavedFilter = namedtuple('SavedFilter', ['id', 'name', 'jql'])
+
+def normalize_name(name):
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name.lower()).split())
+
+def _load_favourite_filters():
+    return [{'id': f.id, 'name': f.name, 'jql': f.jql} for f in get_jira_client().favourite_filters()]
+
+class FilterIndex:
+    """Normalised filter names, built once per filter list and reused for every lookup."""
+
+    def __init__(self, filters):
+        self.filters = filters
+        self.names = [normalize_name(f.name) for f in filters]
+        self.by_name = {}
+        for name, saved_filter in zip(self.names, filters):
+            self.by_name.setdefault(name, saved_filter)
+
+    def exact(self, query):
+        return self.by_name.get(normalize_name(query))
+
+    def partial(self, query):
+        query = normalize_name(query)
+        return [f for name, f in zip(self.names, self.filters) if query in name]
+
+    def fuzzy(self, query, limit=3):
+        """Return [(filter, score)] for the closest names, best first."""
+        query = normalize_name(query)
+        if not self.names:
+            return []
+        if len(self.names) >= FUZZY_BATCH_THRESHOLD:
+            try:
+                scores = process.cdist([query], self.names, scorer=fuzz.WRatio, workers=-1)[0]
+                best = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:limit]
+                return [(self.filters[i], float(scores[i])) for i in best]
+            except ImportError:
+                pass  # cdist needs numpy; score one by one instead
+        matches = process.extract(query, self.names, scorer=fuzz.WRatio, limit=limit)
+        return [(self.filters[index], score) for _, score, index in matches]
+
+class FavouriteFilters:
+    def __init__(self):
+        self.cache = MetadataCache('favourite_filters', _load_favourite_filters, FILTER_CACHE_TTL)
+        self._source = None
+        self._index = None
+
+    def get(self):
+        # Offline, MetadataCache serves the outdated list, which still lets filters run with --local
+        raw_filters = self.cache.get()
+        if raw_filters is not self._source:
+            self._source = raw_filters
+            self._index = FilterIndex([SavedFilter(**f) for f in raw_filters])
+        return self._index.filters
+
+    def index(self):
+        self.get()
+        return self._index
+
+    def invalidate(self):
+        self.cache.invalidate()
+        self._source = None
+        self._index = None
+
+# Create a single instance of FavouriteFilters to be used across the application
+favourite_filters = FavouriteFilters()
+
+# Export the favourite_filters instance
+__all__ = ['favourite_filters', 'FilterIndex', 'SavedFilter', 'FUZZY_CUTOFF']
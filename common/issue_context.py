@@ -0,0 +1,90 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from common.jira_client import get_jira_client
+from common.cache_vid import vid_cache
+
+# How long a fetched issue is reused by follow-up commands (vic, vli, va, vp, vft...)
+ISSUE_CONTEXT_MAX_AGE = int(os.getenv('ISSUE_CONTEXT_MAX_AGE', '120'))
+
+class IssueContextCache:
+    """Full issues (comments, links, attachments, subtasks, parent) fetched ahead of use."""
+
+    def __init__(self):
+        self.entries = {}
+        self.pending = {}
+        # Bumped on invalidate so a fetch that started before a change cannot store stale data
+        self.generations = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def get(self, issue_key):
+        """Return a warm issue or None; never touches the network."""
+        entry = self.entries.get(issue_key)
+        if entry and datetime.now() - entry[1] < timedelta(seconds=ISSUE_CONTEXT_MAX_AGE):
+            return entry[0]
+        return None
+
+    def fetch(self, issue_key):
+        generation = self.generations.get(issue_key, 0)
+        issue = get_jira_client().issue(issue_key)
+        with self._lock:
+            if self.generations.get(issue_key, 0) != generation:
+                return issue
+            self.entries[issue_key] = (issue, datetime.now())
+        # The same payload refreshes the summary/description cache used by vid
+        vid_cache._update_cache(issue_key, issue)
+        return issue
+
+    def get_or_fetch(self, issue_key):
+        issue = self.get(issue_key)
+        if issue is not None:
+            return issue
+        # Join a prefetch that is already in flight rather than requesting the issue twice
+        future = self.pending.get(issue_key)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass
+        return self.fetch(issue_key)
+
+    def prefetch(self, issue_key, on_loaded=None):
+        if not issue_key:
+            return None
+        issue = self.get(issue_key)
+        if issue is not None:
+            if on_loaded:
+                on_loaded(issue)
+            return None
+        started = False
+        with self._lock:
+            future = self.pending.get(issue_key)
+            if future is None:
+                future = self._executor.submit(self.fetch, issue_key)
+                self.pending[issue_key] = future
+                started = True
+        # Registered outside the lock: a future that already finished runs _finish on this thread
+        if started:
+            future.add_done_callback(lambda f: self._finish(issue_key, f))
+        if on_loaded:
+            future.add_done_callback(lambda f: f.exception() is None and on_loaded(f.result()))
+        return future
+
+    def _finish(self, issue_key, future):
+        with self._lock:
+            if self.pending.get(issue_key) is future:
+                del self.pending[issue_key]
+
+    def invalidate(self, issue_key):
+        with self._lock:
+            self.generations[issue_key] = self.generations.get(issue_key, 0) + 1
+            self.entries.pop(issue_key, None)
+            self.pending.pop(issue_key, None)
+
+# Create a single instance of IssueContextCache to be used across the application
+issue_context = IssueContextCache()
+
+# Export the issue_context instance
+__all__ = ['issue_context']
@@ -0,0 +1,111 @@
+import os
+import csv
+import json
+from common.field_cache import field_cache
+from common.project_catalog import project_catalog
+
+# Issues per request to the bulk create endpoint, which accepts at most 50
+CREATE_BATCH_SIZE = 50
+
+COLUMN_ALIASES = {'type': 'issuetype', 'issue type': 'issuetype', 'project key': 'project'}
+REQUIRED_COLUMNS = ['project', 'issuetype', 'summary']
+# System fields written by name; any other column must name a Jira field by id or display name
+SYSTEM_FIELDS = {'summary', 'description', 'labels', 'priority', 'components', 'parent'}
+
+class ImportRow:
+    __slots__ = ('number', 'values', 'fields', 'key', 'error')
+
+    def __init__(self, number, values):
+        self.number = number
+        self.values = values
+        self.fields = None
+        self.key = None
+        self.error = None
+
+def read_rows(path):
+    """Read issue rows from a .csv file (one header row) or an .ndjson file (one JSON object per line)."""
+    rows = []
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.ndjson', '.jsonl')):
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    rows.append(ImportRow(number, json.loads(line)))
+        else:
+            # Row numbers count the header, so they match the line in a spreadsheet
+            for number, values in enumerate(csv.DictReader(f), start=2):
+                rows.append(ImportRow(number, values))
+    for row in rows:
+        row.values = {_column(name): value for name, value in row.values.items()
+                      if name and value not in (None, '')}
+    return rows
+
+def _column(name):
+    name = name.strip().lower()
+    return COLUMN_ALIASES.get(name, name)
+
+def _field_value(name, value):
+    # CSV cells are plain strings; NDJSON rows may already carry Jira's structured values
+    if not isinstance(value, str):
+        return value
+    if name == 'labels':
+        return value.replace(',', ' ').split()
+    if name == 'priority':
+        return {'name': value.strip()}
+    if name == 'components':
+        return [{'name': component.strip()} for component in value.split(',') if component.strip()]
+    if name == 'parent':
+        return {'key': value.strip().upper()}
+    return value
+
+def validate_rows(rows):
+    """Build each row's create payload against the cached project and issue type metadata."""
+    project_keys = project_catalog.project_keys()
+    for row in rows:
+        missing = [column for column in REQUIRED_COLUMNS if not row.values.get(column)]
+        if missing:
+            row.error = f"Missing {', '.join(missing)}"
+            continue
+        project_key = str(row.values['project']).strip().upper()
+        if project_key not in project_keys:
+            row.error = f"Unknown project '{project_key}'"
+            continue
+        issue_type = project_catalog.resolve_issue_type(project_key, str(row.values['issuetype']).strip())
+        if issue_type is None:
+            row.error = f"Project {project_key} has no issue type '{row.values['issuetype']}'"
+            continue
+
+        fields = {'project': {'key': project_key}, 'issuetype': {'name': issue_type}}
+        for name, value in row.values.items():
+            if name in ('project', 'issuetype'):
+                continue
+            field_id = name if name in SYSTEM_FIELDS else field_cache.id_for(name)
+            if field_id is None:
+                row.error = f"Unknown field '{name}'"
+                break
+            fields[field_id] = _field_value(field_id, value)
+        else:
+            row.fields = fields
+    return rows
+
+def create_batch(jira, rows):
+    """Create one batch through the bulk endpoint, recording each row's key or error."""
+    results = jira.create_issues([row.fields for row in rows], prefetch=False)
+    for row, result in zip(rows, results):
+        if result['status'] == 'Success':
+            row.key = result['issue'].key
+        else:
+            row.error = str(result['error'])
+    return rows
+
+def default_output_path(path):
+    return f"{os.path.splitext(path)[0]}.created.csv"
+
+def write_results(path, rows):
+    """Write row number, created key and error for every input row."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['row', 'key', 'summary', 'error'])
+        for row in rows:
+            writer.writerow([row.number, row.key or '', row.values.get('summary', ''), row.error or ''])
+
+__all__ = ['read_rows', 'validate_rows', 'create_batch', 'default_output_path', 'write_results', 'CREATE_BATCH_SIZE']
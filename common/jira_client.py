@@ -1,6 +1,12 @@
 import os
+import json
+import time
+import atexit
+import threading
+import requests
 from dotenv import load_dotenv
 from jira import JIRA
+from requests.adapters import HTTPAdapter
 
 # Load environment variables
 load_dotenv()
@@ -10,9 +16,96 @@ JIRA_SERVER = os.getenv('JIRA_SERVER')
 JIRA_EMAIL = os.getenv('JIRA_EMAIL')
 JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
 
+# Connection pool configuration
+JIRA_POOL_SIZE = int(os.getenv('JIRA_POOL_SIZE', '10'))
+JIRA_TIMEOUT = float(os.getenv('JIRA_TIMEOUT', '30'))
+JIRA_MAX_RETRIES = int(os.getenv('JIRA_MAX_RETRIES', '3'))
+# After a failed connection, callers get the same error for this long instead of reconnecting
+JIRA_RETRY_AFTER = float(os.getenv('JIRA_RETRY_AFTER', '30'))
+# Seconds a single, unretried reachability check may take before we treat Jira as offline
+JIRA_PROBE_TIMEOUT = float(os.getenv('JIRA_PROBE_TIMEOUT', '3'))
+
+# One long-lived client per (server, email, token), shared by every thread
+_clients = {}
+_clients_lock = threading.Lock()
+# (monotonic time, error) of the last failed client creation per key
+_failures = {}
+# Monotonic time of the last successful reachability check
+_last_reachable = 0.0
+
+def _create_client(server, email, api_token):
+    jira = JIRA(
+        server=server,
+        basic_auth=(email, api_token),
+        timeout=JIRA_TIMEOUT,
+        max_retries=JIRA_MAX_RETRIES
+    )
+
+    # Replace the default adapters so concurrent callers share a keep-alive pool
+    adapter = HTTPAdapter(pool_connections=JIRA_POOL_SIZE, pool_maxsize=JIRA_POOL_SIZE)
+    jira._session.mount('https://', adapter)
+    jira._session.mount('http://', adapter)
+    return jira
+
+def ensure_jira_reachable():
+    """Raise ConnectionError or Timeout within JIRA_PROBE_TIMEOUT if Jira cannot be reached.
+
+    The client's ResilientSession backs off for minutes on connection errors, so callers that can
+    fall back to local data check first; a success is trusted for JIRA_RETRY_AFTER seconds.
+    """
+    global _last_reachable
+    if time.monotonic() - _last_reachable < JIRA_RETRY_AFTER:
+        return
+    requests.head(JIRA_SERVER, timeout=JIRA_PROBE_TIMEOUT, allow_redirects=False)
+    _last_reachable = time.monotonic()
+
 def get_jira_client():
     if not all([JIRA_SERVER, JIRA_EMAIL, JIRA_API_TOKEN]):
         raise ValueError("Jira configuration is missing. Please check your .env file.")
-    
-    return JIRA(server=JIRA_SERVER, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN))
 
+    client_key = (JIRA_SERVER, JIRA_EMAIL, JIRA_API_TOKEN)
+    jira = _clients.get(client_key)
+    if jira is None:
+        with _clients_lock:
+            jira = _clients.get(client_key)
+            if jira is None:
+                failure = _failures.get(client_key)
+                if failure and time.monotonic() - failure[0] < JIRA_RETRY_AFTER:
+                    raise failure[1]
+                try:
+                    ensure_jira_reachable()
+                    jira = _create_client(*client_key)
+                except Exception as e:
+                    _failures[client_key] = (time.monotonic(), e)
+                    raise
+                _failures.pop(client_key, None)
+                _clients[client_key] = jira
+    return jira
+
+def delete_issue(jira, issue_key, delete_subtasks=False):
+    """Delete an issue by key; Issue.delete would need the issue loaded first."""
+    jira._session.delete(jira._get_url(f'issue/{issue_key}'),
+                         params={'deleteSubtasks': str(delete_subtasks).lower()})
+
+def set_assignee(jira, issue_key, identifier, value):
+    """Assign by accountId or name directly; JIRA.assign_issue searches for the user on every call."""
+    jira._session.put(jira._get_url(f'issue/{issue_key}/assignee'), data=json.dumps({identifier: value}))
+
+def warm_up_jira_client():
+    """Create the shared client ahead of the first command; JIRA() already fetches server info while connecting."""
+    try:
+        get_jira_client()
+        return True
+    except Exception:
+        return False
+
+def close_jira_clients():
+    with _clients_lock:
+        for jira in _clients.values():
+            try:
+                jira.close()
+            except Exception:
+                pass
+        _clients.clear()
+
+atexit.register(close_jira_clients)
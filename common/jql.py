@@ -1,38 +1,124 @@
+from itertools import chain
 from rich.console import Console
-from common.jira_client import get_jira_client
+from rich.live import Live
+from rich.table import Table
+from common.jira_client import get_jira_client, ensure_jira_reachable
 from jira.exceptions import JIRAError
+from requests.exceptions import ConnectionError, Timeout
+from common.search import stream_search_pages
+from common.local_jql import search_local, LocalJQLError
+from common.records import IssueRecord
+from common.result_cache import result_cache
 from common.table import create_jira_table, add_row_to_table, print_table
 
-def perform_jql_search(jql_query, fields_to_display, max_results=None):
+def perform_jql_search(jql_query, fields_to_display, max_results=None, local=False, records_out=None):
     console = Console()
+    if local:
+        return perform_local_jql_search(console, jql_query, fields_to_display, max_results)
     try:
         jira = get_jira_client()
+        ensure_jira_reachable()
         console.print(f"[yellow]Executing JQL query:[/yellow] {jql_query}")
-        
-        if max_results:
-            issues = jira.search_issues(jql_query, fields=','.join(fields_to_display), maxResults=max_results)
-        else:
-            issues = jira.search_issues(jql_query, fields=','.join(fields_to_display))
 
-        if not issues:
+        pages = stream_search_pages(jql_query, fields=fields_to_display, max_results=max_results, jira=jira,
+                                    records=True)
+        first_page = next(pages, None)
+        if not first_page:
             console.print("[yellow]No issues found matching the query.[/yellow]")
             return False
 
         table = create_jira_table("JQL Search Results", fields_to_display)
         color_map = {}
+        ticket_ids = []
 
-        for issue in issues:
-            add_row_to_table(table, issue, fields_to_display, color_map)
+        # Rows are drawn as each page arrives; the complete table is printed when the live view stops
+        with Live(table, console=console, auto_refresh=False, vertical_overflow="ellipsis") as live:
+            for page in chain([first_page], pages):
+                for issue in page:
+                    add_row_to_table(table, issue, fields_to_display, color_map)
+                    ticket_ids.append(issue.key)
+                if records_out is not None:
+                    records_out.extend(page)
+                live.refresh()
 
-        print_table(console, table)
-        ticket_ids = [issue.key for issue in issues]
         return ticket_ids
 
     except JIRAError as e:
         console.print(f"[bold red]Error performing JQL search:[/bold red] {str(e)}")
         return False
+    except (ConnectionError, Timeout) as e:
+        console.print(f"[yellow]Jira is unreachable ({type(e).__name__}); answering from the local issue store.[/yellow]")
+        return perform_local_jql_search(console, jql_query, fields_to_display, max_results)
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
         console.print(f"[yellow]JQL query:[/yellow] {jql_query}")
         console.print(f"[yellow]Fields to display:[/yellow] {fields_to_display}")
         return False
+
+def perform_local_jql_search(console, jql_query, fields_to_display, max_results=None):
+    """Evaluate the query against the synced issue store without contacting Jira."""
+    console.print(f"[yellow]Executing JQL query locally:[/yellow] {jql_query}")
+    try:
+        issues = search_local(jql_query, max_results)
+    except LocalJQLError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        return False
+
+    if not issues:
+        console.print("[yellow]No cached issues found matching the query. Run 'sync' to refresh the local store.[/yellow]")
+        return False
+
+    table = create_jira_table("JQL Search Results (local)", fields_to_display)
+    color_map = {}
+    for issue in issues:
+        # Offline rendering: status colours come from the catalog on disk, never from Jira
+        add_row_to_table(table, IssueRecord(issue['key'], None, issue['fields']), fields_to_display, color_map,
+                         offline=True)
+    print_table(console, table)
+    return [issue['key'] for issue in issues]
+
+def perform_cached_jql_search(jql_query, fields_to_display, max_results=None, ttl=None, label=None):
+    """Show a repeated query from the result cache; stale results are shown and then revalidated."""
+    console = Console()
+    entry = result_cache.get(jql_query, fields_to_display, max_results)
+    if entry is None:
+        records = []
+        ticket_ids = perform_jql_search(jql_query, fields_to_display, max_results, records_out=records)
+        # Only Jira's answer is cached; rows from the offline fallback leave records empty
+        if ticket_ids and records:
+            result_cache.put(jql_query, fields_to_display, max_results, records)
+        return ticket_ids
+
+    records = result_cache.records(entry)
+    age = int(result_cache.age(entry))
+    if not records:
+        console.print(f"[yellow]No issues found matching the query (cached {age}s ago).[/yellow]")
+    else:
+        table = create_jira_table(f"JQL Search Results (cached {age}s ago)", fields_to_display)
+        color_map = {}
+        for record in records:
+            add_row_to_table(table, record, fields_to_display, color_map)
+        print_table(console, table)
+
+    if not result_cache.is_fresh(entry, ttl):
+        console.print("[dim]Refreshing these results in the background...[/dim]")
+        result_cache.revalidate(
+            jql_query, fields_to_display, max_results,
+            on_changed=lambda added, changed, removed: print_result_changes(
+                label or jql_query, fields_to_display, added, changed, removed)
+        )
+    return [record.key for record in records]
+
+def print_result_changes(label, fields_to_display, added, changed, removed):
+    # Runs on the revalidation thread once fresh rows differ from the ones already shown
+    console = Console()
+    table = Table(title=f"Updated results for {label}")
+    table.add_column("Change")
+    for field in fields_to_display:
+        table.add_column(field.capitalize())
+    for change, style, records in (("new", "green", added), ("changed", "yellow", changed), ("gone", "red", removed)):
+        for record in records:
+            values = [record.key if field == 'key' else str(record.fields.get(field, "N/A")) for field in fields_to_display]
+            table.add_row(change, *values, style=style)
+    console.print()
+    console.print(table)
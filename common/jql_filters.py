@@ -2,6 +2,8 @@ import json
 import os
 
 JQL_FILTERS_FILE = 'jql_filters.json'
+# Seconds a filter's cached results are served before being refreshed, by filter name
+JQL_FILTER_TTLS_FILE = 'jql_filter_ttls.json'
 
 def save_jql_filter(name, query):
     filters = load_jql_filters()
@@ -18,5 +20,20 @@ def load_jql_filters():
             return json.load(f)
     return {}
 
+def load_filter_ttls():
+    if os.path.exists(JQL_FILTER_TTLS_FILE):
+        with open(JQL_FILTER_TTLS_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+def get_filter_ttl(name, default=None):
+    return load_filter_ttls().get(name, default)
+
+def set_filter_ttl(name, ttl):
+    ttls = load_filter_ttls()
+    ttls[name] = ttl
+    with open(JQL_FILTER_TTLS_FILE, 'w') as f:
+        json.dump(ttls, f, indent=2)
+
 # Export the functions
-__all__ = ['save_jql_filter', 'save_jql_filters', 'load_jql_filters']
+__all__ = ['save_jql_filter', 'save_jql_filters', 'load_jql_filters', 'get_filter_ttl', 'set_filter_ttl']
@@ -0,0 +1,8 @@
+_last_tickets = []
+
+def set_last_tickets(ticket_ids):
+    global _last_tickets
+    _last_tickets = list(ticket_ids)
+
+def get_last_tickets():
+    return list(_last_tickets)
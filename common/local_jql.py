@@ -0,0 +1,340 @@
+import re
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from common.storage import SQLiteBackend, get_connection_lock
+from common.cache_vid import vid_cache
+
+class LocalJQLError(ValueError):
+    """The query uses JQL the local evaluator does not understand; run it on Jira instead."""
+
+# Issue fields in the local store, as SQL expressions over the issues table
+def _json_field(name):
+    return f"json_extract(data, '$.fields.{name}')"
+
+FIELDS = {
+    'key': 'key',
+    'issuekey': 'key',
+    'issue': 'key',
+    'project': 'project',
+    'updated': 'updated',
+    'updateddate': 'updated',
+    'created': _json_field('created'),
+    'createddate': _json_field('created'),
+    'summary': _json_field('summary'),
+    'description': _json_field('description'),
+    'status': _json_field('status'),
+    'assignee': _json_field('assignee'),
+    'reporter': _json_field('reporter'),
+    'issuetype': _json_field('issuetype'),
+    'type': _json_field('issuetype'),
+}
+TEXT_FIELDS = {'summary', 'description', 'text'}
+DATE_FIELDS = {'created', 'createddate', 'updated', 'updateddate'}
+# Compared case-insensitively, matching Jira; each has a NOCASE expression index
+NOCASE_FIELDS = ('status', 'assignee', 'reporter', 'issuetype')
+NOCASE_COLUMNS = {_json_field(name) for name in NOCASE_FIELDS}
+# Values the cache stores in place of an empty user field
+EMPTY_VALUES = {'assignee': 'Unassigned', 'reporter': 'Unknown'}
+
+def _utc_minute(column):
+    # Jira stores local times with an offset ("2024-05-01T10:20:30.000+0200"); shift them to UTC minutes
+    zone = f"substr(replace({column}, ':', ''), -5)"
+    sign = f"CASE substr({zone}, 1, 1) WHEN '+' THEN '-' WHEN '-' THEN '+' END"
+    return (f"strftime('%Y-%m-%dT%H:%M', substr({column}, 1, 19), "
+            f"coalesce({sign} || substr({zone}, 2, 2) || ' hours', '+0 hours'), "
+            f"coalesce({sign} || substr({zone}, 4, 2) || ' minutes', '+0 minutes'))")
+
+DATE_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+_RELATIVE_DATE = re.compile(r'^([+-]?)(\d+)([mhdw])$')
+_TOKEN = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|(!=|>=|<=|!~|=|~|>|<)|([(),])|([^\s=!~<>(),"\']+))')
+_WORD = re.compile(r'[a-z0-9]+')
+
+def tokenize(jql_query):
+    tokens = []
+    position = 0
+    jql_query = jql_query.strip()
+    while position < len(jql_query):
+        match = _TOKEN.match(jql_query, position)
+        if not match or match.end() == position:
+            raise LocalJQLError(f"Unable to parse JQL near: {jql_query[position:]}")
+        quoted, operator, punctuation, word = match.groups()
+        if quoted is not None:
+            tokens.append(('string', re.sub(r'\\(.)', r'\1', quoted[1:-1])))
+        elif operator is not None:
+            tokens.append(('op', operator))
+        elif punctuation is not None:
+            tokens.append((punctuation, punctuation))
+        else:
+            tokens.append(('word', word))
+        position = match.end()
+    return tokens
+
+def _utc_string(moment):
+    # Naive times are local, as in Jira's own date literals
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M')
+
+def parse_date(value, now=None):
+    """Turn a relative offset (-7d, -4h, -30m, -2w) or an absolute local date into a sortable UTC string."""
+    now = now or datetime.now()
+    match = _RELATIVE_DATE.match(value)
+    if match:
+        sign, amount, unit = match.groups()
+        offset = timedelta(**{DATE_UNITS[unit]: int(amount)})
+        moment = now + offset if sign == '+' else now - offset
+        return _utc_string(moment)
+    for date_format in ('%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M', '%Y-%m-%d', '%Y/%m/%d'):
+        try:
+            return _utc_string(datetime.strptime(value, date_format))
+        except ValueError:
+            continue
+    raise LocalJQLError(f"Unsupported date value: {value}")
+
+class _Compiler:
+    """Recursive-descent JQL parser that emits a SQL WHERE clause with bound parameters."""
+
+    def __init__(self, jql_query, now=None):
+        self.tokens = tokenize(jql_query)
+        self.position = 0
+        self.params = []
+        self.now = now or datetime.now()
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise LocalJQLError("Unexpected end of JQL query")
+        self.position += 1
+        return token
+
+    def keyword(self, *words):
+        kind, value = self.peek()
+        return kind == 'word' and value.lower() in words
+
+    def expect(self, kind):
+        token = self.next()
+        if token[0] != kind:
+            raise LocalJQLError(f"Expected '{kind}' but found '{token[1]}'")
+        return token
+
+    def compile(self):
+        where = '1'
+        if self.peek()[0] is not None and not self.keyword('order'):
+            where = self.parse_or()
+        order = self.parse_order_by()
+        if self.peek()[0] is not None:
+            raise LocalJQLError(f"Unexpected '{self.peek()[1]}' in JQL query")
+        return where, order, self.params
+
+    def parse_or(self):
+        parts = [self.parse_and()]
+        while self.keyword('or'):
+            self.next()
+            parts.append(self.parse_and())
+        return parts[0] if len(parts) == 1 else '(' + ' OR '.join(parts) + ')'
+
+    def parse_and(self):
+        parts = [self.parse_not()]
+        while self.keyword('and'):
+            self.next()
+            parts.append(self.parse_not())
+        return parts[0] if len(parts) == 1 else '(' + ' AND '.join(parts) + ')'
+
+    def parse_not(self):
+        if self.keyword('not'):
+            self.next()
+            return f'NOT {self.parse_not()}'
+        if self.peek()[0] == '(':
+            self.next()
+            clause = self.parse_or()
+            self.expect(')')
+            return f'({clause})'
+        return self.parse_clause()
+
+    def parse_field(self):
+        kind, value = self.next()
+        if kind not in ('word', 'string'):
+            raise LocalJQLError(f"Expected a field name but found '{value}'")
+        field = value.lower()
+        if field not in FIELDS and field != 'text':
+            raise LocalJQLError(f"Field '{value}' is not available in the local issue store")
+        return field
+
+    def parse_value(self):
+        kind, value = self.next()
+        if kind not in ('word', 'string'):
+            raise LocalJQLError(f"Expected a value but found '{value}'")
+        if kind == 'word' and self.peek()[0] == '(':
+            raise LocalJQLError(f"JQL function '{value}()' is not supported locally")
+        return value
+
+    def empty_keyword(self):
+        # Unquoted EMPTY and NULL mean "no value"; quoted, they are ordinary strings
+        kind, value = self.peek()
+        return kind == 'word' and value.lower() in ('empty', 'null')
+
+    def parse_clause(self):
+        field = self.parse_field()
+
+        if self.keyword('is'):
+            self.next()
+            negate = self.keyword('not')
+            if negate:
+                self.next()
+            if not self.keyword('empty', 'null'):
+                raise LocalJQLError("Expected EMPTY or NULL after IS")
+            self.next()
+            return self.empty_clause(field, negate)
+
+        if self.keyword('in', 'not'):
+            negate = self.keyword('not')
+            self.next()
+            if negate and not self.keyword('in'):
+                raise LocalJQLError("Expected IN after NOT")
+            if negate:
+                self.next()
+            self.expect('(')
+            values = []
+            has_empty = False
+            while True:
+                if self.empty_keyword():
+                    self.next()
+                    has_empty = True
+                else:
+                    values.append(self.parse_value())
+                if self.peek()[0] != ',':
+                    break
+                self.next()
+            self.expect(')')
+            clause = self.comparison(field, 'IN', values) if values else None
+            if has_empty:
+                empty = self.empty_clause(field, False)
+                clause = f'({clause} OR {empty})' if clause else empty
+            return f'NOT ({clause})' if negate else clause
+
+        kind, operator = self.next()
+        if kind != 'op':
+            raise LocalJQLError(f"Expected an operator after '{field}' but found '{operator}'")
+        if operator in ('~', '!~'):
+            return self.text_clause(field, self.parse_value(), negate=operator == '!~')
+        if operator in ('=', '!=') and self.empty_keyword():
+            self.next()
+            return self.empty_clause(field, negate=operator == '!=')
+        return self.comparison(field, operator, [self.parse_value()])
+
+    def column(self, field):
+        if field == 'text':
+            raise LocalJQLError("'text' only supports the ~ operator")
+        column = FIELDS[field]
+        if column in NOCASE_COLUMNS:
+            return f'{column} COLLATE NOCASE'
+        return column
+
+    def convert(self, field, value):
+        if field in DATE_FIELDS:
+            return parse_date(value, self.now)
+        if FIELDS.get(field) in ('key', 'project'):
+            return value.upper()
+        return value
+
+    def comparison(self, field, operator, values):
+        column = self.column(field)
+        values = [self.convert(field, value) for value in values]
+        if field in DATE_FIELDS:
+            # Stored times carry seconds and a zone offset; compare in UTC at minute precision
+            column = _utc_minute(column)
+        if operator in ('IN', 'NOT IN'):
+            self.params.extend(values)
+            return f'{column} {operator} ({", ".join("?" * len(values))})'
+        if operator not in ('=', '!=', '>', '>=', '<', '<='):
+            raise LocalJQLError(f"Operator '{operator}' is not supported locally")
+        self.params.append(values[0])
+        return f'{column} {operator} ?'
+
+    def empty_clause(self, field, negate):
+        column = self.column(field)
+        empty = f'({column} IS NULL OR {column} = \'\''
+        if field in EMPTY_VALUES:
+            empty += ' OR ' + f'{column} = ?'
+            self.params.append(EMPTY_VALUES[field])
+        empty += ')'
+        return f'NOT {empty}' if negate else empty
+
+    def text_clause(self, field, value, negate=False):
+        if field not in TEXT_FIELDS:
+            raise LocalJQLError(f"Field '{field}' does not support the ~ operator")
+        columns = [FIELDS['summary'], FIELDS['description']] if field == 'text' else [FIELDS[field]]
+        words = _WORD.findall(value.lower().replace('*', ''))
+        if not words:
+            raise LocalJQLError(f"Nothing to search for in '{value}'")
+        # Every word must appear, as with Jira's ~ operator
+        parts = []
+        for word in words:
+            parts.append('(' + ' OR '.join(f'{column} LIKE ?' for column in columns) + ')')
+            self.params.extend([f'%{word}%'] * len(columns))
+        clause = '(' + ' AND '.join(parts) + ')'
+        return f'NOT {clause}' if negate else clause
+
+    def parse_order_by(self):
+        if not self.keyword('order'):
+            return 'updated DESC'
+        self.next()
+        if not self.keyword('by'):
+            raise LocalJQLError("Expected BY after ORDER")
+        self.next()
+        terms = []
+        while True:
+            field = self.parse_field()
+            direction = 'ASC'
+            if self.keyword('asc', 'desc'):
+                direction = self.next()[1].upper()
+            terms.append(f'{self.column(field)} {direction}')
+            if self.peek()[0] != ',':
+                break
+            self.next()
+        return ', '.join(terms)
+
+def compile_jql(jql_query, now=None):
+    """Return (where, order_by, params) for a JQL query, or raise LocalJQLError."""
+    return _Compiler(jql_query, now).compile()
+
+def ensure_indexes(backend):
+    with get_connection_lock():
+        for name in NOCASE_FIELDS:
+            backend.conn.execute(
+                f'CREATE INDEX IF NOT EXISTS {backend.table}_{name} '
+                f'ON {backend.table}({_json_field(name)} COLLATE NOCASE)'
+            )
+        for name in ('updated', 'created'):
+            try:
+                backend.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS {backend.table}_{name}_utc '
+                    f'ON {backend.table}({_utc_minute(FIELDS[name])})'
+                )
+            except sqlite3.OperationalError:
+                pass  # SQLite before 3.20 cannot index date functions; the comparison still works
+
+_indexed = False
+
+def search_local(jql_query, max_results=None):
+    """Run a JQL query against the synced issue store and return the cached issue dicts."""
+    global _indexed
+    backend = vid_cache.store
+    if not isinstance(backend, SQLiteBackend):
+        raise LocalJQLError("Local JQL needs the SQLite cache backend (CACHE_BACKEND=sqlite)")
+    if not _indexed:
+        ensure_indexes(backend)
+        _indexed = True
+
+    where, order_by, params = compile_jql(jql_query)
+    sql = f'SELECT data FROM {backend.table} WHERE {where} ORDER BY {order_by}'
+    if max_results:
+        sql += ' LIMIT ?'
+        params = params + [max_results]
+    with get_connection_lock():
+        return [json.loads(row[0]) for row in backend.conn.execute(sql, params)]
+
+__all__ = ['search_local', 'compile_jql', 'LocalJQLError']
@@ -0,0 +1,84 @@
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from common.storage import open_backend
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+CACHE_FILE = os.path.join(CACHE_DIR, 'metadata_cache.json')
+
+metadata_store = open_backend('metadata', CACHE_FILE)
+
+# After a failed load, Jira is not asked again for this long; the stale value is served meanwhile
+METADATA_RETRY_SECONDS = 60
+
+class MetadataCache:
+    """A value loaded from Jira and kept in memory and on disk for ttl seconds."""
+
+    def __init__(self, name, loader, ttl):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.value = None
+        self.cached_time = None
+        self.failure = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, cached_time):
+        return cached_time is not None and datetime.now() - cached_time < timedelta(seconds=self.ttl)
+
+    def get(self):
+        if self._is_fresh(self.cached_time):
+            return self.value
+        with self._lock:
+            if self._is_fresh(self.cached_time):
+                return self.value
+            entry = metadata_store.get(self.name)
+            if entry and self._is_fresh(datetime.fromisoformat(entry['cached_time'])):
+                self.value = entry['value']
+                self.cached_time = datetime.fromisoformat(entry['cached_time'])
+                return self.value
+            try:
+                return self._refresh()
+            except Exception:
+                # Offline or Jira is failing: an outdated value beats an error on every lookup
+                stale = self.peek()
+                if stale is None:
+                    raise
+                return stale
+
+    def peek(self):
+        """Return whatever is cached, however old, without contacting Jira."""
+        if self.value is None:
+            entry = metadata_store.get(self.name)
+            if entry:
+                self.value = entry['value']
+                self.cached_time = datetime.fromisoformat(entry['cached_time'])
+        return self.value
+
+    def refresh(self):
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        if self.failure and time.monotonic() - self.failure[0] < METADATA_RETRY_SECONDS:
+            raise self.failure[1]
+        try:
+            value = self.loader()
+        except Exception as e:
+            self.failure = (time.monotonic(), e)
+            raise
+        self.failure = None
+        cached_time = datetime.now()
+        metadata_store.put(self.name, {'cached_time': cached_time.isoformat(), 'value': value})
+        self.value = value
+        self.cached_time = cached_time
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self.value = None
+            self.cached_time = None
+            metadata_store.delete(self.name)
+
+__all__ = ['MetadataCache', 'metadata_store']
@@ -0,0 +1,57 @@
+import os
+from common.jira_client import get_jira_client
+from common.metadata_cache import MetadataCache
+
+PROJECT_CACHE_TTL = int(os.getenv('PROJECT_CACHE_TTL', str(24 * 3600)))
+
+def _load_issue_types():
+    return sorted(set(issue_type.name for issue_type in get_jira_client().issue_types()))
+
+def _load_projects():
+    return [{'key': project.key, 'name': project.name} for project in get_jira_client().projects()]
+
+def _project_issue_types_loader(project_key):
+    def load():
+        return [issue_type.name for issue_type in get_jira_client().project(project_key).issueTypes]
+    return load
+
+class ProjectCatalog:
+    """Project keys and issue type names, cached so creating issues needs no metadata requests."""
+
+    def __init__(self):
+        self.issue_types = MetadataCache('issue_types', _load_issue_types, PROJECT_CACHE_TTL)
+        self.projects = MetadataCache('projects', _load_projects, PROJECT_CACHE_TTL)
+        self.project_issue_types = {}
+
+    def issue_type_names(self):
+        return self.issue_types.get()
+
+    def project_keys(self):
+        return {project['key'] for project in self.projects.get()}
+
+    def issue_types_for(self, project_key):
+        if project_key not in self.project_issue_types:
+            self.project_issue_types[project_key] = MetadataCache(
+                f'issue_types:{project_key}', _project_issue_types_loader(project_key), PROJECT_CACHE_TTL
+            )
+        return self.project_issue_types[project_key].get()
+
+    def resolve_issue_type(self, project_key, name):
+        """Return the issue type's canonical name for the project, or None if it has no such type."""
+        try:
+            names = self.issue_types_for(project_key)
+        except Exception:
+            names = self.issue_type_names()
+        return next((type_name for type_name in names if type_name.lower() == name.lower()), None)
+
+    def refresh(self):
+        self.issue_types.refresh()
+        self.projects.refresh()
+        for cache in self.project_issue_types.values():
+            cache.invalidate()
+
+# Create a single instance of ProjectCatalog to be used across the application
+project_catalog = ProjectCatalog()
+
+# Export the project_catalog instance
+__all__ = ['project_catalog']
@@ -0,0 +1,50 @@
+def simplify_value(value):
+    # Reduce Jira's nested field objects to the display value we actually render
+    if isinstance(value, dict):
+        for attribute in ('displayName', 'name', 'value', 'key'):
+            if attribute in value:
+                return value[attribute]
+        return value
+    if isinstance(value, list):
+        return [simplify_value(item) for item in value]
+    return value
+
+class RecordFields:
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+class IssueRecord:
+    """A compact stand-in for jira.resources.Issue with simplified field values."""
+
+    __slots__ = ('key', 'id', 'fields')
+
+    def __init__(self, key, issue_id, fields):
+        self.key = key
+        self.id = issue_id
+        self.fields = RecordFields(fields)
+
+    @classmethod
+    def from_raw(cls, raw):
+        fields = {name: simplify_value(value) for name, value in raw.get('fields', {}).items()}
+        return cls(raw['key'], raw.get('id'), fields)
+
+    @classmethod
+    def from_issue(cls, issue):
+        return cls.from_raw(issue.raw)
+
+    def to_raw(self):
+        # Round-trips through from_raw, so records can be stored as JSON
+        return {'key': self.key, 'id': self.id, 'fields': dict(self.fields._values)}
+
+__all__ = ['IssueRecord', 'simplify_value']
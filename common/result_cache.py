@@ -0,0 +1,148 @@
+import os
+import re
+import hashlib
+import threading
+from datetime import datetime
+from common.storage import open_backend
+from common.search import stream_search_pages
+from common.records import IssueRecord
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+CACHE_FILE = os.path.join(CACHE_DIR, 'query_results.json')
+USAGE_FILE = os.path.join(CACHE_DIR, 'query_usage.json')
+
+# Default seconds a cached result is shown without revalidation; filters can override it
+QUERY_CACHE_TTL = int(os.getenv('QUERY_CACHE_TTL', '300'))
+# Least recently used results are evicted beyond this many cached queries
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv('QUERY_CACHE_MAX_ENTRIES', '100'))
+
+_QUOTED = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')')
+
+def _usage_index(usage):
+    # Last use goes in the backend's indexed "updated" column, so eviction never reads the rows
+    return None, usage['last_used']
+
+def normalize_jql(jql_query):
+    """Collapse whitespace and case outside quoted strings so equivalent queries share an entry."""
+    parts = _QUOTED.split(jql_query.strip())
+    return ''.join(part if i % 2 else re.sub(r'\s+', ' ', part).lower() for i, part in enumerate(parts))
+
+class ResultCache:
+    """Rows of recently run queries, keyed by normalised JQL and field projection."""
+
+    def __init__(self):
+        self.store = open_backend('query_results', CACHE_FILE)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        # Recency and row counts live apart from the rows, so lookups and eviction never parse results
+        self.usage = open_backend('query_usage', USAGE_FILE, _usage_index)
+        if len(self.usage) == 0:
+            # Results cached before usage was tracked separately; a one-off pass
+            for key in self.store.keys():
+                entry = self.store.get(key)
+                self._touch(key, entry.get('last_used') or entry['cached_time'], len(entry['records']))
+
+    def _touch(self, key, last_used, size=None):
+        if size is None:
+            usage = self.usage.get(key)
+            if usage is None:
+                return
+            size = usage['size']
+        self.usage.put(key, {'last_used': last_used, 'size': size})
+
+    def __len__(self):
+        return len(self.usage)
+
+    def cache_key(self, jql_query, fields, max_results=None):
+        raw_key = '|'.join([normalize_jql(jql_query), ','.join(fields), str(max_results or '')])
+        return hashlib.sha1(raw_key.encode()).hexdigest()
+
+    def get(self, jql_query, fields, max_results=None):
+        key = self.cache_key(jql_query, fields, max_results)
+        entry = self.store.get(key)
+        if entry:
+            self._touch(key, datetime.now().isoformat())
+        return entry
+
+    def age(self, entry):
+        return (datetime.now() - datetime.fromisoformat(entry['cached_time'])).total_seconds()
+
+    def is_fresh(self, entry, ttl=None):
+        return self.age(entry) < (QUERY_CACHE_TTL if ttl is None else ttl)
+
+    def records(self, entry):
+        return [IssueRecord.from_raw(raw) for raw in entry['records']]
+
+    def put(self, jql_query, fields, max_results, records):
+        now = datetime.now().isoformat()
+        entry = {
+            'jql': jql_query,
+            'fields': list(fields),
+            'max_results': max_results,
+            'cached_time': now,
+            'records': [record.to_raw() for record in records]
+        }
+        key = self.cache_key(jql_query, fields, max_results)
+        self.store.put(key, entry)
+        self._touch(key, now, len(records))
+        self.evict()
+        return entry
+
+    def evict(self):
+        """Drop the least recently used results beyond QUERY_CACHE_MAX_ENTRIES."""
+        last_used = self.usage.updated_index()
+        excess = len(last_used) - QUERY_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        for key in sorted(last_used, key=last_used.get)[:excess]:
+            self.usage.delete(key)
+            self.store.delete(key)
+
+    def fetch(self, jql_query, fields, max_results=None):
+        records = []
+        for page in stream_search_pages(jql_query, fields=fields, max_results=max_results, records=True):
+            records.extend(page)
+        return records
+
+    def revalidate(self, jql_query, fields, max_results=None, on_changed=None):
+        """Refresh an entry in the background; on_changed(added, changed, removed) runs if rows differ."""
+        key = self.cache_key(jql_query, fields, max_results)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._revalidate, args=(key, jql_query, fields, max_results, on_changed),
+                         daemon=True).start()
+
+    def _revalidate(self, key, jql_query, fields, max_results, on_changed):
+        try:
+            previous = self.store.get(key)
+            records = self.fetch(jql_query, fields, max_results)
+            self.put(jql_query, fields, max_results, records)
+            if previous and on_changed:
+                added, changed, removed = diff_records(self.records(previous), records)
+                if added or changed or removed:
+                    on_changed(added, changed, removed)
+        except Exception:
+            pass  # The cached rows stay in place until the next successful refresh
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+def diff_records(old_records, new_records):
+    """Return (added, changed, removed) records between two results of the same query."""
+    old_by_key = {record.key: record for record in old_records}
+    new_keys = {record.key for record in new_records}
+    added = [record for record in new_records if record.key not in old_by_key]
+    changed = [
+        record for record in new_records
+        if record.key in old_by_key and record.fields._values != old_by_key[record.key].fields._values
+    ]
+    removed = [record for record in old_records if record.key not in new_keys]
+    return added, changed, removed
+
+# Create a single instance of ResultCache to be used across the application
+result_cache = ResultCache()
+
+# Export the result_cache instance
+__all__ = ['result_cache', 'normalize_jql', 'diff_records', 'QUERY_CACHE_TTL']
@@ -0,0 +1,165 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from common.jira_client import get_jira_client
+from common.records import IssueRecord
+
+SEARCH_PAGE_SIZE = int(os.getenv('SEARCH_PAGE_SIZE', '100'))
+SEARCH_WORKERS = int(os.getenv('SEARCH_WORKERS', '4'))
+# 'offset' pages with startAt; 'token' uses nextPageToken via the enhanced search endpoint;
+# 'auto' picks token paging on Jira Cloud, where startAt beyond the first page is rejected
+SEARCH_PAGINATION = os.getenv('SEARCH_PAGINATION', 'auto').lower()
+
+class RecordPage(list):
+    """One page of IssueRecords built straight from the search response JSON."""
+    __slots__ = ('total', 'nextPageToken')
+
+def _fields_param(fields):
+    if isinstance(fields, (list, tuple)):
+        return ','.join(fields)
+    return fields
+
+def _record_page(data):
+    page = RecordPage(IssueRecord.from_raw(raw) for raw in data.get('issues', []))
+    page.total = data.get('total')
+    page.nextPageToken = data.get('nextPageToken')
+    return page
+
+def search_page(jira, jql_query, start_at=0, max_results=None, fields=None, records=False, validate=True):
+    """Fetch one page; with records=True skip jira Resource objects and map the raw JSON instead."""
+    max_results = max_results or SEARCH_PAGE_SIZE
+    if not records:
+        return jira.search_issues(jql_query, startAt=start_at, maxResults=max_results, fields=fields,
+                                  validate_query=validate)
+    return _record_page(jira.search_issues(jql_query, startAt=start_at, maxResults=max_results,
+                                           fields=fields, json_result=True, validate_query=validate))
+
+def uses_token_paging(jira):
+    if not hasattr(jira, 'enhanced_search_issues'):
+        return False
+    if SEARCH_PAGINATION == 'auto':
+        return bool(getattr(jira, '_is_cloud', False))
+    return SEARCH_PAGINATION == 'token'
+
+def token_page(jira, jql_query, token=None, max_results=None, fields=None, records=False):
+    """Fetch one page through the enhanced search endpoint; the page carries the next token, if any."""
+    max_results = max_results or SEARCH_PAGE_SIZE
+    if records:
+        return _record_page(jira.enhanced_search_issues(jql_query, nextPageToken=token, maxResults=max_results,
+                                                        fields=fields, json_result=True))
+    return jira.enhanced_search_issues(jql_query, nextPageToken=token, maxResults=max_results, fields=fields)
+
+def iter_search_pages(jql_query, fields=None, page_size=None, jira=None, records=False):
+    """Yield search results one page at a time, in order, until the server reports no more."""
+    jira = jira or get_jira_client()
+    page_size = page_size or SEARCH_PAGE_SIZE
+    fields = _fields_param(fields)
+
+    if uses_token_paging(jira):
+        token = None
+        while True:
+            page = token_page(jira, jql_query, token, page_size, fields, records)
+            if page:
+                yield page
+            token = getattr(page, 'nextPageToken', None)
+            if not page or not token:
+                return
+
+    yield from _iter_offset_pages(jira, jql_query, fields, page_size, records)
+
+def _iter_offset_pages(jira, jql_query, fields, page_size, records, start_at=0, max_results=None):
+    # The server may return fewer rows than asked for (it caps maxResults), so a short page is not
+    # the end; only the reported total, or an empty page when there is no total, ends the walk
+    while not max_results or start_at < max_results:
+        size = min(page_size, max_results - start_at) if max_results else page_size
+        page = search_page(jira, jql_query, start_at, size, fields, records)
+        if not page:
+            return
+        yield page
+        start_at += len(page)
+        total = getattr(page, 'total', None)
+        if total is not None and start_at >= total:
+            return
+
+def stream_search_pages(jql_query, fields=None, max_results=None, page_size=None, workers=None, jira=None,
+                        records=False):
+    """Yield result pages as soon as each arrives while the following pages load in the background.
+
+    The first page is requested on its own so the time to the first results does not depend
+    on the size of the result set. At most `workers` later pages are in flight at once.
+    """
+    jira = jira or get_jira_client()
+    page_size = page_size or SEARCH_PAGE_SIZE
+    if max_results:
+        page_size = min(page_size, max_results)
+    workers = workers or SEARCH_WORKERS
+    fields = _fields_param(fields)
+
+    if uses_token_paging(jira):
+        yield from _stream_token_pages(jira, jql_query, fields, max_results, page_size, records)
+        return
+
+    first_page = search_page(jira, jql_query, 0, page_size, fields, records)
+    if not first_page:
+        return
+    yield first_page
+
+    total = getattr(first_page, 'total', None)
+    if total is None:
+        # Without a total the page count is unknown, so walk on one page at a time
+        yield from _iter_offset_pages(jira, jql_query, fields, page_size, records, len(first_page), max_results)
+        return
+    limit = min(total, max_results) if max_results else total
+    if len(first_page) >= limit:
+        return
+
+    # The server may cap maxResults, so step by what it actually returned
+    step = len(first_page)
+    offsets = iter(range(step, limit, step))
+
+    def fetch(start_at):
+        return search_page(jira, jql_query, start_at, min(step, limit - start_at), fields, records)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(fetch, start_at) for _, start_at in zip(range(workers), offsets))
+        try:
+            while pending:
+                page = pending.popleft().result()
+                start_at = next(offsets, None)
+                if start_at is not None:
+                    pending.append(executor.submit(fetch, start_at))
+                if page:
+                    yield page
+        finally:
+            # The consumer may stop early; drop pages nobody will read
+            for future in pending:
+                future.cancel()
+
+def _stream_token_pages(jira, jql_query, fields, max_results, page_size, records):
+    # Tokens chain page to page, so only the next page can be loaded ahead
+    def fetch(token, size):
+        return token_page(jira, jql_query, token, size, fields, records)
+
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch, None, page_size)
+        while future is not None:
+            page = future.result()
+            fetched += len(page)
+            token = getattr(page, 'nextPageToken', None)
+            future = None
+            if page and token and (not max_results or fetched < max_results):
+                size = min(page_size, max_results - fetched) if max_results else page_size
+                future = executor.submit(fetch, token, size)
+            if page:
+                yield page
+
+def search_all(jql_query, fields=None, page_size=None, workers=None, jira=None, records=False):
+    """Fetch every result, loading the pages after the first one concurrently."""
+    issues = []
+    for page in stream_search_pages(jql_query, fields=fields, page_size=page_size, workers=workers, jira=jira,
+                                    records=records):
+        issues.extend(page)
+    return issues
+
+__all__ = ['RecordPage', 'search_page', 'token_page', 'uses_token_paging', 'iter_search_pages', 'stream_search_pages', 'search_all', 'SEARCH_PAGE_SIZE', 'SEARCH_WORKERS']
@@ -0,0 +1,200 @@
+import re
+import sqlite3
+import threading
+from rapidfuzz import process, fuzz
+from common.storage import CACHE_BACKEND, get_connection, get_connection_lock
+from common.cache_vid import vid_cache
+
+# Query terms without a prefix match are swapped for indexed terms at least this similar
+FUZZY_TERM_CUTOFF = 80
+FUZZY_TERMS_PER_TOKEN = 5
+
+# Keys per search_docs lookup when ranking candidates
+DOC_BATCH_SIZE = 500
+
+# Summary hits rank above description hits
+FIELD_WEIGHTS = {'s': 2, 'd': 1}
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    if not isinstance(text, str):
+        return []
+    return [token for token in _TOKEN.findall(text.lower()) if len(token) > 1]
+
+def _open_connection():
+    if CACHE_BACKEND == 'json':
+        # No database file next to the JSON caches; the index is rebuilt in memory each session
+        return sqlite3.connect(':memory:', check_same_thread=False, isolation_level=None)
+    return get_connection()
+
+class SearchIndex:
+    """Inverted index over cached issue summaries and descriptions, stored next to the issue cache."""
+
+    def __init__(self):
+        self.conn = _open_connection()
+        self.lock = get_connection_lock()
+        self._caches = []
+        self._terms = None
+        self._built = False
+        self._build_lock = threading.Lock()
+        with self.lock:
+            # One posting per (term, issue, field); the primary key doubles as the prefix-scan index
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS search_postings ('
+                'term TEXT NOT NULL, key TEXT NOT NULL, field TEXT NOT NULL, '
+                'PRIMARY KEY (term, key, field)) WITHOUT ROWID'
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS search_postings_key ON search_postings(key)')
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS search_docs (key TEXT PRIMARY KEY, summary TEXT, updated TEXT)'
+            )
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM search_docs').fetchone()[0]
+
+    def register(self, cache):
+        """Re-index issues as they are written to cache; safe to call more than once."""
+        with self._build_lock:
+            if cache not in self._caches:
+                cache.add_listener(self.index_keys)
+                self._caches.append(cache)
+
+    def ensure_built(self):
+        """Bring the index in line with the issue cache once per session.
+
+        Writes made before the index was registered with the cache are found by comparing
+        each key's updated time with the store's.
+        """
+        if self._built:
+            return
+        self.register(vid_cache)
+        with self._build_lock:
+            if not self._built:
+                self.reconcile()
+                self._built = True
+
+    def reconcile(self):
+        stored = vid_cache.store.updated_index()
+        with self.lock:
+            indexed = dict(self.conn.execute('SELECT key, updated FROM search_docs'))
+        stale = [key for key, updated in stored.items() if key not in indexed or indexed[key] != updated]
+        gone = [key for key in indexed if key not in stored]
+        if stale:
+            issues = (vid_cache.store.get(key) for key in stale)
+            self.add_issues([issue for issue in issues if issue])
+        if gone:
+            self.remove(gone)
+        return len(stale) + len(gone)
+
+    def rebuild(self):
+        with self.lock:
+            self.conn.execute('DELETE FROM search_postings')
+            self.conn.execute('DELETE FROM search_docs')
+        self.add_issues(vid_cache.store.values())
+        self._built = True
+
+    def index_keys(self, issue_keys):
+        # VidCache listener: re-index whatever was just written to the issue store
+        issues = [vid_cache.store.get(issue_key) for issue_key in issue_keys]
+        self.add_issues([issue for issue in issues if issue])
+
+    def add_issues(self, issues):
+        postings = []
+        docs = []
+        keys = []
+        for issue in issues:
+            fields = issue.get('fields', {})
+            keys.append((issue['key'],))
+            docs.append((issue['key'], fields.get('summary'), fields.get('updated')))
+            for field, text in (('s', fields.get('summary')), ('d', fields.get('description'))):
+                postings.extend((term, issue['key'], field) for term in set(tokenize(text)))
+        if not docs:
+            return
+        with self.lock:
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.executemany('DELETE FROM search_postings WHERE key = ?', keys)
+                self.conn.executemany('INSERT OR IGNORE INTO search_postings (term, key, field) VALUES (?, ?, ?)', postings)
+                self.conn.executemany('INSERT OR REPLACE INTO search_docs (key, summary, updated) VALUES (?, ?, ?)', docs)
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            self._terms = None
+
+    def remove(self, issue_keys):
+        keys = [(issue_key,) for issue_key in issue_keys]
+        with self.lock:
+            self.conn.executemany('DELETE FROM search_postings WHERE key = ?', keys)
+            self.conn.executemany('DELETE FROM search_docs WHERE key = ?', keys)
+            self._terms = None
+
+    def vocabulary(self):
+        with self.lock:
+            if self._terms is None:
+                self._terms = [row[0] for row in self.conn.execute('SELECT DISTINCT term FROM search_postings')]
+            return self._terms
+
+    def _prefix_hits(self, token):
+        # Range scan on the primary key: every term starting with the token
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT key, field FROM search_postings WHERE term >= ? AND term < ?',
+                (token, token + '\uffff')
+            ).fetchall()
+        return rows
+
+    def _fuzzy_hits(self, token):
+        matches = process.extract(token, self.vocabulary(), scorer=fuzz.ratio,
+                                  score_cutoff=FUZZY_TERM_CUTOFF, limit=FUZZY_TERMS_PER_TOKEN)
+        terms = [match[0] for match in matches]
+        if not terms:
+            return []
+        with self.lock:
+            return self.conn.execute(
+                f'SELECT key, field FROM search_postings WHERE term IN ({", ".join("?" * len(terms))})',
+                terms
+            ).fetchall()
+
+    def search(self, text, limit=30):
+        """Return [(key, summary)] for issues containing every word of text, best matches first."""
+        self.ensure_built()
+        tokens = list(dict.fromkeys(tokenize(text)))
+        if not tokens:
+            return []
+
+        scores = None
+        for token in tokens:
+            hits = self._prefix_hits(token) or self._fuzzy_hits(token)
+            token_scores = {}
+            for key, field in hits:
+                token_scores[key] = max(token_scores.get(key, 0), FIELD_WEIGHTS[field])
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: scores[key] + weight for key, weight in token_scores.items() if key in scores}
+            if not scores:
+                return []
+
+        docs = []
+        candidates = list(scores)
+        with self.lock:
+            # Chunked to stay under SQLite's bound-parameter limit for very common words
+            for i in range(0, len(candidates), DOC_BATCH_SIZE):
+                chunk = candidates[i:i + DOC_BATCH_SIZE]
+                docs.extend(self.conn.execute(
+                    f'SELECT key, summary, updated FROM search_docs WHERE key IN ({", ".join("?" * len(chunk))})',
+                    chunk
+                ))
+        # Term weight first, then how closely the summary reads like the query, then recency
+        docs.sort(key=lambda doc: (scores[doc[0]], fuzz.token_set_ratio(text, doc[1] or ''), doc[2] or ''),
+                  reverse=True)
+        return [(key, summary) for key, summary, _ in docs[:limit]]
+
+# Create a single instance of SearchIndex to be used across the application
+search_index = SearchIndex()
+
+# Export the search_index instance
+__all__ = ['search_index', 'tokenize']
@@ -0,0 +1,71 @@
+import os
+from common.jira_client import get_jira_client
+from common.metadata_cache import MetadataCache
+
+STATUS_CACHE_TTL = int(os.getenv('STATUS_CACHE_TTL', str(24 * 3600)))
+
+CATEGORY_COLORS = {
+    "To Do": "cyan",
+    "In Progress": "yellow",
+    "Done": "green"
+}
+
+def _load_statuses():
+    return [
+        {'id': status.id, 'name': status.name, 'category': status.statusCategory.name}
+        for status in get_jira_client().statuses()
+    ]
+
+class StatusCatalog:
+    def __init__(self):
+        self.cache = MetadataCache('statuses', _load_statuses, STATUS_CACHE_TTL)
+        self._indexed = None
+        self.by_name = {}
+        self.by_id = {}
+        self.missing = set()
+
+    def _index(self, offline=False):
+        statuses = self.cache.peek() if offline else self.cache.get()
+        if statuses is None:
+            return
+        if statuses is not self._indexed:
+            self.by_name = {status['name'].lower(): status['category'] for status in statuses}
+            self.by_id = {status['id']: status['category'] for status in statuses}
+            self.missing = set()
+            self._indexed = statuses
+
+    def category_for(self, status_name, offline=False):
+        try:
+            self._index(offline)
+        except Exception:
+            # No catalog on disk and Jira cannot be reached
+            return "Unknown"
+        category = self.by_name.get(status_name.lower())
+        if category is None and not offline and status_name.lower() not in self.missing:
+            # Possibly a status added since the catalog was cached; reload once per name
+            try:
+                self.cache.refresh()
+                self._index()
+                category = self.by_name.get(status_name.lower())
+            except Exception:
+                pass  # Keep the catalog we have; MetadataCache waits before asking Jira again
+            if category is None:
+                self.missing.add(status_name.lower())
+        return category or "Unknown"
+
+    def category_for_id(self, status_id):
+        self._index()
+        return self.by_id.get(str(status_id), "Unknown")
+
+    def color_for(self, status_name, offline=False):
+        """Colour for a status; offline=True uses only the catalog already on disk."""
+        try:
+            return CATEGORY_COLORS.get(self.category_for(status_name, offline))
+        except Exception:
+            return None
+
+# Create a single instance of StatusCatalog to be used across the application
+status_catalog = StatusCatalog()
+
+# Export the status_catalog instance
+__all__ = ['status_catalog', 'CATEGORY_COLORS']
@@ -0,0 +1,211 @@
+import os
+import json
+import sqlite3
+import threading
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache')
+DB_FILE = os.path.join(CACHE_DIR, 'jira_cli.db')
+
+# "sqlite" (default) or "json" for the legacy whole-file caches
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'sqlite').lower()
+
+_connections = {}
+_connections_lock = threading.Lock()
+
+# sqlite3 connections are not safe for concurrent use, so every statement goes through this lock
+_db_lock = threading.RLock()
+
+def get_connection(db_file=DB_FILE):
+    """Return the shared connection for a database file, opened in WAL mode."""
+    with _connections_lock:
+        conn = _connections.get(db_file)
+        if conn is None:
+            os.makedirs(os.path.dirname(db_file), exist_ok=True)
+            conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            _connections[db_file] = conn
+        return conn
+
+def get_connection_lock():
+    return _db_lock
+
+class JSONBackend:
+    """Keeps the whole collection in memory and rewrites the JSON file on every change."""
+
+    def __init__(self, path, indexer=None):
+        self.path = path
+        self.indexer = indexer or (lambda value: (None, None))
+        self.data = self._load()
+
+    def _load(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.data, f)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def put(self, key, value):
+        self.data[key] = value
+        self._save()
+
+    def put_many(self, items):
+        for key, value in items:
+            self.data[key] = value
+        self._save()
+
+    def delete(self, key):
+        if self.data.pop(key, None) is not None:
+            self._save()
+
+    def keys(self):
+        return list(self.data.keys())
+
+    def values(self):
+        return list(self.data.values())
+
+    def updated_index(self):
+        """Return {key: indexed updated time} for every record."""
+        return {key: self.indexer(value)[1] for key, value in self.data.items()}
+
+    def query(self, project=None, updated_since=None, limit=None):
+        results = []
+        for value in self.data.values():
+            value_project, value_updated = self.indexer(value)
+            if project and value_project != project:
+                continue
+            if updated_since and (not value_updated or value_updated < updated_since):
+                continue
+            results.append(value)
+        results.sort(key=lambda v: self.indexer(v)[1] or '', reverse=True)
+        return results[:limit] if limit else results
+
+class SQLiteBackend:
+    """One row per record, indexed by key, project and updated time."""
+
+    def __init__(self, table, indexer=None, db_file=DB_FILE):
+        self.table = table
+        self.indexer = indexer or (lambda value: (None, None))
+        self.conn = get_connection(db_file)
+        with _db_lock:
+            self.conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                'key TEXT PRIMARY KEY, project TEXT, updated TEXT, data TEXT NOT NULL)'
+            )
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_project ON {table}(project)')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_updated ON {table}(updated)')
+
+    def _row(self, key, value):
+        project, updated = self.indexer(value)
+        return (key, project, updated, json.dumps(value))
+
+    def __contains__(self, key):
+        with _db_lock:
+            row = self.conn.execute(f'SELECT 1 FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with _db_lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def get(self, key):
+        with _db_lock:
+            row = self.conn.execute(f'SELECT data FROM {self.table} WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key, value):
+        self.put_many([(key, value)])
+
+    def put_many(self, items):
+        rows = [self._row(key, value) for key, value in items]
+        if not rows:
+            return
+        with _db_lock:
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.executemany(
+                    f'INSERT INTO {self.table} (key, project, updated, data) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET project = excluded.project, '
+                    'updated = excluded.updated, data = excluded.data',
+                    rows
+                )
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+
+    def delete(self, key):
+        with _db_lock:
+            self.conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+
+    def keys(self):
+        with _db_lock:
+            return [row[0] for row in self.conn.execute(f'SELECT key FROM {self.table}')]
+
+    def values(self):
+        with _db_lock:
+            return [json.loads(row[0]) for row in self.conn.execute(f'SELECT data FROM {self.table}')]
+
+    def updated_index(self):
+        """Return {key: indexed updated time} for every record, read from the index columns only."""
+        with _db_lock:
+            return dict(self.conn.execute(f'SELECT key, updated FROM {self.table}'))
+
+    def query(self, project=None, updated_since=None, limit=None):
+        clauses = []
+        params = []
+        if project:
+            clauses.append('project = ?')
+            params.append(project)
+        if updated_since:
+            clauses.append('updated >= ?')
+            params.append(updated_since)
+        sql = f'SELECT data FROM {self.table}'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY updated DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with _db_lock:
+            return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+def migrate_json_file(backend, json_file):
+    """Copy a legacy JSON cache into an empty backend once, then move the file aside."""
+    if not os.path.exists(json_file) or len(backend) > 0:
+        return 0
+    try:
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+    except (ValueError, OSError) as e:
+        print(f"Unable to migrate {os.path.basename(json_file)}: {str(e)}")
+        return 0
+    backend.put_many(data.items())
+    os.replace(json_file, json_file + '.migrated')
+    return len(data)
+
+def open_backend(table, json_file, indexer=None):
+    if CACHE_BACKEND == 'json':
+        return JSONBackend(json_file, indexer)
+    backend = SQLiteBackend(table, indexer)
+    migrate_json_file(backend, json_file)
+    return backend
+
+__all__ = ['open_backend', 'JSONBackend', 'SQLiteBackend', 'get_connection', 'get_connection_lock']
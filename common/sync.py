@@ -0,0 +1,109 @@
+import os
+import math
+import threading
+from datetime import datetime
+from common.jira_client import get_jira_client
+from common.cache_vid import vid_cache
+from common.field_cache import field_cache
+from common.search import iter_search_pages
+from common.search_index import search_index
+
+SYNC_FIELDS = ['summary', 'issuetype', 'status', 'assignee', 'reporter', 'created', 'updated', 'description']
+SYNC_INTERVAL = int(os.getenv('SYNC_INTERVAL', '300'))
+
+# Re-read a little before the mark so clock skew between us and Jira cannot drop updates
+SYNC_OVERLAP_MINUTES = 2
+
+def get_sync_state(project):
+    return vid_cache.sync_state.get(project)
+
+def tracked_projects():
+    return sorted(vid_cache.sync_state.keys())
+
+def build_sync_jql(project, state, now):
+    # Offset paging needs an order that edits during the walk cannot reshuffle; "updated" would
+    # move an edited issue to the end and push an unseen one back onto a page already read
+    if not state:
+        return f'project = "{project}" ORDER BY key ASC'
+    # A relative "-Nm" offset avoids depending on the timezone of the Jira user profile
+    elapsed = now - datetime.fromisoformat(state['last_sync'])
+    minutes = math.ceil(elapsed.total_seconds() / 60) + SYNC_OVERLAP_MINUTES
+    return f'project = "{project}" AND updated >= "-{minutes}m" ORDER BY key ASC'
+
+def sync_project(project, full=False, on_page=None):
+    """Fetch issues updated since the project's high-water mark and upsert them into the cache."""
+    jira = get_jira_client()
+    project = project.upper()
+    # Synced issues become searchable by find as each page lands in the cache
+    search_index.register(vid_cache)
+    state = None if full else get_sync_state(project)
+    started = datetime.now()
+
+    # Custom description fields are resolved once per run instead of once per issue
+    description_field_ids = field_cache.description_field_ids()
+    fields = SYNC_FIELDS + description_field_ids
+
+    jql_query = build_sync_jql(project, state, started)
+    synced = 0
+    expected = None
+    for page in iter_search_pages(jql_query, fields=fields, jira=jira):
+        if expected is None:
+            expected = getattr(page, 'total', None)
+        vid_cache.update_many(page, description_field_ids)
+        synced += len(page)
+        if on_page:
+            on_page(synced)
+
+    # Moving the mark past issues we never received would hide them from every later delta sync
+    if expected is not None and synced < expected:
+        raise RuntimeError(f"Sync of {project} stopped after {synced} of {expected} issues; the sync mark was not moved.")
+
+    vid_cache.sync_state.put(project, {
+        'project': project,
+        'last_sync': started.isoformat(),
+        'last_count': synced,
+        'full': state is None
+    })
+    return synced
+
+class BackgroundSync:
+    def __init__(self):
+        self.projects = []
+        self.interval = SYNC_INTERVAL
+        self.last_error = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, projects, interval=None):
+        self.stop()
+        self.projects = [p.upper() for p in projects]
+        self.interval = interval or SYNC_INTERVAL
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self.is_running():
+            self._stop.set()
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self, stop_event):
+        while not stop_event.is_set():
+            for project in self.projects:
+                if stop_event.is_set():
+                    break
+                try:
+                    sync_project(project)
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = f"{project}: {str(e)}"
+            stop_event.wait(self.interval)
+
+# Create a single instance of BackgroundSync to be used across the application
+background_sync = BackgroundSync()
+
+__all__ = ['sync_project', 'tracked_projects', 'get_sync_state', 'background_sync']
@@ -2,6 +2,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 import hashlib
+from common.status_catalog import status_catalog
 
 def get_color_for_value(value):
     colors = ["red", "green", "blue", "magenta", "cyan", "yellow", "orange", "purple", "pink"]
@@ -19,7 +20,7 @@ def create_jira_table(title, fields_to_display):
         table.add_column(field.capitalize(), style="cyan")
     return table
 
-def add_row_to_table(table, issue, fields_to_display, color_map):
+def add_row_to_table(table, issue, fields_to_display, color_map, offline=False):
     row = []
     row_style = None
     for field in fields_to_display:
@@ -38,7 +39,11 @@ def add_row_to_table(table, issue, fields_to_display, color_map):
             str_value = str(value)
 
             column_name = field.capitalize()
-            if column_name not in ['Summary', 'Description', 'Command'] and not is_date_time_field(field):
+            status_color = status_catalog.color_for(str_value, offline) if field.lower() == 'status' else None
+            if status_color:
+                # Statuses are coloured by their workflow category from the shared catalog
+                str_value = Text(str_value, style=status_color)
+            elif column_name not in ['Summary', 'Description', 'Command'] and not is_date_time_field(field):
                 if str_value not in color_map:
                     color_map[str_value] = get_color_for_value(str_value)
                 color = color_map[str_value]
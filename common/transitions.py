@@ -0,0 +1,78 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from common.jira_client import get_jira_client
+
+TRANSITION_CACHE_TTL = int(os.getenv('TRANSITION_CACHE_TTL', '600'))
+
+class TransitionCache:
+    """Available transitions per ticket, keyed to the status they were read in."""
+
+    def __init__(self):
+        self.entries = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _is_fresh(self, entry):
+        return datetime.now() - entry['cached_time'] < timedelta(seconds=TRANSITION_CACHE_TTL)
+
+    def get_entry(self, issue_key):
+        """Return the cached entry or None; never touches the network."""
+        entry = self.entries.get(issue_key)
+        if entry and self._is_fresh(entry):
+            return entry
+        return None
+
+    def get(self, issue_key):
+        entry = self.get_entry(issue_key)
+        return entry['transitions'] if entry else None
+
+    def fetch(self, issue_key):
+        jira = get_jira_client()
+        issue = jira.issue(issue_key, fields='status')
+        transitions = [
+            {'id': t['id'], 'name': t['name'], 'to': t.get('to', {}).get('name')}
+            for t in jira.transitions(issue)
+        ]
+        entry = {
+            'status': issue.fields.status.name,
+            'transitions': transitions,
+            'cached_time': datetime.now()
+        }
+        with self._lock:
+            self.entries[issue_key] = entry
+        return entry
+
+    def get_or_fetch(self, issue_key):
+        return self.get_entry(issue_key) or self.fetch(issue_key)
+
+    def prefetch(self, issue_key):
+        """Load transitions in the background unless they are cached or already loading."""
+        if not issue_key or self.get_entry(issue_key):
+            return
+        with self._lock:
+            if issue_key in self._pending:
+                return
+            self._pending.add(issue_key)
+        self._executor.submit(self._prefetch, issue_key)
+
+    def _prefetch(self, issue_key):
+        try:
+            self.fetch(issue_key)
+        except Exception:
+            pass  # Completion simply offers nothing until the next successful fetch
+        finally:
+            with self._lock:
+                self._pending.discard(issue_key)
+
+    def invalidate(self, issue_key):
+        with self._lock:
+            self.entries.pop(issue_key, None)
+
+# Create a single instance of TransitionCache to be used across the application
+transition_cache = TransitionCache()
+
+# Export the transition_cache instance
+__all__ = ['transition_cache']
@@ -1,47 +1,59 @@
 #!/usr/bin/env python3
 
+import time
+STARTUP_BEGIN = time.perf_counter()
+
 import os
-import importlib
-import inspect
+import sys
+import argparse
 import readline
 import atexit
 import shlex
 import glob
+import threading
 from rich.console import Console
-from common.jira_client import get_jira_client
+from common.jira_client import warm_up_jira_client
 from common.jql_filters import load_jql_filters
+from common.command_registry import command_registry
+from common.transitions import transition_cache
+from common.completion import PrefixTrie
+from common.cache_vid import vid_cache
+from common.issue_context import issue_context
+from common.last_tickets import set_last_tickets
 import platform
 
 CURRENT_TICKET_FILE = os.path.join('./cache/current_ticket.txt')
 
+# Most ticket keys offered for a single Tab press
+COMPLETION_LIMIT = 200
+
 class InteractiveShell:
-    def __init__(self):
-        self.modules = {}
-        self.aliases = {}
-        self.load_modules()
+    def __init__(self, eager=False):
+        self.registry = command_registry
+        self.aliases = self.registry.aliases
+        # Open the pooled Jira connection in the background
+        threading.Thread(target=warm_up_jira_client, daemon=True).start()
+        self.load_modules(eager)
         self.history_file = os.path.expanduser('~/.interactive_shell_history')
         self.current_ticket = self.load_current_ticket()
         if self.current_ticket:
-            self.fetch_ticket_summary(self.current_ticket)
+            transition_cache.prefetch(self.current_ticket)
+            # Start from the locally known summary; the full issue refreshes it in the background
+            self.current_ticket_summary = self.get_cached_summary(self.current_ticket)
+            issue_context.prefetch(self.current_ticket, on_loaded=self.on_ticket_loaded)
         else:
             self.current_ticket_summary = None
         self.last_displayed_tickets = []
         self.history_limit = 30
+        self.command_index = PrefixTrie(self.get_commands())
+        self.ticket_index = None
+        self.completion_matches = []
         self.setup_history()  # Move this after loading modules
 
-    def load_modules(self):
-        modules_dir = os.path.join(os.path.dirname(__file__), 'modules')
-        for filename in os.listdir(modules_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                module_name = filename[:-3]
-                try:
-                    module = importlib.import_module(f'modules.{module_name}')
-                    self.modules[module_name] = module
-                    if hasattr(module, 'ALIASES'):
-                        for alias in module.ALIASES:
-                            self.aliases[alias] = module_name
-                except ImportError as e:
-                    print(f"Error loading module {module_name}: {e}")
+    def load_modules(self, eager=False):
+        # Commands come from the manifest and are imported on first use
+        if eager:
+            self.registry.load_all()
 
     def setup_history(self):
         # Set up readline with proper configuration first
@@ -77,114 +89,106 @@ class InteractiveShell:
     def load_current_ticket(self):
         if os.path.exists(CURRENT_TICKET_FILE):
             with open(CURRENT_TICKET_FILE, 'r') as f:
-                ticket = f.read().strip() or None
-            if ticket:
-                self.fetch_ticket_summary(ticket)
-            return ticket
+                return f.read().strip() or None
         return None
 
-    def fetch_ticket_summary(self, ticket):
-        try:
-            jira = get_jira_client()
-            issue = jira.issue(ticket)
-            self.current_ticket_summary = issue.fields.summary
-        except Exception as e:
-            print(f"Error fetching ticket summary: {str(e)}")
-            self.current_ticket_summary = None
-
     def set_current_ticket(self, ticket):
         self.current_ticket = ticket
         self.current_ticket_summary = None
         if ticket:
-            try:
-                jira = get_jira_client()
-                issue = jira.issue(ticket)
-                self.current_ticket_summary = issue.fields.summary
-            except Exception as e:
-                print(f"Error fetching ticket summary: {str(e)}")
+            transition_cache.prefetch(ticket)
+            # Show the locally known summary now; the full issue loads in the background
+            self.current_ticket_summary = self.get_cached_summary(ticket)
+            issue_context.prefetch(ticket, on_loaded=self.on_ticket_loaded)
         self.save_current_ticket()
 
+    def get_cached_summary(self, ticket):
+        cached_issue = vid_cache.store.get(ticket) or vid_cache.summaries.get(ticket)
+        return cached_issue['fields']['summary'] if cached_issue else None
+
+    def on_ticket_loaded(self, issue):
+        # Runs on the prefetch worker; ignore results for a ticket that lost focus meanwhile
+        if issue.key == self.current_ticket:
+            self.current_ticket_summary = issue.fields.summary
+
     def get_commands(self):
         """Returns a list of all available commands including modules and aliases"""
         # Add debug logging
-        commands = list(self.modules.keys()) + list(self.aliases.keys())
+        commands = self.registry.commands() + list(self.aliases.keys())
         sorted_commands = sorted(set(commands))
         return sorted_commands
 
+    def get_ticket_index(self):
+        # Built on first use from every key the local issue store knows, then kept current
+        if self.ticket_index is None:
+            self.ticket_index = PrefixTrie(vid_cache.known_keys())
+            self.ticket_index.update(self.last_displayed_tickets)
+            vid_cache.add_listener(self.ticket_index.update)
+        return self.ticket_index
+
     def complete(self, text, state):
         try:
-            # Get the current input line and cursor position
-            buffer = readline.get_line_buffer()
-            
-            # Use shlex to properly handle quoted strings
-            try:
-                # Split the input, preserving quotes
-                line = shlex.split(buffer) if buffer else []
-            except ValueError:
-                # Handle incomplete quoted strings
-                line = buffer.split()
-
-            # If there's no command yet or just starting to type
-            if not line or (len(line) == 1 and not buffer.endswith(' ')):
-                if not text and not buffer:
-                    # Show all commands when pressing tab on empty line
-                    commands = self.get_commands()
-                    if state < len(commands):
-                        return commands[state] + ' '
-                    return None
-                
-                # Filter commands based on partial input
-                commands = self.get_commands()
-                matches = [cmd + ' ' for cmd in commands if cmd.startswith(text.lower())]
-                if state < len(matches):
-                    return matches[state]
-                return None
-
-            # Get the command (first word)
-            cmd = line[0].strip().lower()
-
-            # If the command is an alias, get the actual command
-            if cmd in self.aliases:
-                cmd = self.aliases[cmd]
-
-            # Command-specific completions
-            if cmd == 'attach':
-                completions = self.complete_file_path(text, buffer, readline.get_begidx(), readline.get_endidx())
-                if completions and state < len(completions):
-                    return completions[state]
-            elif cmd in ['link', 'unlink', 'parent']:
-                # For commands that expect ticket IDs, suggest from history
-                if self.last_displayed_tickets:
-                    matches = [t + ' ' for t in self.last_displayed_tickets if t.lower().startswith(text.lower())]
-                    if state < len(matches):
-                        return matches[state]
-            elif cmd == 'status':
-                # Get available status transitions for current ticket
-                if self.current_ticket:
-                    try:
-                        jira = get_jira_client()
-                        issue = jira.issue(self.current_ticket)
-                        transitions = jira.transitions(issue)
-                        status_names = [t['name'].lower() for t in transitions]
-                        matches = [s + ' ' for s in status_names if s.startswith(text.lower())]
-                        if state < len(matches):
-                            return matches[state]
-                    except:
-                        pass
-
-            # Default completion: include commands, aliases, and ticket IDs
-            all_completions = (self.get_commands() + 
-                              list(self.aliases.keys()) + 
-                              self.last_displayed_tickets)
-            
-            matches = [item for item in all_completions if item.lower().startswith(text.lower())]
-            results = [m + ' ' for m in matches] + [None]
-            return results[state]
+            # readline calls this with increasing state; work out the matches once per Tab
+            if state == 0:
+                self.completion_matches = self.get_completions(text)
+            if state < len(self.completion_matches):
+                return self.completion_matches[state]
+            return None
 
         except Exception as e:
             print(f"Error completing command: {str(e)}")
             return None
 
+    def get_completions(self, text):
+        # Get the current input line and cursor position
+        buffer = readline.get_line_buffer()
+
+        # Use shlex to properly handle quoted strings
+        try:
+            # Split the input, preserving quotes
+            line = shlex.split(buffer) if buffer else []
+        except ValueError:
+            # Handle incomplete quoted strings
+            line = buffer.split()
+
+        # If there's no command yet or just starting to type
+        if not line or (len(line) == 1 and not buffer.endswith(' ')):
+            # An empty prefix lists every command
+            return [cmd + ' ' for cmd in self.command_index.complete(text)]
+
+        # Get the command (first word)
+        cmd = line[0].strip().lower()
+
+        # If the command is an alias, get the actual command
+        if cmd in self.aliases:
+            cmd = self.aliases[cmd]
+
+        # Command-specific completions
+        if cmd == 'attach':
+            completions = self.complete_file_path(text, buffer, readline.get_begidx(), readline.get_endidx())
+            if completions:
+                return completions
+        elif cmd in ['link', 'unlink', 'parent']:
+            # For commands that expect ticket IDs, suggest every known ticket
+            matches = self.get_ticket_index().complete(text, limit=COMPLETION_LIMIT)
+            if matches:
+                return [t + ' ' for t in matches]
+        elif cmd == 'status':
+            # Offer cached transitions only; a miss starts a background fetch instead of blocking
+            if self.current_ticket:
+                transitions = transition_cache.get(self.current_ticket)
+                if transitions is None:
+                    transition_cache.prefetch(self.current_ticket)
+                else:
+                    status_names = [t['name'].lower() for t in transitions]
+                    matches = [s + ' ' for s in status_names if s.startswith(text.lower())]
+                    if matches:
+                        return matches
+
+        # Default completion: include commands, aliases, and ticket IDs
+        matches = self.command_index.complete(text) + self.get_ticket_index().complete(text, limit=COMPLETION_LIMIT)
+        return [m + ' ' for m in matches]
+
     def complete_file_path(self, text, line, begidx, endidx):
         before_arg = line.rfind(" ", 0, begidx)
         if before_arg == -1:
@@ -249,8 +253,8 @@ class InteractiveShell:
         # Check if the command looks like a TICKET-ID (e.g., PROJ-123)
         if '-' in command and not args:
             # Assume it's a TICKET-ID and pass it to the vid module
-            module = self.modules['vid']
-            if hasattr(module, 'run'):
+            module = self.registry.get_module('vid')
+            if module and hasattr(module, 'run'):
                 try:
                     run_func = module.run
                     if callable(run_func):
@@ -267,13 +271,15 @@ class InteractiveShell:
         if command in self.aliases:
             command = self.aliases[command]
 
-        if command in self.modules:
-            module = self.modules[command]
+        if command in self.registry:
+            module = self.registry.get_module(command)
+            if module is None:
+                return
             if hasattr(module, 'run'):
                 try:
                     run_func = module.run
                     if callable(run_func):
-                        if len(inspect.signature(run_func).parameters) > 1:
+                        if self.registry.arity(command) > 1:
                             result = run_func(args, self.current_ticket)
                         else:
                             result = run_func(args)
@@ -282,18 +288,13 @@ class InteractiveShell:
                         if isinstance(result, list) and all(isinstance(item, str) for item in result):
                             self.update_ticket_id_history(result)
 
-                        if command == 'vid' and result:
-                            self.set_current_ticket(result)
-                        elif command == 'new' and result:
+                        # Only a single ticket key refocuses; bulk commands such as 'new --from' return a list
+                        if command in ['vid', 'new', 'parent', 'cp'] and isinstance(result, str) and result:
                             self.set_current_ticket(result)
                         elif command == 'delete' and result == "DELETED":
                             self.set_current_ticket(None)
-                        elif command == 'parent' and result:
-                            self.set_current_ticket(result)
                         elif command in ['clear', 'unfocus'] and result == "CLEARED":
                             self.set_current_ticket(None)
-                        elif command == 'cp' and result:
-                            self.set_current_ticket(result)
                     else:
                         print(f"The 'run' attribute of the '{command}' module is not callable.")
                 except Exception as e:
@@ -301,30 +302,51 @@ class InteractiveShell:
             else:
                 print(f"The '{command}' module does not have a 'run' function.")
         else:
-            # If the command is unknown, perform a JQL search
-            jql_query = f'summary ~ "{command} {" ".join(args)}"'
-            jql_module = self.modules['jql']
-            if hasattr(jql_module, 'run'):
+            # Unknown commands are a quick text search, answered from the local index first
+            find_module = self.registry.get_module('find')
+            if find_module and hasattr(find_module, 'run'):
                 try:
-                    run_func = jql_module.run
+                    run_func = find_module.run
                     if callable(run_func):
-                        result = run_func([jql_query], self.current_ticket)
+                        result = run_func([command] + args, self.current_ticket)
                         if isinstance(result, list) and all(isinstance(item, str) for item in result):
                             self.update_ticket_id_history(result)
                     else:
-                        print(f"The 'run' attribute of the 'jql' module is not callable.")
+                        print(f"The 'run' attribute of the 'find' module is not callable.")
                 except Exception as e:
-                    print(f"Error executing JQL search: {str(e)}")
+                    print(f"Error executing search: {str(e)}")
             else:
-                print(f"The 'jql' module does not have a 'run' function.")
+                print(f"The 'find' module does not have a 'run' function.")
 
     def update_ticket_id_history(self, ticket_ids):
         """
         Update the history of displayed ticket IDs.
         """
         self.last_displayed_tickets = (self.last_displayed_tickets + ticket_ids)[-self.history_limit:]
-
-shell = InteractiveShell()
+        # Bulk commands can target the most recent listing with --last
+        set_last_tickets(ticket_ids)
+        if self.ticket_index is not None:
+            self.ticket_index.update(ticket_ids)
+
+def bench_startup():
+    """Time imports and shell construction up to the first prompt, then exit."""
+    imported = time.perf_counter()
+    shell = InteractiveShell()
+    ready = time.perf_counter()
+    console = Console()
+    console.print(f"imports:            {(imported - STARTUP_BEGIN) * 1000:8.1f} ms")
+    console.print(f"shell construction: {(ready - imported) * 1000:8.1f} ms")
+    console.print(f"[bold]time to prompt:     {(ready - STARTUP_BEGIN) * 1000:8.1f} ms[/bold]")
+    console.print(f"current ticket:     {shell.current_ticket or '-'} "
+                  f"(summary {'from cache' if shell.current_ticket_summary else 'not cached'})")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="jira-cli interactive shell")
+    parser.add_argument('--bench-startup', action='store_true',
+                        help="report cold-start timings up to the first prompt and exit")
+    cli_args = parser.parse_args()
+    if cli_args.bench_startup:
+        bench_startup()
+        sys.exit(0)
+    shell = InteractiveShell()
     shell.run()
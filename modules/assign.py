@@ -1,42 +1,126 @@
+import re
 from rich.console import Console
-from common.jira_client import get_jira_client
+from common.jira_client import get_jira_client, set_assignee
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
+from common.cache_users import user_cache
+from common.cache_vid import vid_cache
+from common.metadata_cache import metadata_store
+from common.last_tickets import get_last_tickets
+from common.bulk import split_target_args, fetch_targets, run_bulk, print_bulk_summary, error_message
+from common.utils import confirm_action
+
+# Request bodies the assignee endpoint accepts: Jira Cloud wants accountId, Jira Server a username
+IDENTIFIERS = ['accountId', 'name']
+# The identifier that last worked against this server, so later runs skip the ones that fail
+IDENTIFIER_KEY = 'assign_identifier'
+
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]*-\d+$', re.IGNORECASE)
 
 def run(args, current_ticket=None):
     console = Console()
 
-    if not current_ticket:
-        console.print("[bold red]Error:[/bold red] No current ticket is focused. Use 'vid' command to focus on a ticket first.")
-        return
+    user_query, args = parse_user(args)
+    args, jql_query, use_last = split_target_args(args)
+    issue_keys = [arg.upper() for arg in args]
+    if use_last:
+        issue_keys = get_last_tickets()
+    if not issue_keys and not jql_query:
+        if not current_ticket:
+            console.print("[bold red]Error:[/bold red] No current ticket is focused. Use 'vid' command to focus on a ticket first.")
+            return
+        issue_keys = [current_ticket]
 
     try:
+        if user_query in (None, 'me'):
+            user, exact = user_cache.myself(), True
+        else:
+            user, exact = user_cache.match_user(user_query)
+        if not user:
+            console.print(f"[bold red]Error:[/bold red] No user found matching '{user_query}'.")
+            return
+
         jira = get_jira_client()
-        issue = jira.issue(current_ticket)
+        if jql_query:
+            issue_keys = [issue.key for issue in fetch_targets(jql_query=jql_query, fields='assignee', jira=jira)]
+            if not issue_keys:
+                console.print("[yellow]No issues found matching the query.[/yellow]")
+                return
 
-        # Get the current user
-        current_user = jira.myself()
+        # A fuzzy name match or a bulk change is shown and confirmed before anything is reassigned
+        if not exact or len(issue_keys) > 1:
+            console.print(f"[bold cyan]Assignee:[/bold cyan] {describe_user(user)}"
+                          + ("" if exact else f" [yellow](closest match for '{user_query}')[/yellow]"))
+            if not confirm_action(f"Assign {len(issue_keys)} issue(s) to {user['display_name']}?", default=False):
+                return
 
-        # Try to assign using email address first, then fallback to display name
-        assignment_methods = [
-            ('emailAddress', lambda: jira.assign_issue(issue, current_user['emailAddress'])),
-            ('displayName', lambda: jira.assign_issue(issue, current_user['displayName']))
-        ]
+        # The first issue settles which identifier this server accepts; the rest reuse it concurrently
+        first_key, remaining = issue_keys[0], issue_keys[1:]
+        identifier, error = assign_first(jira, first_key, user)
+        if identifier is None:
+            console.print(f"[bold red]Error:[/bold red] Unable to assign {first_key} to {user['display_name']}: {error_message(error)}")
+            return
 
-        for identifier, method in assignment_methods:
-            try:
-                method()
-                console.print(f"[bold green]Successfully assigned {current_ticket} to {current_user['displayName']}[/bold green]")
-                return
-            except JIRAError as e:
-                console.print(f"[yellow]Assignment using {identifier} failed: {str(e)}[/yellow]")
+        if not remaining:
+            assigned = [first_key]
+            console.print(f"[bold green]Successfully assigned {first_key} to {user['display_name']}[/bold green]")
+        else:
+            outcomes = run_bulk(remaining, lambda issue_key: assign_issue(jira, issue_key, identifier, user),
+                                f"Assigning to {user['display_name']}", console=console)
+            outcomes.insert(0, (first_key, None, None))
+            print_bulk_summary(console, f"Assignments to {user['display_name']}", outcomes, success_text="Assigned")
+            assigned = [issue_key for issue_key, _, error in outcomes if error is None]
 
-        # If all methods fail, raise an exception
-        raise Exception("Failed to assign the issue using available user identifiers")
+        vid_cache.patch_many({issue_key: {'assignee': user['display_name']} for issue_key in assigned})
+        for issue_key in assigned:
+            issue_context.invalidate(issue_key)
+        return assigned if remaining else None
 
     except JIRAError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
 
-HELP_TEXT = "Assign the current ticket to yourself"
+def parse_user(args):
+    """Return (user query or None, remaining args); accepts 'name', '[[Full Name]]' or just issue keys."""
+    if not args:
+        return None, []
+    if args[0].startswith('[['):
+        for i, arg in enumerate(args):
+            if arg.endswith(']]'):
+                return ' '.join(args[:i + 1])[2:-2].strip(), list(args[i + 1:])
+    if args[0].startswith('--') or ISSUE_KEY_PATTERN.match(args[0]):
+        return None, list(args)
+    return args[0], list(args[1:])
+
+def describe_user(user):
+    email = user.get('email_address') or user.get('name')
+    return f"{user['display_name']} <{email}>" if email else user['display_name']
+
+def identifier_value(user, identifier):
+    if identifier == 'accountId':
+        return user.get('account_id')
+    return user.get('name') or user.get('email_address')
+
+def assign_issue(jira, issue_key, identifier, user):
+    set_assignee(jira, issue_key, identifier, identifier_value(user, identifier))
+
+def assign_first(jira, issue_key, user):
+    remembered = metadata_store.get(IDENTIFIER_KEY)
+    identifiers = sorted(IDENTIFIERS, key=lambda identifier: identifier != remembered)
+    error = None
+    for identifier in identifiers:
+        if not identifier_value(user, identifier):
+            continue
+        try:
+            assign_issue(jira, issue_key, identifier, user)
+        except JIRAError as e:
+            error = e
+            continue
+        if identifier != remembered:
+            metadata_store.put(IDENTIFIER_KEY, identifier)
+        return identifier, None
+    return None, error or ValueError("The user has no identifier this server accepts")
+
+HELP_TEXT = "Assign tickets to a user, found by name or email (Usage: assign [user|[[Full Name]]] [TICKET-ID... | --last | --jql <JQL query>]; defaults to yourself and the current ticket)"
 ALIASES = ["take"]
@@ -2,6 +2,7 @@ import os
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 import glob
 
 def run(args, current_ticket=None):
@@ -27,6 +28,7 @@ def run(args, current_ticket=None):
 
         with open(file_path, 'rb') as file:
             jira.add_attachment(issue=issue, attachment=file, filename=os.path.basename(file_path))
+        issue_context.invalidate(current_ticket)
 
         console.print(f"[bold green]Successfully attached {os.path.basename(file_path)} to {current_ticket}[/bold green]")
 
@@ -4,6 +4,7 @@ import subprocess
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 from rapidfuzz import process, fuzz
 import re
 import requests
@@ -39,6 +40,7 @@ def run(args, current_ticket=None):
         # Add the comment if it's not empty
         if comment_body:
             jira.add_comment(issue, comment_body)
+            issue_context.invalidate(current_ticket)
             console.print(f"[bold green]Successfully added comment to {current_ticket}[/bold green]")
         else:
             console.print("[yellow]No comment was added (empty comment)[/yellow]")
@@ -1,6 +1,7 @@
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -59,6 +60,8 @@ def run(args, current_ticket=None):
             outwardIssue=new_issue.key
         )
 
+        issue_context.invalidate(current_ticket)
+
         console.print(f"[green]Created link between {source_issue.key} and {new_issue.key}[/green]")
 
         return new_issue.key
@@ -1,51 +1,68 @@
-import sys
 from rich.console import Console
-from common.jira_client import get_jira_client
+from rich.table import Table
+from common.jira_client import get_jira_client, delete_issue
 from jira.exceptions import JIRAError
 from common.utils import confirm_action
+from common.bulk import split_jql_arg, fetch_targets, run_bulk, print_bulk_summary
+from common.cache_vid import vid_cache
+from common.issue_context import issue_context
+from common.search_index import search_index
 
 def run(args, current_ticket=None):
     console = Console()
 
-    if not args and not current_ticket:
-        console.print("[bold red]Error:[/bold red] No ticket specified and no current ticket set.")
-        return
-
+    args, jql_query = split_jql_arg(args)
     issue_keys = [arg.strip().upper() for arg in args]
+    if not issue_keys and not jql_query:
+        if not current_ticket:
+            console.print("[bold red]Error:[/bold red] No ticket specified and no current ticket set.")
+            return
+        issue_keys = [current_ticket]
 
     try:
         jira = get_jira_client()
-        issues = []
+        # Every summary comes back from one search instead of a request per issue
+        issues = fetch_targets(issue_keys, jql_query, fields='summary', jira=jira)
 
+        found = {issue.key for issue in issues}
         for issue_key in issue_keys:
-            try:
-                issue = jira.issue(issue_key)
-                issues.append(issue)
-                console.print(f"[cyan]Key:[/cyan] {issue.key} - [cyan]Summary:[/cyan] {issue.fields.summary}")
-            except JIRAError as e:
-                console.print(f"[bold red]Error fetching issue {issue_key}:[/bold red] {str(e)}")
+            if issue_key not in found:
+                console.print(f"[bold red]Error fetching issue {issue_key}:[/bold red] Issue does not exist or you do not have permission to see it.")
 
         if not issues:
             console.print("[bold red]Error:[/bold red] No valid tickets to delete.")
             return
 
-        if confirm_action("Are you sure you want to delete these issues?", default=False):
-            for issue in issues:
-                try:
-                    issue.delete()
-                    console.print(f"[bold green]Successfully deleted issue {issue.key}[/bold green]")
-                except JIRAError as e:
-                    console.print(f"[bold red]Error deleting issue {issue.key}:[/bold red] {str(e)}")
-
-            # Unfocus the current ticket only if it was deleted
-            if current_ticket and current_ticket in issue_keys:
-                console.print(f"[bold yellow]Unfocusing current ticket: {current_ticket}[/bold yellow]")
-                return "DELETED"
-        else:
+        table = Table(title=f"Issues to delete ({len(issues)})")
+        table.add_column("Key", style="cyan")
+        table.add_column("Summary")
+        for issue in issues:
+            table.add_row(issue.key, issue.fields.get('summary', ''))
+        console.print(table)
+
+        if not confirm_action("Are you sure you want to delete these issues?", default=False):
             console.print("[yellow]Deletion cancelled.[/yellow]")
+            return
+
+        outcomes = run_bulk([issue.key for issue in issues], lambda issue_key: delete_issue(jira, issue_key),
+                            "Deleting issues", console=console)
+        print_bulk_summary(console, "Delete results", outcomes, success_text="Deleted")
+
+        deleted = [issue_key for issue_key, _, error in outcomes if error is None]
+        vid_cache.remove(deleted)
+        search_index.remove(deleted)
+        for issue_key in deleted:
+            issue_context.invalidate(issue_key)
+
+        # Unfocus the current ticket only if it was deleted
+        if current_ticket and current_ticket in deleted:
+            console.print(f"[bold yellow]Unfocusing current ticket: {current_ticket}[/bold yellow]")
+            return "DELETED"
 
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
 
-HELP_TEXT = "Delete one or more Jira tickets (Usage: delete [TICKET-ID]...)"
+HELP_TEXT = "Delete one or more Jira tickets (Usage: delete [TICKET-ID]... | delete --jql <JQL query>)"
 ALIASES = ["rm"]
@@ -1,7 +1,7 @@
 import os
 from rich.console import Console
-from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -11,8 +11,7 @@ def run(args, current_ticket=None):
         return
 
     try:
-        jira = get_jira_client()
-        issue = jira.issue(current_ticket)
+        issue = issue_context.get_or_fetch(current_ticket)
 
         attachments = issue.fields.attachment
 
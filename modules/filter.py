@@ -1,13 +1,15 @@
 from rich.console import Console
 from rich.table import Table
-from common.jql_filters import load_jql_filters, save_jql_filters, save_jql_filter
-from common.jql import perform_jql_search
+from common.jql_filters import load_jql_filters, save_jql_filters, save_jql_filter, get_filter_ttl, set_filter_ttl
+from common.jql import perform_jql_search, perform_cached_jql_search
 from rapidfuzz import process, fuzz
 from common.last_jql import get_last_jql, set_last_jql
 
 def run(args, current_ticket=None):
     console = Console()
     filters = load_jql_filters()
+    local = '--local' in args
+    args = [arg for arg in args if arg != '--local']
 
     if not args:
         show_filters_table(console, filters)
@@ -35,10 +37,21 @@ def run(args, current_ticket=None):
         else:
             remove_filter(console, filters, ' '.join(args[1:]))
         return []
+    elif command == 'ttl':
+        if len(args) < 3 or not args[1].isdigit():
+            console.print("[bold red]Error:[/bold red] Usage: filter ttl <seconds> <filter_name>")
+            return []
+        filter_name = ' '.join(args[2:])
+        if filter_name not in filters:
+            console.print(f"[bold red]Error:[/bold red] No filter named '{filter_name}'.")
+            return []
+        set_filter_ttl(filter_name, int(args[1]))
+        console.print(f"[bold green]Results of '{filter_name}' will be reused for {args[1]} seconds.[/bold green]")
+        return []
     else:
         filter_name = ' '.join(args)
         try:
-            return run_matching_filter(console, filters, filter_name)
+            return run_matching_filter(console, filters, filter_name, local)
         except Exception as e:
             console.print(f"[bold red]Error:[/bold red] An unexpected error occurred: {str(e)}")
             return []
@@ -55,15 +68,15 @@ def show_filters_table(console, filters):
 
     console.print(table)
 
-def run_matching_filter(console, filters, filter_name):
+def run_matching_filter(console, filters, filter_name, local=False):
     exact_match = filters.get(filter_name)
     if exact_match:
-        return run_filter(console, filter_name, exact_match)
+        return run_filter(console, filter_name, exact_match, local)
 
     # Partial matching
     partial_matches = [name for name in filters if filter_name.lower() in name.lower()]
     if len(partial_matches) == 1:
-        return run_filter(console, partial_matches[0], filters[partial_matches[0]])
+        return run_filter(console, partial_matches[0], filters[partial_matches[0]], local)
     elif len(partial_matches) > 1:
         console.print(f"[yellow]Multiple partial matches found for '{filter_name}':[/yellow]")
         for match in partial_matches:
@@ -76,15 +89,19 @@ def run_matching_filter(console, filters, filter_name):
         best_match = fuzzy_matches[0][0]
         console.print(f"[yellow]Did you mean '{best_match}'? (y/n)[/yellow]")
         if console.input().lower() == 'y':
-            return run_filter(console, best_match, filters[best_match])
+            return run_filter(console, best_match, filters[best_match], local)
 
     console.print(f"[bold red]Error:[/bold red] No matching filter found for '{filter_name}'.")
     return []
 
-def run_filter(console, filter_name, jql_query):
+def run_filter(console, filter_name, jql_query, local=False):
     console.print(f"[bold cyan]Running filter:[/bold cyan] {filter_name}")
     console.print(f"[bold cyan]JQL Query:[/bold cyan] {jql_query}\n")
-    return perform_jql_search(jql_query, ['key', 'summary', 'status', 'assignee'], max_results=30)
+    fields_to_display = ['key', 'summary', 'status', 'assignee']
+    if local:
+        return perform_jql_search(jql_query, fields_to_display, max_results=30, local=True)
+    return perform_cached_jql_search(jql_query, fields_to_display, max_results=30,
+                                     ttl=get_filter_ttl(filter_name), label=f"filter '{filter_name}'")
 
 def remove_filter(console, filters, filter_name):
     exact_match = filters.get(filter_name)
@@ -122,6 +139,6 @@ def remove_filter(console, filters, filter_name):
 
     console.print(f"[bold red]Error:[/bold red] No matching filter found for '{filter_name}'.")
 
-HELP_TEXT = "Display saved JQL filters, run a specific filter, or remove a filter (Usage: filter [filter_name] | filter rm/del [filter_name])"
+HELP_TEXT = "Display saved JQL filters, run a specific filter, or remove a filter (Usage: filter [--local] [filter_name] | filter rm/del [filter_name] | filter ttl <seconds> [filter_name])"
 ALIASES = ["filters", "f"]
 
@@ -0,0 +1,65 @@
+from rich.console import Console
+from jira.exceptions import JIRAError
+from common.jira_client import get_jira_client
+from common.cache_vid import vid_cache
+from common.records import IssueRecord
+from common.search import search_page
+from common.search_index import search_index
+from common.table import create_jira_table, add_row_to_table, print_table
+
+FIELDS_TO_DISPLAY = ['key', 'summary', 'status', 'assignee']
+MAX_RESULTS = 30
+
+def parse_args(args):
+    remote = '--remote' in args
+    words = [arg for arg in args if arg != '--remote']
+    return ' '.join(words), remote
+
+def local_records(text):
+    records = []
+    for key, summary in search_index.search(text, limit=MAX_RESULTS):
+        issue = vid_cache.store.get(key)
+        fields = issue['fields'] if issue else {'summary': summary}
+        records.append(IssueRecord(key, None, fields))
+    return records
+
+def remote_records(text):
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"')
+    jql_query = f'summary ~ "{escaped}"'
+    return list(search_page(get_jira_client(), jql_query, 0, MAX_RESULTS, FIELDS_TO_DISPLAY[1:], records=True))
+
+def run(args, current_ticket=None):
+    console = Console()
+    text, remote = parse_args(args)
+
+    if not text:
+        console.print("[bold red]Error:[/bold red] Please provide text to search for.")
+        return []
+
+    records = local_records(text)
+    source = "local index"
+    # Nothing cached matches, so the server is the only place left to look
+    if remote or not records:
+        try:
+            known = {record.key for record in records}
+            remote_hits = [record for record in remote_records(text) if record.key not in known]
+            records = (records + remote_hits)[:MAX_RESULTS]
+            source = "local index + Jira" if known else "Jira"
+        except JIRAError as e:
+            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        except Exception as e:
+            console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
+
+    if not records:
+        console.print(f"[yellow]No issues found matching '{text}'.[/yellow]")
+        return []
+
+    table = create_jira_table(f"Search results for '{text}' ({source})", FIELDS_TO_DISPLAY)
+    color_map = {}
+    for record in records:
+        add_row_to_table(table, record, FIELDS_TO_DISPLAY, color_map)
+    print_table(console, table)
+
+    return [record.key for record in records]
+
+HELP_TEXT = "Search cached issue summaries and descriptions (Usage: find <text> [--remote] to also search Jira and merge the results)"
@@ -1,22 +1,13 @@
-import os
-import importlib
 from rich.console import Console
 from common.table import create_jira_table, add_row_to_table, print_table
+from common.command_registry import command_registry
 
 def run(args=None):
     console = Console()
     table = create_jira_table("Available Commands", ["Command", "Description"])
 
-    modules_dir = os.path.dirname(__file__)
-    module_list = []
-    for filename in os.listdir(modules_dir):
-        if filename.endswith('.py') and not filename.startswith('__'):
-            module_name = filename[:-3]
-            module = importlib.import_module(f'modules.{module_name}')
-            help_text = getattr(module, 'HELP_TEXT', "No help text available")
-            module_list.append((module_name, help_text))
-
-    module_list.sort(key=lambda x: x[0])
+    # Help text comes from the command manifest, so no module has to be imported
+    module_list = command_registry.help_entries()
 
     color_map = {}
     for module_name, help_text in module_list:
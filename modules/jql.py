@@ -5,6 +5,9 @@ from common.last_jql import set_last_jql
 def run(args, current_ticket=None):
     console = Console()
 
+    local = '--local' in args
+    args = [arg for arg in args if arg != '--local']
+
     if not args:
         console.print("[bold red]Error:[/bold red] Please provide a JQL query.")
         return []
@@ -13,12 +16,12 @@ def run(args, current_ticket=None):
     fields_to_display = ['key', 'summary', 'status', 'assignee']
 
     try:
-        ticket_ids = perform_jql_search(jql_query, fields_to_display, max_results=30)
+        ticket_ids = perform_jql_search(jql_query, fields_to_display, max_results=30, local=local)
         set_last_jql(jql_query)  # Store the JQL query
         return ticket_ids
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         return []
 
-HELP_TEXT = "Perform a JQL query and display results (Usage: jql <JQL query>)"
+HELP_TEXT = "Perform a JQL query and display results (Usage: jql [--local] <JQL query>; --local answers from the synced issue store)"
 ALIASES = ["j","search"]
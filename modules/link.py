@@ -1,6 +1,10 @@
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
+from common.bulk import split_jql_arg, fetch_targets, run_bulk, print_bulk_summary
+
+DEFAULT_LINK_TYPE = "Relates"
 
 def run(args, current_ticket=None):
     console = Console()
@@ -9,34 +13,75 @@ def run(args, current_ticket=None):
         console.print("[bold red]Error:[/bold red] No current ticket is focused. Use 'vid' command to focus on a ticket first.")
         return
 
-    if not args:
+    target_keys, jql_query, link_type = parse_link_args(args)
+    if not target_keys and not jql_query:
         console.print("[bold red]Error:[/bold red] Please provide a TICKET-ID to link to.")
         return
 
-    target_ticket = args[0].strip().upper()
-
     try:
         jira = get_jira_client()
-        
-        # Check if both tickets exist
-        current_issue = jira.issue(current_ticket)
-        target_issue = jira.issue(target_ticket)
-
-        # Create a link between the two issues
-        jira.create_issue_link(
-            type="Relates",
-            inwardIssue=current_ticket,
-            outwardIssue=target_ticket
-        )
-
-        console.print(f"[bold green]Success:[/bold green] Linked {current_ticket} to {target_ticket}")
-    except JIRAError as e:
-        if e.status_code == 404:
-            console.print(f"[bold red]Error:[/bold red] One or both of the tickets ({current_ticket}, {target_ticket}) do not exist or you don't have permission to access them.")
+        targets, missing, links = fetch_link_context(jira, current_ticket, target_keys, jql_query)
+
+        outcomes = [(key, None, ValueError("Issue does not exist or you don't have permission to access it")) for key in missing]
+        to_link = []
+        for key in targets:
+            if key == current_ticket:
+                outcomes.append((key, None, ValueError("Cannot link a ticket to itself")))
+            elif any(link['key'] == key and link['type'].lower() == link_type.lower() for link in links):
+                outcomes.append((key, f"Already linked ({link_type})", None))
+            else:
+                to_link.append(key)
+
+        if to_link:
+            outcomes += run_bulk(to_link, lambda key: jira.create_issue_link(
+                type=link_type, inwardIssue=current_ticket, outwardIssue=key
+            ), f"Linking {current_ticket}", console=console)
+            issue_context.invalidate(current_ticket)
+
+        if len(outcomes) == 1 and outcomes[0][2] is None and outcomes[0][1] is None:
+            console.print(f"[bold green]Success:[/bold green] Linked {current_ticket} to {outcomes[0][0]}")
         else:
-            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+            print_bulk_summary(console, f"Links from {current_ticket} ({link_type})", outcomes, success_text="Linked")
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] An unexpected error occurred: {str(e)}")
 
-HELP_TEXT = "Link the current ticket to another ticket (Usage: link <TICKET-ID>)"
+def parse_link_args(args, default_type=DEFAULT_LINK_TYPE):
+    """Return (target keys, JQL query or None, link type) from 'KEY... [--type NAME] [--jql QUERY]'."""
+    args, jql_query = split_jql_arg(args)
+    link_type = default_type
+    if '--type' in args:
+        index = args.index('--type')
+        if index + 1 < len(args):
+            link_type = args[index + 1]
+        del args[index:index + 2]
+    return [arg.strip().upper() for arg in args], jql_query, link_type
+
+def fetch_link_context(jira, current_ticket, target_keys, jql_query=None):
+    """Validate the targets and read the focused ticket's links, in one search when keys are given.
+
+    Returns (existing target keys, missing target keys, [{'id', 'key', 'type'}] links of the ticket).
+    """
+    if jql_query:
+        targets = [issue.key for issue in fetch_targets(jql_query=jql_query, fields='summary', jira=jira)]
+        records = fetch_targets([current_ticket], fields='issuelinks', jira=jira)
+    else:
+        records = fetch_targets(target_keys + [current_ticket], fields='issuelinks', jira=jira)
+        found = {record.key for record in records}
+        targets = [key for key in dict.fromkeys(target_keys) if key in found]
+
+    current = next((record for record in records if record.key == current_ticket), None)
+    if current is None:
+        raise ValueError(f"The current ticket {current_ticket} does not exist or you don't have permission to access it.")
+
+    links = []
+    for link in current.fields.get('issuelinks') or []:
+        linked_issue = link.get('outwardIssue') or link.get('inwardIssue')
+        if linked_issue:
+            links.append({'id': link['id'], 'key': linked_issue['key'], 'type': link['type']['name']})
+
+    missing = [] if jql_query else [key for key in dict.fromkeys(target_keys) if key not in targets]
+    return targets, missing, links
 
+HELP_TEXT = "Link the current ticket to other tickets (Usage: link <TICKET-ID>... [--type <link type>] | link [--type <link type>] --jql <JQL query>)"
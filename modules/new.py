@@ -3,14 +3,15 @@ from rich.table import Table
 from rich.text import Text
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.project_catalog import project_catalog
+from common.issue_import import read_rows, validate_rows, create_batch, default_output_path, write_results, CREATE_BATCH_SIZE
+from common.bulk import run_bulk, error_message
+from common.utils import confirm_action
 from modules import vid
 
 def get_valid_issue_types():
     try:
-        jira = get_jira_client()
-        issue_types = jira.issue_types()
-        # Sort issue types alphabetically and remove duplicates
-        unique_sorted_types = sorted(set(issue_type.name for issue_type in issue_types))
+        unique_sorted_types = project_catalog.issue_type_names()
         # Create a 2D list with 3 columns
         return [unique_sorted_types[i:i+3] for i in range(0, len(unique_sorted_types), 3)]
     except Exception:
@@ -19,8 +20,12 @@ def get_valid_issue_types():
 def run(args, current_ticket=None):
     console = Console()
 
+    if args and args[0] == '--from':
+        return import_issues(console, args[1:])
+
     if len(args) == 0:
         console.print("[bold cyan]Usage:[/bold cyan] new <PROJECT-ID> <TYPE> <SUMMARY>")
+        console.print("[bold cyan]       [/bold cyan] new --from <file.csv|file.ndjson> [--out <file.csv>]")
         console.print("\n[bold cyan]Valid issue types:[/bold cyan]")
         
         table = Table(show_header=False, box=None)
@@ -43,7 +48,7 @@ def run(args, current_ticket=None):
         jira = get_jira_client()
 
         # Verify if the issue type exists
-        valid_types = [t.name for t in jira.issue_types()]
+        valid_types = project_catalog.issue_type_names()
         if issue_type not in valid_types:
             console.print(f"[bold red]Error:[/bold red] Invalid issue type '{issue_type}'.")
             console.print("Valid issue types:")
@@ -78,4 +83,55 @@ def run(args, current_ticket=None):
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
 
-HELP_TEXT = "Create a new Jira ticket and display its details (Usage: new <PROJECT-ID> <TYPE> <SUMMARY>)"
+def import_issues(console, args):
+    """Create one issue per row of a CSV or NDJSON file, in concurrent batches through the bulk endpoint."""
+    if not args:
+        console.print("[bold red]Error:[/bold red] Usage: new --from <file.csv|file.ndjson> [--out <file.csv>]")
+        return
+    path = args[0]
+    output_path = args[args.index('--out') + 1] if '--out' in args[:-1] else default_output_path(path)
+
+    try:
+        rows = validate_rows(read_rows(path))
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Error:[/bold red] Unable to read {path}: {str(e)}")
+        return
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        return
+
+    valid = [row for row in rows if row.error is None]
+    invalid = [row for row in rows if row.error is not None]
+    console.print(f"[bold cyan]{len(valid)} of {len(rows)} row(s) are valid.[/bold cyan]")
+    print_row_errors(console, "Invalid rows", invalid)
+    if not valid or not confirm_action(f"Create {len(valid)} issue(s)?", default=False):
+        return
+
+    jira = get_jira_client()
+    batches = [valid[i:i + CREATE_BATCH_SIZE] for i in range(0, len(valid), CREATE_BATCH_SIZE)]
+    outcomes = run_bulk(list(range(len(batches))), lambda index: create_batch(jira, batches[index]),
+                        f"Creating {len(valid)} issue(s)", console=console)
+    for index, _, error in outcomes:
+        if error is not None:
+            # The whole request failed, so none of the batch's rows were created
+            for row in batches[index]:
+                row.error = error_message(error)
+
+    created = [row for row in valid if row.key]
+    print_row_errors(console, "Rows that failed", [row for row in valid if not row.key])
+    write_results(output_path, rows)
+    console.print(f"[bold green]Created {len(created)} of {len(rows)} issue(s).[/bold green] Keys written to {output_path}")
+    return [row.key for row in created] or None
+
+def print_row_errors(console, title, rows):
+    if not rows:
+        return
+    table = Table(title=title)
+    table.add_column("Row", style="cyan")
+    table.add_column("Summary")
+    table.add_column("Error", style="red")
+    for row in rows:
+        table.add_row(str(row.number), str(row.values.get('summary', '')), row.error)
+    console.print(table)
+
+HELP_TEXT = "Create a new Jira ticket and display its details, or many from a file (Usage: new <PROJECT-ID> <TYPE> <SUMMARY> | new --from <file.csv|file.ndjson> [--out <file.csv>])"
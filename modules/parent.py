@@ -1,6 +1,7 @@
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -22,6 +23,7 @@ def run(args, current_ticket=None):
             if epic_issue.fields.issuetype.name.lower() == 'epic':
                 # Associate the current ticket with the epic
                 jira.add_issues_to_epic(epic_key, [current_ticket])
+                issue_context.invalidate(current_ticket)
                 console.print(f"[bold green]Successfully associated {current_ticket} with epic {epic_key}[/bold green]")
                 return current_ticket
             else:
@@ -2,6 +2,7 @@ from rich.console import Console
 from common.jira_client import get_jira_client
 from common.cache_vid import vid_cache
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -22,6 +23,7 @@ def run(args, current_ticket=None):
 
         # Update the issue summary
         issue.update(summary=new_summary)
+        issue_context.invalidate(current_ticket)
         console.print(f"[bold green]Successfully updated summary for {current_ticket}[/bold green]")
 
         # Update the cache
@@ -3,6 +3,7 @@ import webbrowser
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.search import search_all
 import json
 import csv
 import xml.etree.ElementTree as ET
@@ -36,8 +37,9 @@ def run(args, current_ticket=None):
         issue = jira.issue(current_ticket, expand='comments,subtasks,attachments')
         
         # Fetch additional information
-        child_tasks = jira.search_issues(f'parent = {current_ticket}')
-        related_issues = jira.search_issues(f'issue in linkedIssues("{current_ticket}")')
+        # Exports only need key and summary from these searches
+        child_tasks = search_all(f'parent = {current_ticket}', fields='summary', jira=jira, records=True)
+        related_issues = search_all(f'issue in linkedIssues("{current_ticket}")', fields='summary', jira=jira, records=True)
 
         # Create reports directory if it doesn't exist
         reports_dir = os.path.join(os.getcwd(), 'reports')
@@ -6,17 +6,21 @@ from rich.table import Table
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
 from modules import jql
-from rapidfuzz import process, fuzz
 from common.utils import confirm_action
 from jira import JIRA
-from common.jql import perform_jql_search
+from common.jql import perform_jql_search, perform_cached_jql_search
+from common.jql_filters import get_filter_ttl, set_filter_ttl
+from common.filter_cache import favourite_filters, FUZZY_CUTOFF
 
 def run(args, current_ticket=None):
     console = Console()
-    jira = get_jira_client()
+    local = '--local' in args
+    args = [arg for arg in args if arg != '--local']
 
     try:
-        filters = jira.favourite_filters()
+        # Cached with a TTL; the name index is built once per fetched list
+        filters = favourite_filters.get()
+        index = favourite_filters.index()
     except JIRAError as e:
         console.print(f"[bold red]Error:[/bold red] Unable to fetch filters: {str(e)}")
         return []
@@ -32,16 +36,25 @@ def run(args, current_ticket=None):
         if len(args) < 2:
             console.print("[bold red]Error:[/bold red] Please specify a filter name to remove.")
         else:
-            remove_filter(console, jira, filters, ' '.join(args[1:]))
+            remove_filter(console, get_jira_client(), index, ' '.join(args[1:]))
+        return []
+    elif args[0].lower() == 'ttl':
+        if len(args) < 3 or not args[1].isdigit():
+            console.print("[bold red]Error:[/bold red] Usage: rfilter ttl <seconds> <filter_name>")
+            return []
+        matching_filter = find_matching_filter(console, index, ' '.join(args[2:]))
+        if matching_filter:
+            set_filter_ttl(matching_filter.name, int(args[1]))
+            console.print(f"[bold green]Results of '{matching_filter.name}' will be reused for {args[1]} seconds.[/bold green]")
         return []
     elif args[0].lower() == 'edit':
         if len(args) < 2:
             console.print("[bold red]Error:[/bold red] Please specify a filter name to edit.")
         else:
-            return run_matching_filter(console, jira, filters, ' '.join(args[1:]), edit_mode=True)
+            return run_matching_filter(console, get_jira_client(), index, ' '.join(args[1:]), edit_mode=True)
     else:
         filter_name = ' '.join(args)
-        return run_matching_filter(console, jira, filters, filter_name)
+        return run_matching_filter(console, None, index, filter_name, local=local)
 
 def show_filters_table(console, filters):
     table = Table(title="Saved Jira Filters")
@@ -55,27 +68,33 @@ def show_filters_table(console, filters):
 
     console.print(table)
 
-def run_matching_filter(console, jira, filters, filter_name, edit_mode=False):
-    matching_filter = find_matching_filter(console, filters, filter_name)
+def run_matching_filter(console, jira, index, filter_name, edit_mode=False, local=False):
+    matching_filter = find_matching_filter(console, index, filter_name)
     if matching_filter:
         if edit_mode:
             edit_filter(console, jira, matching_filter)
             return []
         else:
-            return run_filter(console, matching_filter)
+            return run_filter(console, matching_filter, local)
     return []
 
-def remove_filter(console, jira, filters, filter_name):
-    best_match = process.extractOne(filter_name, [f.name for f in filters], scorer=fuzz.ratio)
-    if best_match and best_match[1] > 80:  # 80% similarity threshold
-        matching_filter = next(f for f in filters if f.name == best_match[0])
-        
+def remove_filter(console, jira, index, filter_name):
+    matching_filter = index.exact(filter_name)
+    if not matching_filter:
+        best_match = index.fuzzy(filter_name, limit=1)
+        if best_match and best_match[0][1] > FUZZY_CUTOFF:
+            matching_filter = best_match[0][0]
+
+    if matching_filter:
         if confirm_action(f"Are you sure you want to delete the filter '{matching_filter.name}'?"):
             try:
-                matching_filter.delete()
+                jira.filter(matching_filter.id).delete()
+                favourite_filters.invalidate()
                 console.print(f"[bold green]Successfully deleted filter: {matching_filter.name}[/bold green]")
             except AttributeError:
                 console.print("[bold red]Error:[/bold red] Unable to delete the filter. The JIRA API might have changed.")
+            except JIRAError as e:
+                console.print(f"[bold red]Error deleting filter:[/bold red] {str(e)}")
         else:
             console.print("[yellow]Filter deletion cancelled.[/yellow]")
     else:
@@ -94,20 +113,21 @@ def edit_filter(console, jira, filter):
     if new_jql != filter.jql:
         try:
             jira.update_filter(filter.id, jql=new_jql)
+            favourite_filters.invalidate()
             console.print(f"[bold green]Successfully updated filter '{filter.name}'[/bold green]")
         except JIRAError as e:
             console.print(f"[bold red]Error updating filter:[/bold red] {str(e)}")
     else:
         console.print("[yellow]No changes made to the filter.[/yellow]")
 
-def find_matching_filter(console, filters, filter_name):
+def find_matching_filter(console, index, filter_name):
     # Exact match
-    exact_match = next((f for f in filters if f.name.lower() == filter_name.lower()), None)
+    exact_match = index.exact(filter_name)
     if exact_match:
         return exact_match
 
     # Partial matching
-    partial_matches = [f for f in filters if filter_name.lower() in f.name.lower()]
+    partial_matches = index.partial(filter_name)
     if len(partial_matches) == 1:
         return partial_matches[0]
     elif len(partial_matches) > 1:
@@ -117,10 +137,9 @@ def find_matching_filter(console, filters, filter_name):
         return None
 
     # Fuzzy matching
-    filter_names = [f.name for f in filters]
-    fuzzy_matches = process.extract(filter_name, filter_names, scorer=fuzz.WRatio, limit=3)
-    if fuzzy_matches and fuzzy_matches[0][1] >= 80:  # Check if there's a match and its score is >= 80
-        best_match = next(f for f in filters if f.name == fuzzy_matches[0][0])
+    fuzzy_matches = index.fuzzy(filter_name, limit=3)
+    if fuzzy_matches and fuzzy_matches[0][1] >= FUZZY_CUTOFF:
+        best_match = fuzzy_matches[0][0]
         console.print(f"[yellow]Did you mean '{best_match.name}'? (y/n)[/yellow]")
         if console.input().lower() == 'y':
             return best_match
@@ -128,10 +147,14 @@ def find_matching_filter(console, filters, filter_name):
     console.print(f"[bold red]Error:[/bold red] No matching filter found for '{filter_name}'.")
     return None
 
-def run_filter(console, filter):
+def run_filter(console, filter, local=False):
     console.print(f"[bold cyan]Running filter:[/bold cyan] {filter.name}")
     console.print(f"[bold cyan]JQL Query:[/bold cyan] {filter.jql}\n")
-    return perform_jql_search(filter.jql, ['key', 'summary', 'status', 'assignee'], max_results=30)
+    fields_to_display = ['key', 'summary', 'status', 'assignee']
+    if local:
+        return perform_jql_search(filter.jql, fields_to_display, max_results=30, local=True)
+    return perform_cached_jql_search(filter.jql, fields_to_display, max_results=30,
+                                     ttl=get_filter_ttl(filter.name), label=f"filter '{filter.name}'")
 
-HELP_TEXT = "Display saved remote JQL filters, run a specific filter, edit a filter, or remove a filter (Usage: rfilter [filter_name] | rfilter edit [filter_name] | rfilter rm/del [filter_name])"
+HELP_TEXT = "Display saved remote JQL filters, run a specific filter, edit a filter, or remove a filter (Usage: rfilter [--local] [filter_name] | rfilter edit [filter_name] | rfilter ttl <seconds> [filter_name] | rfilter rm/del [filter_name])"
 ALIASES = ["rfilters", "rf"]
@@ -4,8 +4,14 @@ from rich.box import HEAVY_EDGE
 from rich.text import Text
 from rich.style import Style
 from common.jira_client import get_jira_client
+from common.status_catalog import status_catalog
+from common.cache_vid import vid_cache
+from common.search import search_all
 from jira.exceptions import JIRAError
 import hashlib
+import os
+
+EPIC_LINK_FIELD_ID = os.getenv('EPIC_LINK_FIELD_ID', 'customfield_10014')
 
 def get_color_and_emoji_for_assignee(assignee):
     colors = ["red", "green", "blue", "magenta", "cyan", "yellow", "white"]
@@ -15,13 +21,7 @@ def get_color_and_emoji_for_assignee(assignee):
     hash_value = int(hashlib.md5(assignee.encode()).hexdigest(), 16)
     return colors[hash_value % len(colors)], emojis[hash_value % len(emojis)]
 
-def get_status_category(jira, status_name):
-    for status_type in jira.statuses():
-        if status_type.name == status_name:
-            return status_type.statusCategory.name
-    return "Unknown"
-
-def sort_statuses(jira, statuses):
+def sort_statuses(statuses):
     status_order = {"To Do": 0, "In Progress": 1, "Done": 2}
     backlog_statuses = []
     todo_statuses = []
@@ -29,7 +29,7 @@ def sort_statuses(jira, statuses):
     done_statuses = []
     
     for status in statuses:
-        category = get_status_category(jira, status)
+        category = status_catalog.category_for(status)
         if status.lower() == "backlog":
             backlog_statuses.append(status)
         elif category == "To Do":
@@ -67,22 +67,19 @@ def run(args, current_ticket=None):
 
         active_sprint = all_sprints[0]
 
-        # Get all issues in the active sprint
+        # Get all issues in the active sprint, projected to the fields the board shows
         jql_query = f'sprint = {active_sprint.id} ORDER BY status ASC'
-        issues = jira.search_issues(jql_query, maxResults=False)
+        fields = ['summary', 'status', 'assignee', EPIC_LINK_FIELD_ID]
+        issues = search_all(jql_query, fields=fields, jira=jira, records=True)
 
         # Group issues by epic and status
         epics = {}
         statuses = set()
-        epic_summaries = {}
         ticket_ids = []
         assignees = set()
         for issue in issues:
-            epic_link = getattr(issue.fields, 'customfield_10014', 'No Epic')  # Adjust field name if needed
-            if epic_link and epic_link != 'No Epic' and epic_link not in epic_summaries:
-                epic_issue = jira.issue(epic_link)
-                epic_summaries[epic_link] = epic_issue.fields.summary
-            status = issue.fields.status.name
+            epic_link = getattr(issue.fields, EPIC_LINK_FIELD_ID, None) or 'No Epic'
+            status = issue.fields.status
             if epic_link not in epics:
                 epics[epic_link] = {}
             if status not in epics[epic_link]:
@@ -90,11 +87,13 @@ def run(args, current_ticket=None):
             epics[epic_link][status].append(issue)
             statuses.add(status)
             ticket_ids.append(issue.key)
-            assignee = issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned"
-            assignees.add(assignee)
+            assignees.add(issue.fields.assignee or "Unassigned")
+
+        # Resolve every epic summary in one search (or none when the issue store is warm)
+        epic_summaries = vid_cache.get_summaries([epic for epic in epics if epic != 'No Epic'])
 
         # Sort statuses
-        sorted_statuses = sort_statuses(jira, statuses)
+        sorted_statuses = sort_statuses(statuses)
 
         # Create assignee color and emoji key
         assignee_key = Text()
@@ -128,7 +127,7 @@ def run(args, current_ticket=None):
             for status in sorted_statuses:
                 cell_content = []
                 for issue in status_issues.get(status, []):
-                    assignee = issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned"
+                    assignee = issue.fields.assignee or "Unassigned"
                     color, emoji = assignee_info[assignee]
                     cell_content.append(Text(f"{emoji} {issue.key}: {issue.fields.summary}", style=color))
                 row.append(Text("\n").join(cell_content))
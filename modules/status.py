@@ -1,27 +1,41 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 from common.cache_vid import vid_cache
+from common.transitions import transition_cache
+from common.last_tickets import get_last_tickets
+from common.utils import confirm_action
+from common.bulk import split_target_args, fetch_targets, run_bulk, print_bulk_summary, BULK_WORKERS
 
 def run(args, current_ticket=None):
     console = Console()
 
+    args, jql_query, use_last = split_target_args(args)
+    if jql_query or use_last:
+        issue_keys = None if jql_query else get_last_tickets()
+        if use_last and not issue_keys:
+            console.print("[bold red]Error:[/bold red] No tickets have been displayed yet.")
+            return
+        return bulk_transition(console, ' '.join(args), jql_query, issue_keys)
+
     if not current_ticket:
         console.print("[bold red]Error:[/bold red] No current ticket is focused. Use 'vid' command to focus on a ticket first.")
         return
 
     try:
         jira = get_jira_client()
-        issue = jira.issue(current_ticket)
 
-        # Get available transitions
-        transitions = jira.transitions(issue)
+        # Get available transitions (usually already prefetched when the ticket was focused)
+        entry = transition_cache.get_or_fetch(current_ticket)
+        transitions = entry['transitions']
 
         if not args:
             # Display available transitions
             console.print(f"[bold cyan]Available status transitions for {current_ticket}:[/bold cyan]")
-            current_status = issue.fields.status.name.lower()
+            current_status = entry['status'].lower()
             for t in transitions:
                 status_name = t['name']
                 if status_name.lower() == current_status:
@@ -32,21 +46,24 @@ def run(args, current_ticket=None):
 
         new_status = ' '.join(args).lower()
 
-        # Find the matching transition
-        transition_id = None
-        for t in transitions:
-            if t['name'].lower() == new_status:
-                transition_id = t['id']
-                break
+        # Find the matching transition, re-reading once in case the cached list is out of date
+        transition = find_transition(transitions, new_status)
+        if not transition and transition_cache.get_entry(current_ticket):
+            transitions = transition_cache.fetch(current_ticket)['transitions']
+            transition = find_transition(transitions, new_status)
 
-        if transition_id:
+        if transition:
             # Perform the transition
-            jira.transition_issue(issue, transition_id)
+            jira.transition_issue(current_ticket, transition['id'])
             console.print(f"[bold green]Successfully updated status of {current_ticket} to '{new_status}'[/bold green]")
-            
-            # Update the cache for the current ticket
-            updated_issue = jira.issue(current_ticket)
-            vid_cache._update_cache(current_ticket, updated_issue)
+
+            # The status changed, so the cached transitions no longer apply
+            transition_cache.invalidate(current_ticket)
+            issue_context.invalidate(current_ticket)
+            transition_cache.prefetch(current_ticket)
+
+            # We know the new status, so patch the cached issue instead of fetching it again
+            vid_cache.patch_many({current_ticket: {'status': transition.get('to') or transition['name']}})
         else:
             console.print(f"[bold red]Error:[/bold red] Invalid status '{new_status}'. Use 'status' without arguments to see available options.")
 
@@ -55,4 +72,82 @@ def run(args, current_ticket=None):
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
 
-HELP_TEXT = "Set or view the status of the current ticket (Usage: status [NEW_STATUS])"
+def find_transition(transitions, status_name):
+    # Accept either the transition's own name or the status it leads to
+    for t in transitions:
+        if t['name'].lower() == status_name:
+            return t
+    for t in transitions:
+        if (t.get('to') or '').lower() == status_name:
+            return t
+    return None
+
+def bulk_transition(console, target, jql_query=None, issue_keys=None):
+    if not target:
+        console.print("[bold red]Error:[/bold red] Please specify the status to move the issues to.")
+        return
+
+    try:
+        jira = get_jira_client()
+        issues = fetch_targets(issue_keys, jql_query, fields=['status', 'issuetype'], jira=jira)
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        return
+
+    target_lower = target.lower()
+    pending = [issue for issue in issues if str(issue.fields.get('status', '')).lower() != target_lower]
+    if len(pending) < len(issues):
+        console.print(f"[yellow]{len(issues) - len(pending)} issue(s) are already in '{target}'.[/yellow]")
+    if not pending:
+        console.print("[yellow]No issues to transition.[/yellow]")
+        return
+
+    # Issues of one project, type and status share a workflow step, so their transitions are looked up once
+    groups = {}
+    for issue in pending:
+        group = (issue.key.split('-')[0], issue.fields.get('issuetype'), issue.fields.get('status'))
+        groups.setdefault(group, []).append(issue)
+
+    with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+        lookups = list(executor.map(lambda group: lookup_transitions(jira, groups[group][0].key), groups))
+
+    plan = {}
+    failures = {}
+    for group, (transitions, error) in zip(groups, lookups):
+        transition = find_transition(transitions, target_lower) if transitions is not None else None
+        if error is None and transition is None:
+            error = ValueError(f"No transition to '{target}' from '{group[2]}' for {group[1]} issues in {group[0]}")
+        for issue in groups[group]:
+            if error is not None:
+                failures[issue.key] = error
+            else:
+                plan[issue.key] = transition
+
+    console.print(f"[cyan]{len(plan)} issue(s) across {len(groups)} workflow step(s) can move to '{target}'.[/cyan]")
+    if plan and not confirm_action(f"Transition {len(plan)} issue(s) to '{target}'?", default=False):
+        console.print("[yellow]Status change cancelled.[/yellow]")
+        return
+
+    outcomes = []
+    if plan:
+        outcomes = run_bulk(list(plan), lambda issue_key: jira.transition_issue(issue_key, plan[issue_key]['id']),
+                            f"Moving issues to '{target}'", console=console)
+
+    moved = [issue_key for issue_key, _, error in outcomes if error is None]
+    vid_cache.patch_many({issue_key: {'status': plan[issue_key].get('to') or target} for issue_key in moved})
+    for issue_key in moved:
+        transition_cache.invalidate(issue_key)
+        issue_context.invalidate(issue_key)
+
+    outcomes += [(issue_key, None, error) for issue_key, error in failures.items()]
+    print_bulk_summary(console, f"Status changes to '{target}'", outcomes, success_text="Moved")
+    return moved
+
+def lookup_transitions(jira, issue_key):
+    try:
+        transitions = jira.transitions(issue_key)
+        return [{'id': t['id'], 'name': t['name'], 'to': t.get('to', {}).get('name')} for t in transitions], None
+    except Exception as e:
+        return None, e
+
+HELP_TEXT = "Set or view the status of the current ticket (Usage: status [NEW_STATUS] | status <NEW_STATUS> --jql <JQL query> | status --last <NEW_STATUS> for the last displayed tickets)"
@@ -0,0 +1,81 @@
+from rich.console import Console
+from rich.table import Table
+from common.sync import sync_project, tracked_projects, get_sync_state, background_sync
+from jira.exceptions import JIRAError
+
+def run(args, current_ticket=None):
+    console = Console()
+
+    if args and args[0].lower() == 'status':
+        show_sync_status(console)
+        return []
+
+    if args and args[0] == '--stop':
+        if background_sync.is_running():
+            background_sync.stop()
+            console.print("[bold green]Background sync stopped.[/bold green]")
+        else:
+            console.print("[yellow]Background sync is not running.[/yellow]")
+        return []
+
+    full = '--full' in args
+    watch = '--watch' in args
+    interval = None
+    projects = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--interval' and i + 1 < len(args):
+            try:
+                interval = int(args[i + 1])
+            except ValueError:
+                console.print(f"[bold red]Error:[/bold red] Invalid interval '{args[i + 1]}'.")
+                return []
+            i += 1
+        elif not arg.startswith('--'):
+            projects.append(arg.upper())
+        i += 1
+
+    if not projects:
+        projects = tracked_projects()
+    if not projects and current_ticket:
+        projects = [current_ticket.split('-')[0]]
+    if not projects:
+        console.print("[bold red]Error:[/bold red] Please provide a PROJECT ID to sync (Usage: sync <PROJECT-ID>...)")
+        return []
+
+    if watch:
+        background_sync.start(projects, interval)
+        console.print(f"[bold green]Background sync started for {', '.join(projects)} every {background_sync.interval}s.[/bold green]")
+        return []
+
+    for project in projects:
+        try:
+            with console.status(f"[cyan]Syncing {project}...[/cyan]") as status:
+                count = sync_project(project, full=full, on_page=lambda n: status.update(f"[cyan]Syncing {project}... {n} issues[/cyan]"))
+            console.print(f"[bold green]Synced {project}:[/bold green] {count} updated issues")
+        except JIRAError as e:
+            console.print(f"[bold red]Error syncing {project}:[/bold red] {str(e)}")
+        except Exception as e:
+            console.print(f"[bold red]An unexpected error occurred while syncing {project}:[/bold red] {str(e)}")
+    return []
+
+def show_sync_status(console):
+    table = Table(title="Issue Cache Sync")
+    table.add_column("Project", style="magenta")
+    table.add_column("Last Sync", style="green")
+    table.add_column("Issues in Last Run", style="cyan")
+
+    for project in tracked_projects():
+        state = get_sync_state(project)
+        table.add_row(project, state['last_sync'], str(state.get('last_count', 0)))
+
+    console.print(table)
+    if background_sync.is_running():
+        console.print(f"[green]Background sync running for {', '.join(background_sync.projects)} every {background_sync.interval}s.[/green]")
+    else:
+        console.print("[yellow]Background sync is not running.[/yellow]")
+    if background_sync.last_error:
+        console.print(f"[bold red]Last background sync error:[/bold red] {background_sync.last_error}")
+
+HELP_TEXT = "Sync issues updated since the last run into the local cache (Usage: sync [PROJECT-ID...] [--full] | sync --watch [--interval SECONDS] [PROJECT-ID...] | sync --stop | sync status)"
@@ -1,6 +1,9 @@
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
+from common.bulk import run_bulk, print_bulk_summary
+from modules.link import parse_link_args, fetch_link_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -9,39 +12,42 @@ def run(args, current_ticket=None):
         console.print("[bold red]Error:[/bold red] No current ticket is focused. Use 'vid' command to focus on a ticket first.")
         return None
 
-    if not args:
+    target_keys, jql_query, link_type = parse_link_args(args, default_type=None)
+    if not target_keys and not jql_query:
         console.print("[bold red]Error:[/bold red] Please provide a ticket ID to unlink from.")
         return None
 
     try:
         jira = get_jira_client()
-        issue = jira.issue(current_ticket)
-        target_key = args[0].strip().upper()
+        targets, missing, links = fetch_link_context(jira, current_ticket, target_keys, jql_query)
 
-        # Check if the target ticket exists
-        try:
-            target_issue = jira.issue(target_key)
-        except JIRAError:
+        for target_key in missing:
             console.print(f"[bold red]Error:[/bold red] The ticket {target_key} does not exist.")
-            return None
 
-        # Check if the current ticket is linked to the target ticket
-        link_to_remove = None
-        for link in issue.fields.issuelinks:
-            if hasattr(link, 'outwardIssue') and link.outwardIssue.key == target_key:
-                link_to_remove = link
-                break
-            elif hasattr(link, 'inwardIssue') and link.inwardIssue.key == target_key:
-                link_to_remove = link
-                break
-
-        if not link_to_remove:
-            console.print(f"[bold yellow]The current ticket {current_ticket} is not linked to {target_key}.[/bold yellow]")
+        # Without --type every link between the two tickets goes, whatever its type or direction
+        link_ids = {}
+        for link in links:
+            if link['key'] in targets and (link_type is None or link['type'].lower() == link_type.lower()):
+                link_ids.setdefault(link['key'], []).append(link['id'])
+
+        not_linked = [key for key in targets if key not in link_ids]
+        link_description = f" by a '{link_type}' link" if link_type else ""
+        for target_key in not_linked:
+            console.print(f"[bold yellow]The current ticket {current_ticket} is not linked to {target_key}{link_description}.[/bold yellow]")
+        if not link_ids:
             return None
 
-        # Unlink the tickets
-        jira.delete_issue_link(link_to_remove.id)
-        console.print(f"[bold green]Successfully unlinked {current_ticket} from {target_key}[/bold green]")
+        def delete_links(target_key):
+            for link_id in link_ids[target_key]:
+                jira.delete_issue_link(link_id)
+
+        outcomes = run_bulk(list(link_ids), delete_links, f"Unlinking {current_ticket}", console=console)
+        issue_context.invalidate(current_ticket)
+
+        if len(outcomes) == 1 and outcomes[0][2] is None:
+            console.print(f"[bold green]Successfully unlinked {current_ticket} from {outcomes[0][0]}[/bold green]")
+        else:
+            print_bulk_summary(console, f"Links removed from {current_ticket}", outcomes, success_text="Unlinked")
 
     except JIRAError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -50,4 +56,4 @@ def run(args, current_ticket=None):
 
     return current_ticket
 
-HELP_TEXT = "Unlink the currently focused ticket from the specified ticket (Usage: unlink TICKET-ID)"
+HELP_TEXT = "Unlink the currently focused ticket from the specified tickets (Usage: unlink [--type NAME] TICKET-ID... | unlink [--type NAME] --jql <JQL query>)"
@@ -4,7 +4,9 @@ import subprocess
 from rich.console import Console
 from common.jira_client import get_jira_client
 from common.cache_vid import vid_cache
+from common.field_cache import field_cache
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 
 def run(args, current_ticket=None):
     console = Console()
@@ -39,6 +41,7 @@ def run(args, current_ticket=None):
         if updated_description != current_description:
             try:
                 update_description(jira, issue, updated_description)
+                issue_context.invalidate(current_ticket)
                 console.print(f"[bold green]Successfully updated description for {current_ticket}[/bold green]")
                 
                 # Update the cache
@@ -60,9 +63,8 @@ def get_description(jira, issue):
         return issue.fields.description
 
     # If standard description is not available, look for a custom field
-    custom_fields = [field for field in jira.fields() if 'description' in field['name'].lower()]
-    for field in custom_fields:
-        value = getattr(issue.fields, field['id'], None)
+    for field_id in field_cache.description_field_ids():
+        value = getattr(issue.fields, field_id, None)
         if value:
             return value
 
@@ -75,10 +77,9 @@ def update_description(jira, issue, new_description):
     except JIRAError as je:
         if "Field 'description' cannot be set" in str(je):
             # If standard update fails, look for a custom description field
-            custom_fields = [field for field in jira.fields() if 'description' in field['name'].lower()]
-            for field in custom_fields:
+            for field_id in field_cache.description_field_ids():
                 try:
-                    issue.update(fields={field['id']: new_description})
+                    issue.update(fields={field_id: new_description})
                     return  # Exit the function if update is successful
                 except JIRAError:
                     continue  # Try the next custom field if this one fails
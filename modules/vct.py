@@ -1,8 +1,11 @@
 from rich.console import Console
 from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.search import search_all
 from common.table import create_jira_table, add_row_to_table, print_table
 
+FIELDS_TO_DISPLAY = ['key', 'summary', 'status', 'assignee']
+
 def run(args, current_ticket=None):
     console = Console()
 
@@ -12,26 +15,8 @@ def run(args, current_ticket=None):
 
     try:
         jira = get_jira_client()
-        issue = jira.issue(current_ticket)
-
-        jql_query = f'parent = {current_ticket} ORDER BY created DESC'
-        child_issues = jira.search_issues(jql_query)
-
-        if not child_issues:
-            console.print(f"[yellow]No child tasks found for {current_ticket}.[/yellow]")
-            return []
-
-        fields_to_display = ['key', 'summary', 'status', 'assignee']
-        table = create_jira_table(f"Child Tasks for {current_ticket}", fields_to_display)
-        color_map = {}
-
-        ticket_ids = []
-        for child in child_issues:
-            add_row_to_table(table, child, fields_to_display, color_map)
-            ticket_ids.append(child.key)
-
-        print_table(console, table)
-        return ticket_ids
+        child_issues = fetch_child_tasks(jira, current_ticket)
+        return display_child_tasks(console, current_ticket, child_issues)
 
     except JIRAError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -39,4 +24,24 @@ def run(args, current_ticket=None):
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
     return []
 
+def fetch_child_tasks(jira, issue_key):
+    jql_query = f'parent = {issue_key} ORDER BY created DESC'
+    return search_all(jql_query, fields=FIELDS_TO_DISPLAY[1:], jira=jira, records=True)
+
+def display_child_tasks(console, issue_key, child_issues):
+    if not child_issues:
+        console.print(f"[yellow]No child tasks found for {issue_key}.[/yellow]")
+        return []
+
+    table = create_jira_table(f"Child Tasks for {issue_key}", FIELDS_TO_DISPLAY)
+    color_map = {}
+
+    ticket_ids = []
+    for child in child_issues:
+        add_row_to_table(table, child, FIELDS_TO_DISPLAY, color_map)
+        ticket_ids.append(child.key)
+
+    print_table(console, table)
+    return ticket_ids
+
 HELP_TEXT = "View child tasks for the current ticket"
@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
-from modules import va, vid, vct, vli, vic
-from common.utils import clear_screen  # Add this line if vft.py uses clear_screen
+from common.jira_client import get_jira_client
+from jira.exceptions import JIRAError
+from common.issue_context import issue_context
+from modules import va, vct, vli, vic
 
 def run(args, current_ticket=None):
     console = Console()
@@ -11,26 +14,47 @@ def run(args, current_ticket=None):
 
     console.print(f"[bold cyan]Viewing full details for ticket: {current_ticket}[/bold cyan]\n")
 
+    try:
+        jira = get_jira_client()
+        # The child-task search runs alongside the issue fetch on the shared connection pool
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Usually already warm from the background prefetch done when the ticket was focused
+            issue_future = executor.submit(issue_context.get_or_fetch, current_ticket)
+            children_future = executor.submit(vct.fetch_child_tasks, jira, current_ticket)
+            issue = issue_future.result()
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        return []
+    except Exception as e:
+        console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
+        return []
+
     ticket_ids = [current_ticket]
 
-    # Run vli
+    # Linked issues
     console.print("[bold magenta]Linked Issues:[/bold magenta]")
-    ticket_ids.extend(vli.run([], current_ticket))
+    ticket_ids.extend(vli.display_linked_issues(console, issue))
     console.print()
 
-    # Run va
+    # Attachments
     console.print("[bold magenta]Attachments:[/bold magenta]")
-    va.run([], current_ticket)
+    va.display_attachments(console, issue)
     console.print()
 
-    # Run vct
+    # Child tasks
     console.print("[bold magenta]Child Tasks:[/bold magenta]")
-    ticket_ids.extend(vct.run([], current_ticket))
+    try:
+        ticket_ids.extend(vct.display_child_tasks(console, current_ticket, children_future.result()))
+    except JIRAError as e:
+        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+    except Exception as e:
+        # A dropped connection or timeout in the prefetch only loses this section
+        console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
     console.print()
 
-    # Run vic
+    # Comments
     console.print("[bold magenta]Comments:[/bold magenta]")
-    vic.run([current_ticket])
+    vic.render_comments(console, issue)
 
     return list(set(ticket_ids))  # Remove duplicates
 
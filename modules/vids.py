@@ -2,22 +2,69 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from common.jira_client import get_jira_client
+from common.field_cache import field_cache
 from jira.exceptions import JIRAError
 
+STANDARD_FIELDS = ['summary', 'description', 'issuetype', 'status', 'priority', 'assignee', 'reporter', 'created', 'updated']
+
+def parse_args(args):
+    issue_key = None
+    field_names = None
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith('--fields='):
+            field_names = arg[len('--fields='):]
+        elif arg == '--fields' and i + 1 < len(args):
+            field_names = args[i + 1]
+            i += 1
+        elif issue_key is None:
+            issue_key = arg.strip().upper()
+        i += 1
+    if field_names is not None:
+        field_names = [name.strip() for name in field_names.split(',') if name.strip()]
+    return issue_key, field_names
+
+def format_value(value):
+    if isinstance(value, dict):
+        for attribute in ('name', 'displayName', 'value', 'key'):
+            if attribute in value:
+                return value[attribute]
+    elif isinstance(value, list):
+        return ', '.join(str(format_value(v)) for v in value)
+    return value
+
 def run(args, current_ticket=None):
     console = Console()
 
-    if args:
-        issue_key = args[0].strip().upper()
-    elif current_ticket:
+    issue_key, field_names = parse_args(args)
+    if not issue_key:
         issue_key = current_ticket
-    else:
+    if not issue_key:
         console.print("[bold red]Error:[/bold red] No ticket specified and no current ticket set.")
         return
 
     try:
         jira = get_jira_client()
-        issue = jira.issue(issue_key)
+
+        # Resolve requested field names to ids from the cached schema
+        field_ids = None
+        if field_names:
+            field_ids = []
+            for name in field_names:
+                field_id = field_cache.id_for(name)
+                if field_id:
+                    field_ids.append(field_id)
+                else:
+                    console.print(f"[yellow]Unknown field '{name}', skipping.[/yellow]")
+            if not field_ids:
+                console.print("[bold red]Error:[/bold red] None of the requested fields exist.")
+                return
+
+        if field_ids:
+            issue = jira.issue(issue_key, fields=','.join(field_ids))
+        else:
+            issue = jira.issue(issue_key)
 
         # Get all fields for the issue
         fields = issue.raw['fields']
@@ -25,26 +72,25 @@ def run(args, current_ticket=None):
         # Create a Text object to store all field information
         issue_details = Text()
 
-        # Add standard fields that are always visible
-        standard_fields = ['summary', 'description', 'issuetype', 'status', 'priority', 'assignee', 'reporter', 'created', 'updated']
-        for field in standard_fields:
-            if field in fields:
-                value = fields[field]
-                if isinstance(value, dict) and 'name' in value:
-                    value = value['name']
-                elif isinstance(value, dict) and 'displayName' in value:
-                    value = value['displayName']
-                issue_details.append(f"{field.capitalize()}: {value}\n", style="bold")
-
-        # Add custom fields that have a value (assuming they're visible)
-        for field_id, value in fields.items():
-            if field_id.startswith('customfield_') and value:
-                field_name = jira.field(field_id)['name']
-                if isinstance(value, dict) and 'value' in value:
-                    value = value['value']
-                elif isinstance(value, list):
-                    value = ', '.join([str(v) for v in value])
-                issue_details.append(f"{field_name}: {value}\n", style="cyan")
+        if field_ids:
+            # Render only the projected fields, in the order they were asked for
+            for field_id in field_ids:
+                value = format_value(fields.get(field_id))
+                if field_id.startswith('customfield_'):
+                    issue_details.append(f"{field_cache.name_for(field_id)}: {value}\n", style="cyan")
+                else:
+                    issue_details.append(f"{field_id.capitalize()}: {value}\n", style="bold")
+        else:
+            # Add standard fields that are always visible
+            for field in STANDARD_FIELDS:
+                if field in fields:
+                    issue_details.append(f"{field.capitalize()}: {format_value(fields[field])}\n", style="bold")
+
+            # Add custom fields that have a value (assuming they're visible)
+            for field_id, value in fields.items():
+                if field_id.startswith('customfield_') and value:
+                    field_name = field_cache.name_for(field_id)
+                    issue_details.append(f"{field_name}: {format_value(value)}\n", style="cyan")
 
         console.print(Panel(issue_details, title=f"Issue Details: {issue_key}", border_style="green", expand=False))
 
@@ -53,4 +99,4 @@ def run(args, current_ticket=None):
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
 
-HELP_TEXT = "View detailed information for a Jira issue, including visible fields"
+HELP_TEXT = "View detailed information for a Jira issue, including visible fields (Usage: vids [TICKET-ID] [--fields FIELD,FIELD...])"
@@ -1,6 +1,6 @@
 from rich.console import Console
-from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
+from common.issue_context import issue_context
 from common.table import create_jira_table, add_row_to_table, print_table
 
 def run(args, current_ticket=None):
@@ -11,43 +11,8 @@ def run(args, current_ticket=None):
         return []
 
     try:
-        jira = get_jira_client()
-        issue = jira.issue(current_ticket)
-
-        links = issue.fields.issuelinks
-        if not links:
-            console.print(f"[yellow]No linked issues found for {current_ticket}[/yellow]")
-            return []
-
-        table = create_jira_table(f"Linked Issues for {current_ticket}", ["Link Type", "Issue Key", "Summary", "Status"])
-        color_map = {}
-        ticket_ids = []
-
-        for link in links:
-            if hasattr(link, "outwardIssue"):
-                linked_issue = link.outwardIssue
-                link_type = link.type.outward
-            elif hasattr(link, "inwardIssue"):
-                linked_issue = link.inwardIssue
-                link_type = link.type.inward
-            else:
-                continue
-
-            issue_obj = type('obj', (object,), {
-                'key': linked_issue.key,
-                'fields': type('obj', (object,), {
-                    'linktype': link_type,
-                    'key': linked_issue.key,
-                    'summary': linked_issue.fields.summary,
-                    'status': linked_issue.fields.status.name
-                })
-            })
-
-            add_row_to_table(table, issue_obj, ['linktype', 'key', 'summary', 'status'], color_map)
-            ticket_ids.append(linked_issue.key)
-
-        print_table(console, table)
-        return ticket_ids
+        issue = issue_context.get_or_fetch(current_ticket)
+        return display_linked_issues(console, issue)
 
     except JIRAError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -55,5 +20,41 @@ def run(args, current_ticket=None):
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {str(e)}")
     return []
 
+def display_linked_issues(console, issue):
+    links = issue.fields.issuelinks
+    if not links:
+        console.print(f"[yellow]No linked issues found for {issue.key}[/yellow]")
+        return []
+
+    table = create_jira_table(f"Linked Issues for {issue.key}", ["Link Type", "Issue Key", "Summary", "Status"])
+    color_map = {}
+    ticket_ids = []
+
+    for link in links:
+        if hasattr(link, "outwardIssue"):
+            linked_issue = link.outwardIssue
+            link_type = link.type.outward
+        elif hasattr(link, "inwardIssue"):
+            linked_issue = link.inwardIssue
+            link_type = link.type.inward
+        else:
+            continue
+
+        issue_obj = type('obj', (object,), {
+            'key': linked_issue.key,
+            'fields': type('obj', (object,), {
+                'linktype': link_type,
+                'key': linked_issue.key,
+                'summary': linked_issue.fields.summary,
+                'status': linked_issue.fields.status.name
+            })
+        })
+
+        add_row_to_table(table, issue_obj, ['linktype', 'key', 'summary', 'status'], color_map)
+        ticket_ids.append(linked_issue.key)
+
+    print_table(console, table)
+    return ticket_ids
+
 HELP_TEXT = "View linked issues for the current ticket"
 ALIASES = ["links"]
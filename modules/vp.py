@@ -1,7 +1,7 @@
 from rich.console import Console
-from common.jira_client import get_jira_client
 from jira.exceptions import JIRAError
 from modules import vid
+from common.issue_context import issue_context
 from common.utils import clear_screen  # Add this line if vp.py uses clear_screen
 
 def run(args, current_ticket=None):
@@ -12,8 +12,7 @@ def run(args, current_ticket=None):
         return None
 
     try:
-        jira = get_jira_client()
-        issue = jira.issue(current_ticket)
+        issue = issue_context.get_or_fetch(current_ticket)
 
         # Check if the issue has a parent
         if hasattr(issue.fields, 'parent'):
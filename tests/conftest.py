@@ -0,0 +1,8 @@
+import os
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+# Module-level caches are created on import; keep them from opening the real SQLite cache
+os.environ['CACHE_BACKEND'] = 'json'
@@ -0,0 +1,23 @@
+from common.bulk import split_jql_arg, split_target_args
+from modules.link import parse_link_args, DEFAULT_LINK_TYPE
+
+def test_split_jql_arg_takes_the_rest_of_the_line():
+    assert split_jql_arg(['Done', '--jql', 'project', '=', 'X', 'AND', 'status', '=', 'Open']) == \
+        (['Done'], 'project = X AND status = Open')
+
+def test_split_jql_arg_without_a_query():
+    assert split_jql_arg(['ABC-1', 'ABC-2']) == (['ABC-1', 'ABC-2'], None)
+    assert split_jql_arg(['--jql']) == ([], None)
+
+def test_split_target_args_reads_last_and_jql():
+    assert split_target_args(['In', 'Progress', '--last']) == (['In', 'Progress'], None, True)
+    assert split_target_args(['bob', '--jql', 'assignee', 'is', 'EMPTY']) == (['bob'], 'assignee is EMPTY', False)
+
+def test_parse_link_args_keys_type_and_jql():
+    assert parse_link_args(['abc-1', 'abc-2']) == (['ABC-1', 'ABC-2'], None, DEFAULT_LINK_TYPE)
+    assert parse_link_args(['--type', 'Blocks', 'abc-1']) == (['ABC-1'], None, 'Blocks')
+    assert parse_link_args(['--type', 'Blocks', '--jql', 'project', '=', 'ABC']) == ([], 'project = ABC', 'Blocks')
+
+def test_parse_link_args_without_a_default_type():
+    assert parse_link_args(['abc-1'], default_type=None) == (['ABC-1'], None, None)
+    assert parse_link_args(['abc-1', '--type', 'Blocks'], default_type=None) == (['ABC-1'], None, 'Blocks')
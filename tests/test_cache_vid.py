@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+import pytest
+from requests.exceptions import ConnectionError
+from common import cache_vid as cache_vid_module
+from common.cache_vid import VidCache
+from common.storage import JSONBackend
+
+def issue_dict(key, cached_time):
+    return {'key': key, 'cached_time': cached_time.isoformat(),
+            'fields': {'summary': 'Cached summary', 'updated': None}}
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = VidCache()
+    cache.store = JSONBackend(str(tmp_path / 'vid_cache.json'))
+    cache.sync_state = JSONBackend(str(tmp_path / 'sync_state.json'))
+    return cache
+
+@pytest.mark.parametrize('error', [ConnectionError("offline"), ValueError("Jira configuration is missing.")])
+def test_stale_issue_is_served_when_jira_cannot_be_reached(cache, monkeypatch, error):
+    def unreachable():
+        raise error
+    monkeypatch.setattr(cache_vid_module, 'get_jira_client', unreachable)
+    cache.store.put('ABC-1', issue_dict('ABC-1', datetime.now() - timedelta(days=1)))
+
+    issue = cache.get_issue('ABC-1')
+    assert issue['fields']['summary'] == 'Cached summary'
+    assert issue['stale'] is True
+    assert 'stale' not in cache.store.get('ABC-1')
+
+def test_fresh_issue_is_served_without_a_client(cache, monkeypatch):
+    def unexpected():
+        raise AssertionError("fresh issues must not need a client")
+    monkeypatch.setattr(cache_vid_module, 'get_jira_client', unexpected)
+    cache.store.put('ABC-2', issue_dict('ABC-2', datetime.now()))
+    assert 'stale' not in cache.get_issue('ABC-2')
+
+def test_uncached_issue_still_raises_when_offline(cache, monkeypatch):
+    def unreachable():
+        raise ConnectionError("offline")
+    monkeypatch.setattr(cache_vid_module, 'get_jira_client', unreachable)
+    with pytest.raises(ConnectionError):
+        cache.get_issue('ABC-3')
@@ -0,0 +1,18 @@
+from common.completion import PrefixTrie
+
+def test_complete_is_case_insensitive_and_keeps_original_case():
+    trie = PrefixTrie(['ABC-1', 'ABC-12', 'abd-3', 'XYZ-9'])
+    assert trie.complete('abc') == ['ABC-1', 'ABC-12']
+    assert trie.complete('AB') == ['ABC-1', 'ABC-12', 'abd-3']
+
+def test_complete_returns_matches_alphabetically_up_to_the_limit():
+    trie = PrefixTrie(['filter', 'find', 'fields', 'full'])
+    assert trie.complete('f') == ['fields', 'filter', 'find', 'full']
+    assert trie.complete('fi', limit=2) == ['fields', 'filter']
+
+def test_unknown_prefix_and_duplicates():
+    trie = PrefixTrie(['vid', 'vid', 'vft'])
+    assert len(trie) == 2
+    assert trie.complete('x') == []
+    trie.insert('vli')
+    assert trie.complete('v') == ['vft', 'vid', 'vli']
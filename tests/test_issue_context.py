@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import Future
+from common import issue_context as issue_context_module
+from common.issue_context import IssueContextCache
+
+class FinishedExecutor:
+    """Runs submitted work at once, so prefetch sees a future that is already done."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+def run_with_timeout(target, seconds=5):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return not thread.is_alive()
+
+def test_prefetch_of_a_fetch_that_already_failed_does_not_deadlock(monkeypatch):
+    def offline():
+        raise ValueError("Jira configuration is missing.")
+    monkeypatch.setattr(issue_context_module, 'get_jira_client', offline)
+    cache = IssueContextCache()
+    cache._executor = FinishedExecutor()
+
+    results = []
+    assert run_with_timeout(lambda: results.append(cache.prefetch('ABC-1', on_loaded=results.append)))
+    assert results[0].done()
+    assert 'ABC-1' not in cache.pending
+
+def test_prefetch_of_a_fetch_that_already_succeeded_calls_on_loaded(monkeypatch):
+    cache = IssueContextCache()
+    cache._executor = FinishedExecutor()
+    monkeypatch.setattr(cache, 'fetch', lambda issue_key: f'issue {issue_key}')
+
+    loaded = []
+    assert run_with_timeout(lambda: cache.prefetch('ABC-2', on_loaded=loaded.append))
+    assert loaded == ['issue ABC-2']
+    assert 'ABC-2' not in cache.pending
@@ -0,0 +1,67 @@
+import pytest
+from requests.exceptions import ConnectionError
+from common import jira_client as jira_client_module
+
+@pytest.fixture
+def offline(monkeypatch):
+    probes = []
+
+    def head(url, timeout=None, allow_redirects=True):
+        probes.append(timeout)
+        raise ConnectionError("offline")
+
+    def create_client(*args):
+        raise AssertionError("the retrying client must not be created while Jira is unreachable")
+    monkeypatch.setattr(jira_client_module.requests, 'head', head)
+    monkeypatch.setattr(jira_client_module, '_create_client', create_client)
+    monkeypatch.setattr(jira_client_module, 'JIRA_SERVER', 'https://jira.example.com')
+    monkeypatch.setattr(jira_client_module, 'JIRA_EMAIL', 'someone@example.com')
+    monkeypatch.setattr(jira_client_module, 'JIRA_API_TOKEN', 'token')
+    monkeypatch.setattr(jira_client_module, '_clients', {})
+    monkeypatch.setattr(jira_client_module, '_failures', {})
+    monkeypatch.setattr(jira_client_module, '_last_reachable', 0.0)
+    return probes
+
+def test_unreachable_jira_fails_after_one_short_probe(offline):
+    with pytest.raises(ConnectionError):
+        jira_client_module.get_jira_client()
+    assert offline == [jira_client_module.JIRA_PROBE_TIMEOUT]
+
+def test_failed_probe_is_remembered(offline):
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            jira_client_module.get_jira_client()
+    assert len(offline) == 1
+    assert jira_client_module.warm_up_jira_client() is False
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def delete(self, url, **kwargs):
+        self.calls.append(('DELETE', url, kwargs))
+
+    def put(self, url, **kwargs):
+        self.calls.append(('PUT', url, kwargs))
+
+class FakeJira:
+    def __init__(self):
+        self._session = RecordingSession()
+
+    def _get_url(self, path):
+        return f'https://jira.example.com/rest/api/2/{path}'
+
+def test_delete_issue_sends_one_request_and_keeps_subtasks_by_default():
+    jira = FakeJira()
+    jira_client_module.delete_issue(jira, 'ABC-1')
+    assert jira._session.calls == [
+        ('DELETE', 'https://jira.example.com/rest/api/2/issue/ABC-1', {'params': {'deleteSubtasks': 'false'}})
+    ]
+
+def test_set_assignee_puts_the_given_identifier():
+    jira = FakeJira()
+    jira_client_module.set_assignee(jira, 'ABC-1', 'accountId', '5b10a2844c20165700ede21g')
+    assert jira._session.calls == [
+        ('PUT', 'https://jira.example.com/rest/api/2/issue/ABC-1/assignee',
+         {'data': '{"accountId": "5b10a2844c20165700ede21g"}'})
+    ]
@@ -0,0 +1,78 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+import pytest
+from common.local_jql import compile_jql, parse_date, LocalJQLError
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+ISSUES = [
+    ('ABC-1', '2024-05-01T13:30:00.000+0200', 'Unassigned', 'Open', 'Login page crashes'),
+    ('ABC-2', '2024-05-01T10:50:00.000+0000', 'Bob Smith', 'In Progress', 'Export to CSV'),
+    ('XYZ-3', '2024-05-01T06:30:00.000-0500', 'alice', 'Done', 'Crash on export'),
+]
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE issues (key TEXT PRIMARY KEY, project TEXT, updated TEXT, data TEXT NOT NULL)')
+    for key, updated, assignee, status, summary in ISSUES:
+        fields = {'updated': updated, 'created': updated, 'assignee': assignee, 'status': status,
+                  'summary': summary, 'description': None, 'issuetype': 'Task', 'reporter': 'Unknown'}
+        conn.execute('INSERT INTO issues VALUES (?, ?, ?, ?)',
+                     (key, key.split('-')[0], updated, json.dumps({'key': key, 'fields': fields})))
+    return conn
+
+def run(conn, jql_query):
+    where, order_by, params = compile_jql(jql_query, now=NOW)
+    return [row[0] for row in conn.execute(f'SELECT key FROM issues WHERE {where} ORDER BY {order_by}', params)]
+
+def test_equality_is_case_insensitive_for_user_and_status_fields(conn):
+    assert run(conn, 'status = "in progress"') == ['ABC-2']
+    assert run(conn, 'assignee = ALICE') == ['XYZ-3']
+
+def test_empty_and_null_match_the_unassigned_placeholder(conn):
+    assert run(conn, 'assignee is EMPTY') == ['ABC-1']
+    assert run(conn, 'assignee = EMPTY') == ['ABC-1']
+    assert run(conn, 'assignee = null') == ['ABC-1']
+    assert run(conn, 'assignee != EMPTY ORDER BY key') == ['ABC-2', 'XYZ-3']
+    assert run(conn, 'assignee in (EMPTY, alice) ORDER BY key') == ['ABC-1', 'XYZ-3']
+
+def test_quoted_empty_is_an_ordinary_string(conn):
+    assert run(conn, 'assignee = "EMPTY"') == []
+
+def test_project_and_key_comparisons_are_upper_cased(conn):
+    assert run(conn, 'project = abc ORDER BY key') == ['ABC-1', 'ABC-2']
+    assert run(conn, 'key in (abc-2, xyz-3) ORDER BY key') == ['ABC-2', 'XYZ-3']
+
+def test_boolean_operators_and_parentheses(conn):
+    assert run(conn, 'project = ABC and (status = Open or assignee = alice)') == ['ABC-1']
+    assert run(conn, 'not project = ABC') == ['XYZ-3']
+
+def test_text_search_requires_every_word(conn):
+    assert run(conn, 'summary ~ "crash" ORDER BY key') == ['ABC-1', 'XYZ-3']
+    assert run(conn, 'text ~ "crash export"') == ['XYZ-3']
+
+def test_dates_are_compared_in_utc(conn):
+    # Every stored time is 11:30 or 10:50 UTC whatever its offset
+    assert run(conn, 'updated >= -30m ORDER BY key') == ['ABC-1', 'XYZ-3']
+    assert run(conn, 'updated >= -1h ORDER BY key') == ['ABC-1', 'XYZ-3']
+    assert run(conn, 'updated < -1h') == ['ABC-2']
+
+def test_parse_date_returns_utc_minutes():
+    assert parse_date('-90m', NOW) == '2024-05-01T10:30'
+    assert parse_date('+1d', NOW) == '2024-05-02T12:00'
+
+@pytest.mark.parametrize('jql_query', [
+    'assignee = currentUser()',
+    'sprint = 5',
+    'status ~ open',
+    'project = ABC and',
+])
+def test_unsupported_queries_raise(jql_query):
+    with pytest.raises(LocalJQLError):
+        compile_jql(jql_query, now=NOW)
+
+def test_order_by_defaults_to_recently_updated():
+    _, order_by, _ = compile_jql('project = ABC', now=NOW)
+    assert order_by == 'updated DESC'
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+import pytest
+from common import result_cache as result_cache_module
+from common.records import IssueRecord
+from common.result_cache import ResultCache, normalize_jql, diff_records
+from common.storage import JSONBackend
+
+FIELDS = ['key', 'summary', 'status']
+
+class FakeClock:
+    """Stands in for datetime in common.result_cache; every now() is one second later."""
+
+    def __init__(self):
+        self.current = datetime(2024, 5, 1, 12, 0)
+
+    def now(self):
+        self.current += timedelta(seconds=1)
+        return self.current
+
+    def advance(self, seconds):
+        self.current += timedelta(seconds=seconds)
+
+    fromisoformat = staticmethod(datetime.fromisoformat)
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(result_cache_module, 'datetime', clock)
+    return clock
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path, clock):
+    monkeypatch.setattr(result_cache_module, 'open_backend',
+                        lambda table, json_file, indexer=None: JSONBackend(str(tmp_path / f'{table}.json'), indexer))
+    return ResultCache()
+
+def record(key, summary='Summary', status='Open'):
+    return IssueRecord(key, None, {'summary': summary, 'status': status})
+
+def test_normalize_jql_ignores_case_and_spacing_outside_quotes():
+    assert normalize_jql('Project = ABC  AND  summary ~ "Two  Words"') == 'project = abc and summary ~ "Two  Words"'
+    assert normalize_jql('status = "Done"') != normalize_jql('status = "done"')
+
+def test_put_then_get_round_trips_records(cache):
+    cache.put('project = ABC', FIELDS, None, [record('ABC-1'), record('ABC-2')])
+    entry = cache.get('PROJECT = abc', FIELDS)
+    assert [r.key for r in cache.records(entry)] == ['ABC-1', 'ABC-2']
+    assert cache.get('project = ABC', ['key']) is None
+
+def test_entries_go_stale_after_their_ttl(cache, clock):
+    cache.put('project = ABC', FIELDS, None, [record('ABC-1')])
+    entry = cache.get('project = ABC', FIELDS)
+    assert cache.is_fresh(entry, ttl=60)
+    clock.advance(120)
+    assert not cache.is_fresh(entry, ttl=60)
+    assert cache.is_fresh(entry, ttl=600)
+
+def test_eviction_drops_the_least_recently_used(cache, monkeypatch):
+    monkeypatch.setattr(result_cache_module, 'QUERY_CACHE_MAX_ENTRIES', 2)
+    cache.put('project = A', FIELDS, None, [record('A-1')])
+    cache.put('project = B', FIELDS, None, [record('B-1')])
+    # Reading A makes B the oldest
+    cache.get('project = A', FIELDS)
+    cache.put('project = C', FIELDS, None, [record('C-1')])
+    assert len(cache) == 2
+    assert cache.get('project = B', FIELDS) is None
+    assert cache.get('project = A', FIELDS) is not None
+    assert cache.get('project = C', FIELDS) is not None
+
+def test_revalidation_stores_fresh_rows_and_reports_changes(cache, monkeypatch):
+    cache.put('project = ABC', FIELDS, None, [record('ABC-1'), record('ABC-2')])
+    monkeypatch.setattr(cache, 'fetch', lambda jql_query, fields, max_results=None: [
+        record('ABC-1', status='Done'), record('ABC-3')
+    ])
+    changes = []
+    key = cache.cache_key('project = ABC', FIELDS)
+    cache._revalidate(key, 'project = ABC', FIELDS, None, lambda *diff: changes.append(diff))
+
+    added, changed, removed = changes[0]
+    assert [r.key for r in added] == ['ABC-3']
+    assert [r.key for r in changed] == ['ABC-1']
+    assert [r.key for r in removed] == ['ABC-2']
+    assert [r.key for r in cache.records(cache.get('project = ABC', FIELDS))] == ['ABC-1', 'ABC-3']
+
+def test_failed_revalidation_keeps_the_cached_rows(cache, monkeypatch):
+    cache.put('project = ABC', FIELDS, None, [record('ABC-1')])
+
+    def offline(*args, **kwargs):
+        raise ConnectionError("offline")
+    monkeypatch.setattr(cache, 'fetch', offline)
+    key = cache.cache_key('project = ABC', FIELDS)
+    cache._revalidate(key, 'project = ABC', FIELDS, None, None)
+    assert [r.key for r in cache.records(cache.get('project = ABC', FIELDS))] == ['ABC-1']
+    assert key not in cache._refreshing
+
+def test_diff_records_without_changes():
+    rows = [record('ABC-1'), record('ABC-2')]
+    assert diff_records(rows, [record('ABC-1'), record('ABC-2')]) == ([], [], [])
@@ -0,0 +1,46 @@
+import pytest
+from common import search_index as search_index_module
+from common.search_index import SearchIndex
+from common.storage import JSONBackend
+
+class FakeCache:
+    def __init__(self, store):
+        self.store = store
+        self.listeners = []
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    cache = FakeCache(JSONBackend(str(tmp_path / 'vid_cache.json')))
+    monkeypatch.setattr(search_index_module, 'vid_cache', cache)
+    return cache
+
+def issue(key, summary):
+    return {'key': key, 'fields': {'summary': summary, 'description': None, 'updated': '2024-05-01'}}
+
+def test_json_backend_keeps_the_index_in_memory(cache, monkeypatch):
+    def no_database():
+        raise AssertionError("the JSON backend must not open the SQLite cache")
+    monkeypatch.setattr(search_index_module, 'get_connection', no_database)
+    index = SearchIndex()
+    cache.store.put('ABC-1', issue('ABC-1', 'Login page crashes'))
+    index.ensure_built()
+    assert len(index) == 1
+    assert index._prefix_hits('crash') == [('ABC-1', 's')]
+
+def test_register_adds_one_listener_per_cache(cache):
+    index = SearchIndex()
+    index.register(cache)
+    index.register(cache)
+    index.ensure_built()
+    assert cache.listeners == [index.index_keys]
+
+def test_registered_index_follows_cache_writes(cache):
+    index = SearchIndex()
+    index.register(cache)
+    cache.store.put('ABC-2', issue('ABC-2', 'Export to CSV'))
+    for callback in cache.listeners:
+        callback(['ABC-2'])
+    assert index._prefix_hits('csv') == [('ABC-2', 's')]
@@ -0,0 +1,79 @@
+import pytest
+from common import search
+from common.search import iter_search_pages, stream_search_pages
+
+class FakeJira:
+    """Serves `total` issues, returning at most `cap` per request as a real server may."""
+
+    def __init__(self, total, cap=None, report_total=True, cloud=False):
+        self.total = total
+        self.cap = cap
+        self.report_total = report_total
+        self._is_cloud = cloud
+        self.offset_calls = []
+        self.token_calls = []
+
+    def _issues(self, start, size):
+        size = min(size, self.cap) if self.cap else size
+        return [{'key': f'T-{i}', 'fields': {}} for i in range(start, min(start + size, self.total))]
+
+    def search_issues(self, jql_query, startAt=0, maxResults=50, fields=None, json_result=False, validate_query=True):
+        self.offset_calls.append(startAt)
+        return {'issues': self._issues(startAt, maxResults), 'total': self.total if self.report_total else None}
+
+    def enhanced_search_issues(self, jql_query, nextPageToken=None, maxResults=50, fields=None, json_result=False):
+        self.token_calls.append(nextPageToken)
+        start = int(nextPageToken or 0)
+        issues = self._issues(start, maxResults)
+        end = start + len(issues)
+        return {'issues': issues, 'nextPageToken': str(end) if end < self.total else None}
+
+@pytest.fixture(autouse=True)
+def auto_pagination(monkeypatch):
+    monkeypatch.setattr(search, 'SEARCH_PAGINATION', 'auto')
+
+def keys(pages):
+    return [issue.key for page in pages for issue in page]
+
+def expected(count):
+    return [f'T-{i}' for i in range(count)]
+
+def test_iter_keeps_paging_past_pages_shortened_by_a_server_cap():
+    jira = FakeJira(230, cap=50)
+    assert keys(iter_search_pages('project = T', page_size=100, jira=jira, records=True)) == expected(230)
+
+def test_iter_without_total_stops_only_on_an_empty_page():
+    jira = FakeJira(130, report_total=False)
+    assert keys(iter_search_pages('project = T', page_size=50, jira=jira, records=True)) == expected(130)
+    assert jira.offset_calls == [0, 50, 100, 130]
+
+def test_iter_follows_next_page_tokens_on_cloud():
+    jira = FakeJira(250, cloud=True)
+    assert keys(iter_search_pages('project = T', page_size=100, jira=jira, records=True)) == expected(250)
+    assert jira.offset_calls == []
+    assert jira.token_calls == [None, '100', '200']
+
+def test_stream_steps_by_the_page_size_the_server_returned():
+    jira = FakeJira(230, cap=50)
+    pages = stream_search_pages('project = T', page_size=100, workers=3, jira=jira, records=True)
+    assert keys(pages) == expected(230)
+
+def test_stream_without_total_keeps_walking():
+    jira = FakeJira(250, report_total=False)
+    assert keys(stream_search_pages('project = T', page_size=100, jira=jira, records=True)) == expected(250)
+
+def test_stream_honours_max_results():
+    jira = FakeJira(500, cap=50)
+    assert keys(stream_search_pages('project = T', max_results=120, page_size=100, jira=jira,
+                                    records=True)) == expected(120)
+
+def test_stream_uses_token_paging_on_cloud():
+    jira = FakeJira(250, cloud=True)
+    assert keys(stream_search_pages('project = T', page_size=100, jira=jira, records=True)) == expected(250)
+    assert jira.offset_calls == []
+
+def test_forced_offset_paging_on_cloud(monkeypatch):
+    monkeypatch.setattr(search, 'SEARCH_PAGINATION', 'offset')
+    jira = FakeJira(150, cloud=True)
+    assert keys(stream_search_pages('project = T', page_size=100, jira=jira, records=True)) == expected(150)
+    assert jira.token_calls == []
@@ -0,0 +1,39 @@
+from common.status_catalog import StatusCatalog
+
+STATUSES = [{'id': '1', 'name': 'Open', 'category': 'To Do'}, {'id': '3', 'name': 'Done', 'category': 'Done'}]
+
+class FakeCache:
+    def __init__(self, value, error=None):
+        self.value = value
+        self.error = error
+        self.refreshes = 0
+
+    def get(self):
+        if self.value is None:
+            raise self.error
+        return self.value
+
+    def peek(self):
+        return self.value
+
+    def refresh(self):
+        self.refreshes += 1
+        raise self.error
+
+def catalog(cache):
+    catalog = StatusCatalog()
+    catalog.cache = cache
+    return catalog
+
+def test_unknown_status_falls_back_when_the_reload_fails():
+    cache = FakeCache(STATUSES, ConnectionError("offline"))
+    statuses = catalog(cache)
+    assert statuses.category_for('Open') == 'To Do'
+    assert statuses.category_for('In Review') == 'Unknown'
+    assert statuses.category_for('in review') == 'Unknown'
+    assert cache.refreshes == 1
+
+def test_missing_catalog_while_offline_is_unknown():
+    statuses = catalog(FakeCache(None, ConnectionError("offline")))
+    assert statuses.category_for('Open') == 'Unknown'
+    assert statuses.color_for('Open') is None
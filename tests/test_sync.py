@@ -0,0 +1,11 @@
+from datetime import datetime
+from common.sync import build_sync_jql
+
+NOW = datetime(2024, 5, 1, 12, 0)
+
+def test_full_sync_walks_the_project_in_key_order():
+    assert build_sync_jql('ABC', None, NOW) == 'project = "ABC" ORDER BY key ASC'
+
+def test_delta_sync_overlaps_the_last_mark_and_keeps_key_order():
+    state = {'last_sync': '2024-05-01T11:30:00'}
+    assert build_sync_jql('ABC', state, NOW) == 'project = "ABC" AND updated >= "-32m" ORDER BY key ASC'